@@ -0,0 +1,231 @@
+"""
+Performans ölçümleri.
+
+Kullanım:
+    python benchmarks.py ch --sizes 10000,100000 --queries 100
+    python benchmarks.py ch --large          # 1.000.000 düğümlü ölçümü de ekler
+    python benchmarks.py fleet --drones 1,10,100,1000 --tasks 2000
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from graph import Graph
+
+LARGE_GRAPH_SIZE = 1000000  # Yalnızca `--large` ile ölçülen graf boyu
+
+def _grid_graph(num_nodes: int, rng: random.Random) -> Graph:
+    """Rastgele maliyetli kare ızgara (yol ağına benzer) grafı oluşturur"""
+    side = max(1, int(num_nodes ** 0.5))
+    graph = Graph(side * side)
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if col + 1 < side:
+                graph.add_edge(node, node + 1, rng.uniform(1.0, 10.0))
+            if row + 1 < side:
+                graph.add_edge(node, node + side, rng.uniform(1.0, 10.0))
+    return graph
+
+def bench_contraction(sizes: List[int], queries: int, seed: int):
+    """Kısaltma hiyerarşisi sorgularını `Graph.dijkstra` ile karşılaştırır"""
+    from contraction import ContractionHierarchy
+    
+    print(f"{'düğüm':>10} {'ön işleme (s)':>14} {'dijkstra (ms)':>14} {'CH (ms)':>10} {'hızlanma':>9}")
+    for size in sizes:
+        rng = random.Random(seed)
+        graph = _grid_graph(size, rng)
+        pairs = [(rng.randrange(graph.num_nodes), rng.randrange(graph.num_nodes)) for _ in range(queries)]
+        
+        begin = time.perf_counter()
+        hierarchy = ContractionHierarchy.build(graph)
+        build_time = time.perf_counter() - begin
+        
+        begin = time.perf_counter()
+        for start, end in pairs:
+            graph.dijkstra(start, end)
+        dijkstra_ms = (time.perf_counter() - begin) * 1000 / queries
+        
+        begin = time.perf_counter()
+        for start, end in pairs:
+            hierarchy.query(start, end)
+        ch_ms = (time.perf_counter() - begin) * 1000 / queries
+        
+        print(f"{graph.num_nodes:>10} {build_time:>14.1f} {dijkstra_ms:>14.2f} {ch_ms:>10.3f} {dijkstra_ms / ch_ms:>8.1f}x")
+
+def bench_generators(sizes: List[int], degree: float, seed: int):
+    """Büyük rastgele harita üretim sürelerini ölçer"""
+    import math
+    from generators import damaged_grid_graph, erdos_renyi_graph, random_geometric_graph
+    
+    print(f"{'düğüm':>10} {'topoloji':>14} {'süre (s)':>9} {'kenar':>10}")
+    for size in sizes:
+        side = int(size ** 0.5)
+        builders = (
+            ('erdos-renyi', lambda: erdos_renyi_graph(size, degree / size, seed)),
+            ('geometrik', lambda: random_geometric_graph(size, math.sqrt(degree / (math.pi * size)), seed)),
+            ('hasarlı ızgara', lambda: damaged_grid_graph(side, side, 0.1, seed)),
+        )
+        for name, build in builders:
+            begin = time.perf_counter()
+            graph = build()
+            elapsed = time.perf_counter() - begin
+            print(f"{graph.num_nodes:>10} {name:>14} {elapsed:>9.2f} {len(graph.targets) // 2:>10}")
+
+def bench_hamming(sizes: List[int], seconds: float, seed: int):
+    """Hamming kodlayıcısının metin, bayt ve toplu arayüzlerinin çerçeve hızını ölçer"""
+    import numpy as np
+    from hamming import HammingCode
+    
+    def frames_per_second(encode, decode, frame) -> float:
+        count = 0
+        begin = time.perf_counter()
+        while time.perf_counter() - begin < seconds:
+            decode(encode(frame))
+            count += 1
+        return count / (time.perf_counter() - begin)
+        
+    def batch_frames_per_second(frames) -> float:
+        count = 0
+        begin = time.perf_counter()
+        while time.perf_counter() - begin < seconds:
+            HammingCode.decode_many(HammingCode.encode_many(frames))
+            count += len(frames)
+        return count / (time.perf_counter() - begin)
+        
+    print(f"{'bayt':>8} {'metin (çerçeve/s)':>18} {'bayt (çerçeve/s)':>17} {'toplu (çerçeve/s)':>18}")
+    rng = random.Random(seed)
+    for size in sizes:
+        text = ''.join(chr(rng.randrange(32, 127)) for _ in range(size))
+        text_rate = frames_per_second(HammingCode.encode, HammingCode.decode, text)
+        bytes_rate = frames_per_second(HammingCode.encode_bytes, HammingCode.decode_bytes, text.encode('latin-1'))
+        frames = np.random.default_rng(seed).integers(32, 127, (max(1, (1 << 22) // size), size), dtype=np.uint8)
+        batch_rate = batch_frames_per_second(frames)
+        print(f"{size:>8} {text_rate:>18.0f} {bytes_rate:>17.0f} {batch_rate:>18.0f}")
+
+def bench_fleet(fleet_sizes: List[int], size: int, tasks: int, hours: float, seed: int):
+    """Filo büyüdükçe simülasyon saati başına tamamlanan görev sayısını ölçer"""
+    from fleet import FleetDispatcher
+    from generators import damaged_grid_graph
+    
+    side = int(size ** 0.5)
+    graph = damaged_grid_graph(side, side, 0.1, seed)
+    depot = (side // 2) * side + side // 2
+    print(f"{'dron':>6} {'tamamlanan':>11} {'bekleyen':>9} {'görev/saat':>11} {'atama':>7} {'süre (s)':>9}")
+    for fleet_size in fleet_sizes:
+        rng = random.Random(seed)
+        dispatcher = FleetDispatcher(graph, fleet_size, depot=depot, speed=side, service_time=0.1,
+                                     batch_interval=0.05)
+        for _ in range(tasks):
+            dispatcher.schedule_task(rng.uniform(0.0, hours), rng.randrange(graph.num_nodes),
+                                     rng.randint(1, 3), "Kurtarma görevi")
+        begin = time.perf_counter()
+        report = dispatcher.run(hours)
+        elapsed = time.perf_counter() - begin
+        print(f"{fleet_size:>6} {report.completed:>11} {report.pending:>9} {report.tasks_per_hour:>11.1f} "
+              f"{report.dispatches:>7} {elapsed:>9.2f}")
+
+def bench_day(nodes: int, hours: float, interval: float, seed: int):
+    """Sanal saatli olay çekirdeğinde uzun bir görev gününün duvar saati süresini ölçer"""
+    from main import RescueDroneSimulation
+    from tasks import TaskStatus
+    
+    sim = RescueDroneSimulation(num_nodes=nodes, seed=seed)
+    sim.hop_time = 60.0
+    sim.monte_carlo.generate_obstacles()
+    sim.monte_carlo.generate_delays()
+    rng = random.Random(seed)
+    at = rng.expovariate(1.0 / interval)
+    while at < hours * 3600:
+        sim.schedule_task(at, rng.randrange(1, nodes), rng.randint(1, 3), "Kurtarma görevi")
+        at += rng.expovariate(1.0 / interval)
+        
+    begin = time.perf_counter()
+    sim.simulate_rescue_mission(log=lambda message: None)
+    elapsed = time.perf_counter() - begin
+    print(f"{'sanal süre (saat)':>18} {'duvar saati (s)':>16} {'görev':>7} {'olay':>8}")
+    print(f"{sim.events.now / 3600:>18.1f} {elapsed:>16.2f} "
+          f"{sim.task_queue.get_task_stats()[TaskStatus.COMPLETED.value]:>7} {sim.events.processed:>8}")
+
+def bench_async(drone_counts: List[int], nodes: int, tasks_per_drone: int, seed: int):
+    """Tek süreçte eşzamanlı dron eşyordamlarının sanal saatli koşu süresini ve belleğini ölçer"""
+    import tracemalloc
+    from main import RescueDroneSimulation
+    from runner import run_missions
+    
+    print(f"{'dron':>7} {'görev':>7} {'geçiş':>8} {'sanal (s)':>10} {'duvar (s)':>10} {'bellek/dron (KB)':>17}")
+    for drones in drone_counts:
+        rng = random.Random(seed)
+        sim = RescueDroneSimulation(num_nodes=nodes, seed=seed)
+        sim.graph.tree_cache_size = nodes  # Her hedefin en kısa yol ağacı bir kez kurulsun
+        sim.monte_carlo.generate_obstacles()
+        sim.monte_carlo.generate_delays()
+        for _ in range(drones * tasks_per_drone):
+            sim.add_rescue_task(rng.randrange(1, nodes), rng.randint(1, 3), "Kurtarma görevi")
+            
+        tracemalloc.start()
+        stats = run_missions(sim, drones, select_route=False)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{drones:>7} {stats.completed:>7} {stats.hops:>8} {stats.virtual_seconds:>10.1f} "
+              f"{stats.wall_seconds:>10.2f} {peak / drones / 1024:>17.1f}")
+
+def _graph_sizes(args: argparse.Namespace) -> List[int]:
+    """`--sizes` listesini döndürür; `--large` verilmişse 1.000.000 düğüm eklenir"""
+    sizes = [int(size) for size in args.sizes.split(',')]
+    if args.large and LARGE_GRAPH_SIZE not in sizes:
+        sizes.append(LARGE_GRAPH_SIZE)
+    return sizes
+
+def main():
+    parser = argparse.ArgumentParser(description="Kurtarma dronu simülasyonu performans ölçümleri")
+    parser.add_argument('--seed', type=int, default=42)
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+    
+    ch_parser = subparsers.add_parser('ch', help="Kısaltma hiyerarşisi ve Dijkstra karşılaştırması")
+    ch_parser.add_argument('--sizes', default='10000,100000')
+    ch_parser.add_argument('--large', action='store_true', help="1.000.000 düğümlü ölçümü de ekle")
+    ch_parser.add_argument('--queries', type=int, default=100)
+    
+    gen_parser = subparsers.add_parser('gen', help="Rastgele harita üretim süreleri")
+    gen_parser.add_argument('--sizes', default='10000,100000')
+    gen_parser.add_argument('--large', action='store_true', help="1.000.000 düğümlü ölçümü de ekle")
+    gen_parser.add_argument('--degree', type=float, default=6.0, help="Ortalama düğüm derecesi")
+    
+    hamming_parser = subparsers.add_parser('hamming', help="Hamming kodlayıcısı çerçeve hızı")
+    hamming_parser.add_argument('--sizes', default='16,256,1024,4096', help="Çerçeve boyları (bayt)")
+    hamming_parser.add_argument('--seconds', type=float, default=1.0, help="Boy başına ölçüm süresi")
+    
+    fleet_parser = subparsers.add_parser('fleet', help="Filo büyüklüğüne göre görev/saat")
+    fleet_parser.add_argument('--drones', default='1,10,100,1000', help="Filo büyüklükleri")
+    fleet_parser.add_argument('--size', type=int, default=10000, help="Izgara düğüm sayısı")
+    fleet_parser.add_argument('--tasks', type=int, default=2000, help="Simülasyon boyunca gelen görev sayısı")
+    fleet_parser.add_argument('--hours', type=float, default=24.0, help="Simülasyon süresi (saat)")
+    
+    day_parser = subparsers.add_parser('day', help="Sanal saatle uzun görev senaryosu")
+    day_parser.add_argument('--nodes', type=int, default=60)
+    day_parser.add_argument('--hours', type=float, default=24.0, help="Senaryo süresi (saat)")
+    day_parser.add_argument('--interval', type=float, default=300.0, help="Ortalama görev aralığı (saniye)")
+    
+    async_parser = subparsers.add_parser('async', help="Eşzamanlı dron eşyordamları")
+    async_parser.add_argument('--drones', default='100,1000,10000', help="Dron sayıları")
+    async_parser.add_argument('--nodes', type=int, default=300)
+    async_parser.add_argument('--tasks', type=int, default=2, help="Dron başına görev sayısı")
+    
+    args = parser.parse_args()
+    if args.benchmark == 'ch':
+        bench_contraction(_graph_sizes(args), args.queries, args.seed)
+    elif args.benchmark == 'gen':
+        bench_generators(_graph_sizes(args), args.degree, args.seed)
+    elif args.benchmark == 'hamming':
+        bench_hamming([int(size) for size in args.sizes.split(',')], args.seconds, args.seed)
+    elif args.benchmark == 'fleet':
+        bench_fleet([int(size) for size in args.drones.split(',')], args.size, args.tasks, args.hours, args.seed)
+    elif args.benchmark == 'day':
+        bench_day(args.nodes, args.hours, args.interval, args.seed)
+    elif args.benchmark == 'async':
+        bench_async([int(count) for count in args.drones.split(',')], args.nodes, args.tasks, args.seed)
+
+if __name__ == "__main__":
+    main()
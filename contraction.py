@@ -0,0 +1,313 @@
+import heapq
+import math
+import struct
+import sys
+from array import array
+from typing import Dict, List, Tuple
+
+from graph import Graph
+
+class ContractionHierarchy:
+    """
+    Kısaltma hiyerarşisi (contraction hierarchy) sınıfı.
+    
+    Statik bir harita için bir kez ön işleme yapılır: düğümler önem sırasına
+    göre tek tek çıkarılır (kısaltılır) ve aradaki en kısa yolları korumak için
+    kısayol kenarları eklenir. Sorgular yalnızca sırası yükselen kenarlar
+    üzerinde iki yönlü arama yaptığı için grafın çok küçük bir kısmına dokunur.
+    Bulunan yolların maliyeti `Graph.dijkstra` ile aynıdır; eşit maliyetli
+    birden fazla yol varsa farklı biri seçilebilir.
+    """
+    MAGIC = b'CHG1'
+    
+    def __init__(self, num_nodes: int, rank: array, up_offsets: array,
+                 up_targets: array, up_weights: array, up_middle: array):
+        """
+        Args:
+            num_nodes (int): Düğüm sayısı
+            rank (array): Düğüm başına kısaltma sırası
+            up_offsets (array): Yukarı kenarların CSR başlangıç indeksleri
+            up_targets (array): Yukarı kenarların hedefleri (daha yüksek sıralı düğüm)
+            up_weights (array): Yukarı kenarların maliyetleri
+            up_middle (array): Kısayolun atladığı düğüm (özgün kenar için -1)
+        """
+        self.num_nodes = num_nodes
+        self.rank = rank
+        self.up_offsets = up_offsets
+        self.up_targets = up_targets
+        self.up_weights = up_weights
+        self.up_middle = up_middle
+        self.last_settled = 0
+        
+    @classmethod
+    def build(cls, graph: Graph, witness_limit: int = 64) -> 'ContractionHierarchy':
+        """
+        Graftan kısaltma hiyerarşisi oluşturur.
+        
+        Düğüm sırası kenar farkı (eklenecek kısayol - kaldırılan kenar) ve
+        kısaltılmış komşu sayısına göre tembel güncellemeli bir öncelik
+        kuyruğuyla belirlenir.
+        
+        Args:
+            graph (Graph): Kaynak graf (Graph veya CSRGraph)
+            witness_limit (int): Tanık aramasında kesinleştirilecek en fazla düğüm
+            
+        Returns:
+            ContractionHierarchy: Ön işlenmiş yapı
+        """
+        n = graph.num_nodes
+        # Kalan graf: düğüm -> {komşu: maliyet}; paralel kenarlardan en ucuzu tutulur
+        adjacency: List[Dict[int, float]] = [{} for _ in range(n)]
+        for node in range(n):
+            edges = adjacency[node]
+            for neighbor, weight in graph.weighted_neighbors(node):
+                if neighbor != node and weight < edges.get(neighbor, math.inf):
+                    edges[neighbor] = weight
+        middle: Dict[Tuple[int, int], int] = {}
+        
+        contracted = array('b', [0]) * n
+        deleted_neighbors = array('i', [0]) * n
+        rank = array('i', [0]) * n
+        up_edges: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+        
+        def priority(node: int, shortcuts: List[Tuple[int, int, float]]) -> int:
+            return len(shortcuts) - len(adjacency[node]) + deleted_neighbors[node]
+            
+        pq = [(priority(node, cls._shortcuts_for(adjacency, node, witness_limit)), node) for node in range(n)]
+        heapq.heapify(pq)
+        
+        order = 0
+        while pq:
+            _, node = heapq.heappop(pq)
+            if contracted[node]:
+                continue
+            # Tembel güncelleme: öncelik değiştiyse kuyruğa geri koy
+            shortcuts = cls._shortcuts_for(adjacency, node, witness_limit)
+            current = priority(node, shortcuts)
+            if pq and current > pq[0][0]:
+                heapq.heappush(pq, (current, node))
+                continue
+                
+            for u, w, cost in shortcuts:
+                if cost < adjacency[u].get(w, math.inf):
+                    adjacency[u][w] = cost
+                    adjacency[w][u] = cost
+                    middle[(min(u, w), max(u, w))] = node
+                    
+            for neighbor, weight in adjacency[node].items():
+                up_edges[node].append((neighbor, weight, middle.get((min(node, neighbor), max(node, neighbor)), -1)))
+                del adjacency[neighbor][node]
+                deleted_neighbors[neighbor] += 1
+            adjacency[node] = {}
+            contracted[node] = 1
+            rank[node] = order
+            order += 1
+            
+        up_offsets = array('q', [0]) * (n + 1)
+        up_targets = array('i')
+        up_weights = array('d')
+        up_middle = array('i')
+        for node in range(n):
+            for target, weight, via in up_edges[node]:
+                up_targets.append(target)
+                up_weights.append(weight)
+                up_middle.append(via)
+            up_offsets[node + 1] = len(up_targets)
+            
+        return cls(n, rank, up_offsets, up_targets, up_weights, up_middle)
+        
+    @staticmethod
+    def _shortcuts_for(adjacency: List[Dict[int, float]], node: int,
+                       witness_limit: int) -> List[Tuple[int, int, float]]:
+        """
+        Düğüm kısaltıldığında eklenmesi gereken kısayolları bulur.
+        
+        Her (u, w) komşu çifti için düğümü atlayan ve u-düğüm-w yolundan pahalı
+        olmayan bir tanık yol aranır; bulunamazsa kısayol gerekir.
+        
+        Returns:
+            List[Tuple[int, int, float]]: (u, w, maliyet) kısayolları
+        """
+        neighbors = list(adjacency[node].items())
+        shortcuts = []
+        for i, (u, cost_u) in enumerate(neighbors):
+            targets = {w: cost_u + cost_w for w, cost_w in neighbors[i + 1:]}
+            if not targets:
+                continue
+            limit = max(targets.values())
+            
+            # Düğümü atlayan sınırlı yerel Dijkstra; tüm hedefler kesinleşince durur
+            distances = {u: 0.0}
+            pq = [(0.0, u)]
+            settled = 0
+            remaining = len(targets)
+            while pq and settled < witness_limit:
+                distance, current = heapq.heappop(pq)
+                if distance > distances[current]:
+                    continue
+                if distance > limit:
+                    break
+                settled += 1
+                if current in targets:
+                    remaining -= 1
+                    if not remaining:
+                        break
+                for neighbor, weight in adjacency[current].items():
+                    if neighbor == node:
+                        continue
+                    new_distance = distance + weight
+                    if new_distance < distances.get(neighbor, math.inf):
+                        distances[neighbor] = new_distance
+                        heapq.heappush(pq, (new_distance, neighbor))
+                        
+            for w, via_cost in targets.items():
+                if distances.get(w, math.inf) > via_cost:
+                    shortcuts.append((u, w, via_cost))
+        return shortcuts
+        
+    def distance(self, start: int, end: int) -> float:
+        """
+        İki düğüm arasındaki en kısa mesafeyi döndürür.
+        
+        Args:
+            start (int): Başlangıç düğümü
+            end (int): Bitiş düğümü
+            
+        Returns:
+            float: Mesafe (ulaşılamıyorsa sonsuz)
+        """
+        return self._query(start, end)[0]
+        
+    def _query(self, start: int, end: int):
+        """İki yönlü yukarı arama; (mesafe, buluşma düğümü, önceki tabloları) döndürür"""
+        offsets, targets, weights = self.up_offsets, self.up_targets, self.up_weights
+        distances = ({start: 0.0}, {end: 0.0})
+        previous = ({start: -1}, {end: -1})
+        queues = ([(0.0, start)], [(0.0, end)])
+        done = [False, False]
+        best = math.inf
+        meeting = -1
+        settled = 0
+        
+        if start == end:
+            best, meeting = 0.0, start
+            
+        while not (done[0] and done[1]):
+            for side in (0, 1):
+                if done[side]:
+                    continue
+                queue = queues[side]
+                # Kuyruğun en küçük anahtarı en iyi yolu aşarsa bu yön biter
+                if not queue or queue[0][0] >= best:
+                    done[side] = True
+                    continue
+                distance, node = heapq.heappop(queue)
+                own = distances[side]
+                if distance > own[node]:
+                    continue
+                settled += 1
+                other = distances[1 - side].get(node)
+                if other is not None and distance + other < best:
+                    best = distance + other
+                    meeting = node
+                for k in range(offsets[node], offsets[node + 1]):
+                    target = targets[k]
+                    new_distance = distance + weights[k]
+                    if new_distance < own.get(target, math.inf):
+                        own[target] = new_distance
+                        previous[side][target] = node
+                        heapq.heappush(queue, (new_distance, target))
+                        
+        self.last_settled = settled
+        return best, meeting, previous
+        
+    def query(self, start: int, end: int) -> List[int]:
+        """
+        İki düğüm arasındaki en kısa yolu bulur ve kısayolları açar.
+        
+        Args:
+            start (int): Başlangıç düğümü
+            end (int): Bitiş düğümü
+            
+        Returns:
+            List[int]: Bulunan yol (yol yoksa boş liste)
+        """
+        best, meeting, previous = self._query(start, end)
+        if best == math.inf:
+            return []
+            
+        # Kısayol düzeyindeki yol: başlangıç -> buluşma <- bitiş
+        upward = []
+        node = meeting
+        while node != -1:
+            upward.append(node)
+            node = previous[0][node]
+        upward.reverse()
+        node = previous[1][meeting]
+        while node != -1:
+            upward.append(node)
+            node = previous[1][node]
+            
+        path = [upward[0]]
+        for i in range(len(upward) - 1):
+            self._unpack(upward[i], upward[i + 1], path)
+        return path
+        
+    def _middle_of(self, u: int, v: int) -> int:
+        """(u, v) kenarının atladığı düğümü döndürür (özgün kenar için -1)"""
+        low, high = (u, v) if self.rank[u] < self.rank[v] else (v, u)
+        best_weight, via = math.inf, -1
+        for k in range(self.up_offsets[low], self.up_offsets[low + 1]):
+            if self.up_targets[k] == high and self.up_weights[k] < best_weight:
+                best_weight, via = self.up_weights[k], self.up_middle[k]
+        return via
+        
+    def _unpack(self, u: int, v: int, path: List[int]):
+        """u -> v kenarını özgün kenarlara açarak yolun sonuna ekler (u zaten eklidir)"""
+        stack = [(u, v)]
+        while stack:
+            a, b = stack.pop()
+            via = self._middle_of(a, b)
+            if via == -1:
+                path.append(b)
+            else:
+                stack.append((via, b))
+                stack.append((a, via))
+                
+    def save(self, path: str):
+        """
+        Hiyerarşiyi ikili dosyaya yazar.
+        
+        Args:
+            path (str): Dosya yolu
+        """
+        with open(path, 'wb') as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack('<BQQ', sys.byteorder == 'little', self.num_nodes, len(self.up_targets)))
+            for values in (self.rank, self.up_offsets, self.up_targets, self.up_weights, self.up_middle):
+                values.tofile(f)
+                
+    @classmethod
+    def load(cls, path: str) -> 'ContractionHierarchy':
+        """
+        `save` ile yazılmış hiyerarşiyi okur.
+        
+        Args:
+            path (str): Dosya yolu
+            
+        Returns:
+            ContractionHierarchy: Okunan yapı
+        """
+        with open(path, 'rb') as f:
+            if f.read(4) != cls.MAGIC:
+                raise ValueError(f"Geçersiz kısaltma hiyerarşisi dosyası: {path}")
+            little, num_nodes, num_edges = struct.unpack('<BQQ', f.read(17))
+            arrays = []
+            for typecode, length in (('i', num_nodes), ('q', num_nodes + 1), ('i', num_edges),
+                                     ('d', num_edges), ('i', num_edges)):
+                values = array(typecode)
+                values.fromfile(f, length)
+                if bool(little) != (sys.byteorder == 'little'):
+                    values.byteswap()
+                arrays.append(values)
+        return cls(num_nodes, *arrays)
@@ -0,0 +1,186 @@
+import heapq
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from itertools import count
+from typing import Any, Callable, Deque, Dict, Generator, List
+
+class EventKind(Enum):
+    """Simülasyonda kaydedilen olay türleri"""
+    HOP = "geçiş"
+    BLOCKAGE = "engel"
+    DELAY = "gecikme"
+    TASK_ARRIVED = "görev_geldi"
+    TASK_COMPLETED = "görev_tamamlandı"
+
+@dataclass
+class Event:
+    """Sanal zamanda gerçekleşmiş bir olayın kaydı"""
+    time: float
+    kind: EventKind
+    data: Dict[str, Any] = field(default_factory=dict)
+
+# Bir süreç (generator) her adımda beklenecek sanal süreyi (saniye) verir
+Process = Generator[float, None, Any]
+
+class EventSimulator:
+    """
+    Sanal saatli ayrık olay simülasyon çekirdeği.
+    
+    Zamanlanmış çağrılar (zaman, sıra) anahtarlı bir yığında tutulur ve
+    sırayla çalıştırılır; aynı andaki çağrılar zamanlandıkları sırayla
+    işlenir. Saat bir olaydan diğerine atlar, beklemeler için uyunmaz; bu
+    yüzden simülasyon işlemcinin izin verdiği hızda ilerler. `realtime_factor`
+    verilirse olaylar duvar saatine göre o kat hızlı yürütülür (gösterimler
+    için; 1.0 = gerçek zaman).
+    
+    Görev akışları generator olarak yazılır: `yield süre` süreci o kadar
+    sanal saniye askıya alır (`time.sleep` yerine). Olaylar `record` ile
+    kaydedilir; tür başına sayaçlar tutulur, son olaylar sınırlı bir geçmişte
+    saklanır ve varsa dinleyicilere iletilir.
+    """
+    def __init__(self, realtime_factor: float = 0.0, history_size: int = 10000,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            realtime_factor (float): Duvar saatine göre hız katı (0: beklemeden, en hızlı)
+            history_size (int): Saklanacak son olay sayısı
+            sleep: Gerçek zamanlı yürütmede kullanılacak uyku fonksiyonu
+        """
+        if realtime_factor < 0:
+            raise ValueError("Gerçek zaman katı negatif olamaz")
+        self.now = 0.0
+        self.realtime_factor = realtime_factor
+        self.processed = 0  # Çalıştırılan zamanlanmış çağrı sayısı
+        self.counts: Dict[EventKind, int] = {kind: 0 for kind in EventKind}
+        self.history: Deque[Event] = deque(maxlen=history_size)
+        self.listeners: List[Callable[[Event], None]] = []
+        self._sleep = sleep
+        self._queue: List[list] = []   # [zaman, sıra, çağrı, argümanlar]; iptalde çağrı None
+        self._sequence = count()
+        
+    def schedule(self, delay: float, callback: Callable, *args) -> list:
+        """
+        Çağrıyı şimdiden `delay` sanal saniye sonra çalışacak şekilde zamanlar.
+        
+        Args:
+            delay (float): Bekleme süresi (saniye)
+            callback: Çağrılacak fonksiyon
+            *args: Fonksiyon argümanları
+            
+        Returns:
+            list: `cancel` ile iptal için kullanılan kayıt
+        """
+        if delay < 0 or math.isnan(delay):
+            raise ValueError(f"Geçersiz bekleme süresi: {delay}")
+        return self.schedule_at(self.now + delay, callback, *args)
+        
+    def schedule_at(self, at: float, callback: Callable, *args) -> list:
+        """
+        Çağrıyı verilen sanal zamanda çalışacak şekilde zamanlar.
+        
+        Args:
+            at (float): Çalışma zamanı (geçmişteyse şimdi)
+            callback: Çağrılacak fonksiyon
+            *args: Fonksiyon argümanları
+            
+        Returns:
+            list: `cancel` ile iptal için kullanılan kayıt
+        """
+        entry = [max(at, self.now), next(self._sequence), callback, args]
+        heapq.heappush(self._queue, entry)
+        return entry
+        
+    def cancel(self, entry: list):
+        """Zamanlanmış çağrıyı iptal eder (yığından tembel olarak silinir)"""
+        entry[2] = None
+        
+    def process(self, generator: Process, delay: float = 0.0):
+        """
+        Generator tabanlı bir süreci başlatır.
+        
+        Süreç her `yield` ile beklenecek sanal süreyi verir (None = 0);
+        generator bittiğinde süreç sona erer.
+        
+        Args:
+            generator: Süreç
+            delay (float): Başlamadan önceki bekleme (saniye)
+        """
+        self.schedule(delay, self._resume, generator)
+        
+    def _resume(self, generator: Process):
+        try:
+            delay = next(generator)
+        except StopIteration:
+            return
+        self.schedule(delay or 0.0, self._resume, generator)
+        
+    def record(self, kind: EventKind, **data) -> Event:
+        """
+        Şimdiki sanal zamanda bir olay kaydeder.
+        
+        Args:
+            kind (EventKind): Olay türü
+            **data: Olay ayrıntıları
+            
+        Returns:
+            Event: Kaydedilen olay
+        """
+        event = Event(self.now, kind, data)
+        self.counts[kind] += 1
+        self.history.append(event)
+        for listener in self.listeners:
+            listener(event)
+        return event
+        
+    def peek(self) -> float:
+        """
+        Returns:
+            float: Sıradaki zamanlanmış çağrının zamanı (yoksa sonsuz)
+        """
+        queue = self._queue
+        while queue and queue[0][2] is None:
+            heapq.heappop(queue)
+        return queue[0][0] if queue else math.inf
+        
+    def step(self) -> bool:
+        """
+        Sıradaki zamanlanmış çağrıyı çalıştırır.
+        
+        Returns:
+            bool: Bir çağrı çalıştırıldıysa True
+        """
+        if self.peek() == math.inf:
+            return False
+        at, _, callback, args = heapq.heappop(self._queue)
+        self.now = at
+        callback(*args)
+        self.processed += 1
+        return True
+        
+    def run(self, until: float = math.inf) -> int:
+        """
+        Çağrıları sanal saat `until` anına gelene veya kuyruk boşalana kadar çalıştırır.
+        
+        Args:
+            until (float): Bitiş zamanı (saniye)
+            
+        Returns:
+            int: Çalıştırılan çağrı sayısı
+        """
+        processed = self.processed
+        wall_start, virtual_start = time.perf_counter(), self.now
+        while True:
+            at = self.peek()
+            if at == math.inf or at > until:
+                break
+            if self.realtime_factor > 0:
+                wait = wall_start + (at - virtual_start) / self.realtime_factor - time.perf_counter()
+                if wait > 0:
+                    self._sleep(wait)
+            self.step()
+        if until != math.inf:
+            self.now = max(self.now, until)
+        return self.processed - processed
@@ -0,0 +1,366 @@
+import heapq
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import count
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from graph import Graph
+from tasks import _STATUS_CODES, Task, TaskQueue, TaskStatus
+
+def linear_assignment(cost: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dikdörtgen atama problemini en küçük toplam maliyetle çözer (Macar yöntemi).
+    
+    Kısa artırma yollu (Jonker-Volgenant biçimi) O(n²m) sürümdür; her satır
+    için iç döngü NumPy ile vektöreldir. Satır sayısı sütun sayısından
+    büyükse matris devrilerek çözülür; böylece her zaman min(n, m) çift atanır.
+    
+    Args:
+        cost (np.ndarray): n x m maliyet matrisi (sonlu değerler)
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (satırlar, sütunlar); satıra göre sıralı atama çiftleri
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.ndim != 2:
+        raise ValueError("Maliyet matrisi iki boyutlu olmalı")
+    if not np.isfinite(cost).all():
+        raise ValueError("Maliyet matrisi yalnızca sonlu değerler içermeli")
+        
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    n, m = cost.shape
+    u = np.zeros(n + 1)                       # Satır potansiyelleri
+    v = np.zeros(m + 1)                       # Sütun potansiyelleri
+    match = np.zeros(m + 1, dtype=np.int64)   # Sütun -> satır (1 tabanlı, 0 = boş)
+    way = np.zeros(m + 1, dtype=np.int64)     # Artırma yolunda önceki sütun
+    
+    for row in range(1, n + 1):
+        match[0] = row
+        column = 0
+        min_reduced = np.full(m + 1, math.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[column] = True
+            current = match[column]
+            free = ~used
+            free[0] = False
+            reduced = cost[current - 1] - u[current] - v[1:]
+            better = free[1:] & (reduced < min_reduced[1:])
+            min_reduced[1:][better] = reduced[better]
+            way[1:][better] = column
+            candidates = np.where(free, min_reduced, math.inf)
+            next_column = int(np.argmin(candidates))
+            delta = candidates[next_column]
+            u[match[used]] += delta
+            v[used] -= delta
+            min_reduced[free] -= delta
+            column = next_column
+            if match[column] == 0:
+                break
+        # Artırma yolunu geri izleyerek eşleşmeleri kaydır
+        while column:
+            previous = way[column]
+            match[column] = match[previous]
+            column = previous
+            
+    cols = np.flatnonzero(match[1:])
+    rows = match[1:][cols] - 1
+    order = np.argsort(rows)
+    rows, cols = rows[order], cols[order]
+    if transposed:
+        order = np.argsort(cols)
+        return cols[order], rows[order]
+    return rows, cols
+
+@dataclass
+class Drone:
+    """Filodaki bir dronun durumu"""
+    id: int
+    position: int                   # Bulunduğu (veya görevi bitince varacağı) düğüm
+    task_id: Optional[int] = None   # Yürüttüğü görev (boştaysa None)
+    busy_until: float = 0.0         # Görevin biteceği simülasyon zamanı (saat)
+    completed: int = 0              # Tamamladığı görev sayısı
+    distance: float = 0.0           # Katettiği toplam mesafe
+
+@dataclass
+class FleetReport:
+    """Filo simülasyonunun özeti"""
+    drones: int
+    completed: int      # Tamamlanan görev sayısı
+    pending: int        # Simülasyon sonunda bekleyen görev sayısı
+    hours: float        # Geçen simülasyon süresi (saat)
+    distance: float     # Filonun katettiği toplam mesafe
+    dispatches: int     # Yapılan toplu atama sayısı
+    
+    @property
+    def tasks_per_hour(self) -> float:
+        """Simülasyon saati başına tamamlanan görev"""
+        return self.completed / self.hours if self.hours > 0 else 0.0
+
+# Olay türleri
+_ARRIVAL, _COMPLETION, _DISPATCH = 0, 1, 2
+
+class FleetDispatcher:
+    """
+    Çok dronlu filo dağıtıcısı.
+    
+    N dronun konumunu tutar ve bekleyen görevleri boştaki dronlara toplu
+    halde, toplam maliyeti en küçük olacak şekilde atar (`linear_assignment`).
+    Maliyet, dronun konumundan görev hedefine en kısa yol süresi ile görev
+    önceliğine bağlı bir cezanın toplamıdır; mesafeler düğüm başına tek bir
+    en kısa yol ağacından okunur ve NumPy satırları olarak önbellekte tutulur.
+    Graf yönsüz olduğundan bir satır hem "düğümden" hem "düğüme" mesafedir;
+    dronlar hep ya üsste ya da önceki bir görevin hedefinde durduğundan
+    simülasyon boyunca çoğu satır yeniden kullanılır.
+    
+    Simülasyon olay güdümlüdür: görev gelişleri ve tamamlanmaları zamana göre
+    sıralı bir yığında tutulur, aynı andaki olaylar birlikte işlendikten sonra
+    yeniden atama yapılır. Bekleyen görevler dağıtıcının kendi kümesinde
+    tutulduğundan atama başına kuyruk taraması yapılmaz. Yola çıkmış dronlar
+    yeniden atanmaz.
+    """
+    def __init__(self, graph: Graph, num_drones: int, task_queue: Optional[TaskQueue] = None,
+                 depot: int = 0, speed: float = 1.0, service_time: float = 0.0,
+                 priority_weight: float = 1.0, batch_interval: float = 0.0, cache_size: int = 1024):
+        """
+        Args:
+            graph (Graph): Yönsüz graf
+            num_drones (int): Dron sayısı
+            task_queue (TaskQueue): Görev kuyruğu (varsayılan: yeni kuyruk); bekleyen görevleri alınır
+            depot (int): Dronların başlangıç düğümü
+            speed (float): Saatte katedilen mesafe
+            service_time (float): Hedefte görev başına harcanan süre (saat)
+            priority_weight (float): Öncelik seviyesi başına maliyet cezası (saat)
+            batch_interval (float): Toplu atamalar arası süre (0: her olaydan sonra)
+            cache_size (int): Önbellekte tutulacak mesafe satırı sayısı
+        """
+        if num_drones < 1:
+            raise ValueError("Dron sayısı en az 1 olmalı")
+        if speed <= 0:
+            raise ValueError("Hız pozitif olmalı")
+            
+        self.graph = graph
+        self.task_queue = task_queue if task_queue is not None else TaskQueue()
+        self.depot = depot
+        self.speed = speed
+        self.service_time = service_time
+        self.priority_weight = priority_weight
+        self.batch_interval = batch_interval
+        self.cache_size = cache_size
+        self.drones = [Drone(drone_id, depot) for drone_id in range(num_drones)]
+        self.now = 0.0
+        self.completed = 0
+        self.dispatches = 0
+        self.distance_rows = 0  # Hesaplanan en kısa yol ağacı sayısı
+        
+        self._idle: Dict[int, None] = dict.fromkeys(range(num_drones))   # Ekleme sıralı küme
+        self._pending: Dict[int, None] = dict.fromkeys(
+            task.id for task in self.task_queue.tasks_by_status(TaskStatus.PENDING))
+        self._events: List[Tuple[float, int, int, int]] = []   # (zaman, sıra, tür, değer)
+        self._sequence = count()
+        self._arrivals: Dict[int, Tuple[int, int, str]] = {}
+        self._dispatch_due = False
+        self._next_batch = math.inf   # Planlanmış toplu atama zamanı
+        self._rows: 'OrderedDict[int, np.ndarray]' = OrderedDict()
+        self._rows_version = graph.version  # Satırların hesaplandığı graf sürümü
+        
+    def add_task(self, target_node: int, priority: int, description: str) -> Task:
+        """
+        Görevi şimdi kuyruğa ekler; bir sonraki atamada değerlendirilir.
+        
+        Args:
+            target_node (int): Hedef düğüm
+            priority (int): Görev önceliği (düşük sayı = yüksek öncelik)
+            description (str): Görev açıklaması
+            
+        Returns:
+            Task: Oluşturulan görev
+        """
+        task = self.task_queue.add_task(target_node, priority, description)
+        self._pending[task.id] = None
+        self._dispatch_due = True
+        return task
+        
+    def schedule_task(self, at: float, target_node: int, priority: int, description: str):
+        """
+        Görevin verilen simülasyon zamanında gelmesini planlar.
+        
+        Args:
+            at (float): Geliş zamanı (saat)
+            target_node (int): Hedef düğüm
+            priority (int): Görev önceliği
+            description (str): Görev açıklaması
+        """
+        key = next(self._sequence)
+        self._arrivals[key] = (target_node, priority, description)
+        heapq.heappush(self._events, (max(at, self.now), key, _ARRIVAL, key))
+        
+    def dispatch(self) -> List[Tuple[Drone, Task]]:
+        """
+        Boştaki dronlara bekleyen görevleri en küçük toplam maliyetle atar.
+        
+        Görevden fazla dron varsa yalnızca bazı dronlar, dron sayısından fazla
+        görev varsa yalnızca bazı görevler atanır; ulaşılamayan hedefler
+        beklemede kalır.
+        
+        Returns:
+            List[Tuple[Drone, Task]]: Yapılan atamalar
+        """
+        self._dispatch_due = False
+        if not self._idle or not self._pending:
+            return []
+            
+        store = self.task_queue.store
+        task_ids = np.fromiter(self._pending, dtype=np.int64, count=len(self._pending))
+        # Kuyruk üzerinden iptal edilen veya başlatılan görevleri ayıkla
+        statuses = np.frombuffer(store.statuses, dtype=np.int8)[task_ids - 1]
+        still_pending = statuses == _STATUS_CODES[TaskStatus.PENDING]
+        for task_id in task_ids[~still_pending].tolist():
+            del self._pending[task_id]
+        task_ids = task_ids[still_pending]
+        if not len(task_ids):
+            return []
+            
+        drone_ids = np.fromiter(self._idle, dtype=np.int64, count=len(self._idle))
+        positions = np.array([self.drones[drone_id].position for drone_id in drone_ids.tolist()])
+        targets = np.frombuffer(store.target_nodes, dtype=np.int32)[task_ids - 1]
+        priorities = np.frombuffer(store.priorities, dtype=np.int32)[task_ids - 1]
+        
+        distances = self._distance_matrix(positions, targets)
+        cost = distances / self.speed + self.priority_weight * priorities
+        reachable = np.isfinite(cost)
+        if not reachable.any():
+            return []
+        if not reachable.all():
+            # Ulaşılamayan çiftler, her ulaşılabilir atama kümesinden pahalı olsun
+            finite = cost[reachable]
+            span = float(finite.max() - finite.min()) + 1.0
+            cost = np.where(reachable, cost, float(finite.max()) + span * min(cost.shape))
+            
+        rows, cols = linear_assignment(cost)
+        keep = reachable[rows, cols]
+        assignments = []
+        for row, col in zip(rows[keep].tolist(), cols[keep].tolist()):
+            drone = self.drones[int(drone_ids[row])]
+            task_id = int(task_ids[col])
+            travel = float(distances[row, col])
+            
+            self.task_queue.update_task_status(task_id, TaskStatus.IN_PROGRESS)
+            del self._pending[task_id]
+            del self._idle[drone.id]
+            drone.task_id = task_id
+            drone.position = int(targets[col])
+            drone.distance += travel
+            drone.busy_until = self.now + travel / self.speed + self.service_time
+            heapq.heappush(self._events, (drone.busy_until, next(self._sequence), _COMPLETION, drone.id))
+            assignments.append((drone, Task(store, task_id)))
+            
+        self.dispatches += 1
+        return assignments
+        
+    def step(self) -> bool:
+        """
+        Sıradaki zamandaki tüm olayları işler, gerekirse yeniden atama yapar.
+        
+        Returns:
+            bool: Bir olay işlendiyse True
+        """
+        if not self._events:
+            return False
+            
+        self.now = self._events[0][0]
+        batch_due = False
+        while self._events and self._events[0][0] == self.now:
+            _, _, kind, value = heapq.heappop(self._events)
+            if kind == _ARRIVAL:
+                self.add_task(*self._arrivals.pop(value))
+            elif kind == _COMPLETION:
+                drone = self.drones[value]
+                self.task_queue.update_task_status(drone.task_id, TaskStatus.COMPLETED)
+                drone.task_id = None
+                drone.completed += 1
+                self.completed += 1
+                self._idle[drone.id] = None
+                self._dispatch_due = True
+            else:
+                self._next_batch = math.inf
+                batch_due = True
+                
+        if self._dispatch_due:
+            if self.batch_interval <= 0 or batch_due:
+                self.dispatch()
+            elif self._next_batch == math.inf:
+                # Atamayı bir sonraki toplu atama anına ertele; arada gelenler birlikte atanır
+                self._next_batch = (math.floor(self.now / self.batch_interval) + 1) * self.batch_interval
+                heapq.heappush(self._events, (self._next_batch, next(self._sequence), _DISPATCH, 0))
+        return True
+        
+    def run(self, until: float = math.inf) -> FleetReport:
+        """
+        Olayları verilen simülasyon zamanına (veya olay kalmayana) kadar işler.
+        
+        Args:
+            until (float): Bitiş zamanı (saat)
+            
+        Returns:
+            FleetReport: Filo özeti
+        """
+        if self._dispatch_due or self._pending:
+            self.dispatch()
+        while self._events and self._events[0][0] <= until:
+            self.step()
+        if until != math.inf:
+            self.now = max(self.now, until)
+        return self.report()
+        
+    def report(self) -> FleetReport:
+        """
+        Returns:
+            FleetReport: Şu ana kadarki filo özeti
+        """
+        return FleetReport(len(self.drones), self.completed, len(self._pending), self.now,
+                           sum(drone.distance for drone in self.drones), self.dispatches)
+                           
+    def _sync_rows(self):
+        """Graf değiştiyse önbellekteki mesafe satırlarını atar"""
+        if self._rows_version != self.graph.version:
+            self._rows.clear()
+            self._rows_version = self.graph.version
+            
+    def _distance_row(self, node: int) -> np.ndarray:
+        """Düğümden tüm düğümlere en kısa mesafeler (LRU önbellekli)"""
+        self._sync_rows()
+        row = self._rows.get(node)
+        if row is not None:
+            self._rows.move_to_end(node)
+            return row
+            
+        row = np.array(self.graph.shortest_path_tree(node).distances, dtype=np.float64)
+        self.distance_rows += 1
+        self._rows[node] = row
+        while len(self._rows) > self.cache_size:
+            self._rows.popitem(last=False)
+        return row
+        
+    def _distance_matrix(self, positions: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Dron konumlarından görev hedeflerine mesafe matrisi.
+        
+        Graf yönsüz olduğundan satırlar konumlardan veya hedeflerden
+        okunabilir; önbellekte eksik satırı daha az olan taraf seçilir.
+        """
+        self._sync_rows()
+        sources, source_index = np.unique(positions, return_inverse=True)
+        goals, goal_index = np.unique(targets, return_inverse=True)
+        missing_sources = sum(1 for node in sources.tolist() if node not in self._rows)
+        missing_goals = sum(1 for node in goals.tolist() if node not in self._rows)
+        if missing_sources <= missing_goals:
+            matrix = np.stack([self._distance_row(node)[goals] for node in sources.tolist()])
+        else:
+            matrix = np.stack([self._distance_row(node)[sources] for node in goals.tolist()]).T
+        return matrix[source_index][:, goal_index]
@@ -0,0 +1,258 @@
+import math
+from array import array
+from typing import Iterator, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from graph import CSRGraph, Graph
+
+Seed = Union[None, int, np.random.Generator]
+
+def _rng(seed: Seed) -> np.random.Generator:
+    """Tohum değerinden (veya hazır üreteçten) NumPy rastgele sayı üreteci oluşturur"""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+class PointCoordinates(Mapping):
+    """
+    Düğüm koordinatlarını iki NumPy dizisinde tutan salt okunur eşleme.
+    
+    Milyonlarca düğümlü haritalarda her düğüm için ayrı bir demet saklamak
+    yerine `Graph.coordinates` yerine kullanılabilir.
+    """
+    def __init__(self, xs: np.ndarray, ys: np.ndarray):
+        self.xs = xs
+        self.ys = ys
+        
+    def __getitem__(self, node: int) -> Tuple[float, float]:
+        if not 0 <= node < len(self.xs):
+            raise KeyError(node)
+        return (float(self.xs[node]), float(self.ys[node]))
+        
+    def __contains__(self, node) -> bool:
+        try:
+            return 0 <= node < len(self.xs)
+        except TypeError:
+            return False
+            
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self.xs)))
+        
+    def __len__(self) -> int:
+        return len(self.xs)
+
+def erdos_renyi_edges(num_nodes: int, probability: float, seed: Seed = None,
+                      batch_size: int = 1 << 20) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Erdős–Rényi G(n, p) grafının kenarlarını geometrik atlama ile üretir.
+    
+    Tüm n(n-1)/2 düğüm çifti için ayrı zar atmak yerine, bir sonraki kenara
+    kadar atlanacak çift sayısı geometrik dağılımdan toplu olarak çekilir.
+    Maliyet kenar sayısıyla orantılıdır. Kenarlar (i < j) çiftleri olarak,
+    iç içe döngüdeki sırayla döndürülür.
+    
+    Args:
+        num_nodes (int): Düğüm sayısı
+        probability (float): Her çift için kenar olasılığı
+        seed: Tohum değeri veya NumPy üreteci
+        batch_size (int): Tek seferde çekilecek en fazla atlama sayısı
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (kaynaklar, hedefler) dizileri
+    """
+    rng = _rng(seed)
+    total_pairs = num_nodes * (num_nodes - 1) // 2
+    if probability <= 0 or total_pairs == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+        
+    if probability >= 1:
+        indices = np.arange(total_pairs, dtype=np.int64)
+    else:
+        chunks = []
+        position = -1
+        while True:
+            # Kalan çiftlerdeki beklenen kenar sayısının biraz üstü çekilir; küçük graflarda
+            # tam boy blok çekilmez, nadiren yetmezse döngü kalan kısım için yeniden çeker
+            expected = (total_pairs - position - 1) * probability
+            size = min(batch_size, int(expected + 6 * math.sqrt(expected)) + 16)
+            gaps = rng.geometric(probability, size=size)
+            chunk = position + np.cumsum(gaps, dtype=np.int64)
+            position = int(chunk[-1])
+            if position >= total_pairs:
+                chunks.append(chunk[chunk < total_pairs])
+                break
+            chunks.append(chunk)
+        indices = np.concatenate(chunks)
+        
+    # Üçgen dizideki doğrusal indeksi (satır, sütun) çiftine çevir
+    n = num_nodes
+    rows = np.floor(((2 * n - 1) - np.sqrt((2.0 * n - 1) ** 2 - 8.0 * indices)) / 2).astype(np.int64)
+    row_start = rows * (2 * n - rows - 1) // 2
+    # Kayan nokta yuvarlamasını düzelt
+    too_far = row_start > indices
+    rows[too_far] -= 1
+    row_start = rows * (2 * n - rows - 1) // 2
+    next_start = (rows + 1) * (2 * n - rows - 2) // 2
+    too_short = indices >= next_start
+    rows[too_short] += 1
+    row_start = rows * (2 * n - rows - 1) // 2
+    cols = indices - row_start + rows + 1
+    return rows, cols
+
+def csr_from_edges(num_nodes: int, sources: np.ndarray, targets: np.ndarray,
+                   weights: Optional[np.ndarray] = None,
+                   coordinates: Optional[Mapping] = None) -> CSRGraph:
+    """
+    Kenar dizilerinden doğrudan CSRGraph oluşturur.
+    
+    Komşu sırası, aynı kenarlar sırayla `Graph.add_edge` ile eklenmiş gibidir.
+    
+    Args:
+        num_nodes (int): Düğüm sayısı
+        sources (np.ndarray): Kenar başlangıçları
+        targets (np.ndarray): Kenar bitişleri
+        weights (np.ndarray): Kenar maliyetleri (varsayılan 1.0)
+        coordinates: Düğüm koordinatları
+        
+    Returns:
+        CSRGraph: Yönsüz kompakt graf
+    """
+    # Her kenar önce ileri, sonra geri yönde eklenir
+    arc_sources = np.column_stack((sources, targets)).ravel()
+    arc_targets = np.column_stack((targets, sources)).ravel()
+    order = np.argsort(arc_sources, kind='stable')
+    
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(arc_sources, minlength=num_nodes), out=offsets[1:])
+    
+    csr_offsets = array('q')
+    csr_offsets.frombytes(offsets.astype(np.int64).tobytes())
+    csr_targets = array('i')
+    csr_targets.frombytes(arc_targets[order].astype(np.int32).tobytes())
+    csr_weights = None
+    if weights is not None:
+        arc_weights = np.repeat(np.asarray(weights, dtype=np.float64), 2)
+        csr_weights = array('d')
+        csr_weights.frombytes(arc_weights[order].tobytes())
+    return CSRGraph(num_nodes, csr_offsets, csr_targets, csr_weights, coordinates)
+
+def _to_graph(num_nodes: int, sources: np.ndarray, targets: np.ndarray,
+              weights: Optional[np.ndarray], coordinates: Optional[Mapping],
+              compact: bool) -> Graph:
+    """Kenar dizilerini istenen graf gösterimine yazar"""
+    if compact:
+        return csr_from_edges(num_nodes, sources, targets, weights, coordinates)
+    graph = Graph(num_nodes)
+    if weights is None:
+        for u, v in zip(sources.tolist(), targets.tolist()):
+            graph.add_edge(u, v)
+    else:
+        for u, v, w in zip(sources.tolist(), targets.tolist(), weights.tolist()):
+            graph.add_edge(u, v, w)
+    if coordinates is not None:
+        for node in range(num_nodes):
+            graph.set_coordinates(node, *coordinates[node])
+    return graph
+
+def erdos_renyi_graph(num_nodes: int, probability: float, seed: Seed = None,
+                      compact: bool = True) -> Graph:
+    """
+    Erdős–Rényi G(n, p) rastgele grafı oluşturur.
+    
+    Args:
+        num_nodes (int): Düğüm sayısı
+        probability (float): Her çift için kenar olasılığı
+        seed: Tohum değeri veya NumPy üreteci
+        compact (bool): True ise CSRGraph, False ise Graph döndürür
+        
+    Returns:
+        Graph: Oluşturulan graf
+    """
+    sources, targets = erdos_renyi_edges(num_nodes, probability, seed)
+    return _to_graph(num_nodes, sources, targets, None, None, compact)
+
+def random_geometric_graph(num_nodes: int, radius: float, seed: Seed = None,
+                           compact: bool = True) -> Graph:
+    """
+    Birim karede rastgele geometrik graf oluşturur.
+    
+    Düğümler düzgün dağılımla yerleştirilir; aralarındaki uzaklık `radius`
+    değerinden küçük olan düğümler, uzaklık maliyetiyle bağlanır. Aday çiftler
+    kenar uzunluğu `radius` olan hücre ızgarası üzerinden vektörel bulunur,
+    böylece maliyet O(n²) yerine kenar sayısıyla orantılıdır.
+    
+    Args:
+        num_nodes (int): Düğüm sayısı
+        radius (float): Bağlantı yarıçapı
+        seed: Tohum değeri veya NumPy üreteci
+        compact (bool): True ise CSRGraph, False ise Graph döndürür
+        
+    Returns:
+        Graph: Koordinatlı ve ağırlıklı graf
+    """
+    rng = _rng(seed)
+    xs = rng.random(num_nodes)
+    ys = rng.random(num_nodes)
+    
+    cells_per_side = max(1, int(1.0 / radius))
+    cell_x = np.minimum((xs * cells_per_side).astype(np.int64), cells_per_side - 1)
+    cell_y = np.minimum((ys * cells_per_side).astype(np.int64), cells_per_side - 1)
+    cell = cell_y * cells_per_side + cell_x
+    order = np.argsort(cell, kind='stable')
+    cell_start = np.searchsorted(cell[order], np.arange(cells_per_side * cells_per_side + 1))
+    
+    sources_parts = []
+    targets_parts = []
+    # Her çift bir kez bulunsun diye yalnızca "ileri" komşu hücrelere bakılır
+    for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+        other_x = cell_x + dx
+        other_y = cell_y + dy
+        valid = (other_x >= 0) & (other_x < cells_per_side) & (other_y < cells_per_side)
+        points = np.nonzero(valid)[0]
+        other_cell = other_y[points] * cells_per_side + other_x[points]
+        begin = cell_start[other_cell]
+        counts = cell_start[other_cell + 1] - begin
+        # Her nokta için komşu hücredeki tüm noktaları aday çift olarak aç
+        left = np.repeat(points, counts)
+        run_start = np.repeat(np.cumsum(counts) - counts, counts)
+        right = order[np.repeat(begin, counts) + np.arange(len(left)) - run_start]
+        if dx == 0 and dy == 0:
+            keep = left < right
+            left, right = left[keep], right[keep]
+        close = (xs[left] - xs[right]) ** 2 + (ys[left] - ys[right]) ** 2 < radius * radius
+        sources_parts.append(np.minimum(left[close], right[close]))
+        targets_parts.append(np.maximum(left[close], right[close]))
+        
+    sources = np.concatenate(sources_parts)
+    targets = np.concatenate(targets_parts)
+    weights = np.hypot(xs[sources] - xs[targets], ys[sources] - ys[targets])
+    return _to_graph(num_nodes, sources, targets, weights, PointCoordinates(xs, ys), compact)
+
+def damaged_grid_graph(rows: int, cols: int, damage: float = 0.1, seed: Seed = None,
+                       compact: bool = True) -> Graph:
+    """
+    Hasarlı ızgara grafı oluşturur (sokak ağı benzeri arazi).
+    
+    Düğüm `r * cols + c` ızgaranın (r, c) noktasıdır; yatay ve dikey kenarlar
+    `damage` olasılığıyla (yıkılmış yol) kaldırılır.
+    
+    Args:
+        rows (int): Satır sayısı
+        cols (int): Sütun sayısı
+        damage (float): Her kenarın kaldırılma olasılığı
+        seed: Tohum değeri veya NumPy üreteci
+        compact (bool): True ise CSRGraph, False ise Graph döndürür
+        
+    Returns:
+        Graph: Koordinatlı graf
+    """
+    rng = _rng(seed)
+    nodes = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+    sources = np.concatenate((nodes[:, :-1].ravel(), nodes[:-1, :].ravel()))
+    targets = np.concatenate((nodes[:, 1:].ravel(), nodes[1:, :].ravel()))
+    intact = rng.random(len(sources)) >= damage
+    coordinates = PointCoordinates((nodes % cols).ravel().astype(np.float64),
+                                   (nodes // cols).ravel().astype(np.float64))
+    return _to_graph(rows * cols, sources[intact], targets[intact], None, coordinates, compact)
@@ -1,5 +1,37 @@
 import heapq
-from typing import Dict, List, Set, Tuple
+import math
+from array import array
+from collections import OrderedDict
+from itertools import count, islice
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple
+
+# (düğüm, hedef) -> hedefe kalan mesafenin alt sınırı
+Heuristic = Callable[[int, int], float]
+
+SEARCH_METHODS = ('dijkstra', 'astar', 'bidirectional')
+PATH_MODES = ('yen', 'disjoint')
+
+def straight_line_heuristic(coordinates: Dict[int, Tuple[float, float]]) -> Heuristic:
+    """
+    Düğüm koordinatlarından kuş uçuşu mesafe sezgiseli oluşturur.
+    
+    Kenar ağırlıkları uçlar arasındaki düz çizgi mesafesinden küçük olmadığı
+    sürece sezgisel kabul edilebilirdir (gerçek maliyeti aşmaz).
+    
+    Args:
+        coordinates: Düğüm -> (x, y) eşlemesi
+        
+    Returns:
+        Heuristic: A* için sezgisel fonksiyon
+    """
+    def heuristic(node: int, target: int) -> float:
+        if node not in coordinates or target not in coordinates:
+            return 0.0
+        x1, y1 = coordinates[node]
+        x2, y2 = coordinates[target]
+        return math.hypot(x1 - x2, y1 - y2)
+    return heuristic
+
 
 class Graph:
     """
@@ -14,17 +46,100 @@ class Graph:
         self.num_nodes = num_nodes
         self.graph: Dict[int, List[int]] = {i: [] for i in range(num_nodes)}
         # Her kenar sadece hedef düğümü saklar
+        self.weights: Dict[Tuple[int, int], float] = {}  # (küçük, büyük) -> kenar maliyeti
+        self.coordinates: Dict[int, Tuple[float, float]] = {}
+        self.last_settled: int = 0  # Son sorguda kesinleşen düğüm sayısı
+        # Kaynak düğüm -> en kısa yol ağacı (en son kullanılan sonda)
+        self._trees: 'OrderedDict[int, ShortestPathTree]' = OrderedDict()
+        self.tree_cache_size: int = 8
+        self.version = 0  # Kenar eklendikçe veya ağaçlar geçersiz kılındıkça artar
         
-    def add_edge(self, from_node: int, to_node: int):
+    def add_edge(self, from_node: int, to_node: int, weight: float = 1.0):
         """
         İki düğüm arasına bağlantı ekler.
         
         Args:
             from_node (int): Başlangıç düğümü
             to_node (int): Bitiş düğümü
+            weight (float): Kenar maliyeti (aynı kenar tekrar eklenirse en küçüğü tutulur)
         """
         self.graph[from_node].append(to_node)
         self.graph[to_node].append(from_node)  # Yönsüz graf
+        edge = (min(from_node, to_node), max(from_node, to_node))
+        self.weights[edge] = min(self.weights.get(edge, weight), weight)
+        self.version += 1
+        
+        # Yeni kenar mesafeleri yalnızca kısaltabilir; önbellekteki ağaçları onar
+        for tree in self._trees.values():
+            tree.insert_edge(self, from_node, to_node, weight)
+        
+    def edge_weight(self, from_node: int, to_node: int) -> float:
+        """
+        İki düğüm arasındaki kenarın maliyetini döndürür.
+        
+        Args:
+            from_node (int): Başlangıç düğümü
+            to_node (int): Bitiş düğümü
+            
+        Returns:
+            float: Kenar maliyeti (varsayılan 1.0)
+        """
+        return self.weights.get((min(from_node, to_node), max(from_node, to_node)), 1.0)
+        
+    def set_coordinates(self, node: int, x: float, y: float):
+        """
+        Düğümün düzlemdeki konumunu kaydeder (A* sezgiseli için).
+        
+        Args:
+            node (int): Düğüm
+            x (float): X koordinatı
+            y (float): Y koordinatı
+        """
+        self.coordinates[node] = (x, y)
+        
+    def neighbors(self, node: int) -> List[int]:
+        """
+        Bir düğümün komşularını ekleme sırasıyla döndürür.
+        
+        Args:
+            node (int): Düğüm
+            
+        Returns:
+            List[int]: Komşu düğümler
+        """
+        return self.graph[node]
+        
+    def weighted_neighbors(self, node: int) -> Iterator[Tuple[int, float]]:
+        """
+        Bir düğümün komşularını kenar maliyetleriyle birlikte döndürür.
+        
+        Args:
+            node (int): Düğüm
+            
+        Returns:
+            Iterator[Tuple[int, float]]: (komşu, maliyet) çiftleri
+        """
+        weights = self.weights
+        for neighbor in self.graph[node]:
+            edge = (node, neighbor) if node < neighbor else (neighbor, node)
+            yield neighbor, weights.get(edge, 1.0)
+        
+    def freeze(self) -> 'CSRGraph':
+        """
+        Grafı salt okunur, dizi tabanlı CSR düzenine dönüştürür.
+        
+        Returns:
+            CSRGraph: Aynı kenarlara ve komşu sırasına sahip kompakt graf
+        """
+        offsets = array('q', [0]) * (self.num_nodes + 1)
+        targets = array('i')
+        weights = array('d')
+        for node in range(self.num_nodes):
+            for neighbor, weight in self.weighted_neighbors(node):
+                targets.append(neighbor)
+                weights.append(weight)
+            offsets[node + 1] = len(targets)
+        return CSRGraph(self.num_nodes, offsets, targets, weights, dict(self.coordinates))
         
     def dijkstra(self, start: int, end: int) -> List[int]:
         """
@@ -42,6 +157,7 @@ class Graph:
         previous = {i: None for i in range(self.num_nodes)}
         
         pq = [(0, start)]  # Öncelik kuyruğu
+        settled = 0
         
         while pq:
             current_distance, current_node = heapq.heappop(pq)
@@ -51,15 +167,18 @@ class Graph:
                 
             if current_distance > distances[current_node]:
                 continue
+            settled += 1
                 
-            for neighbor in self.graph[current_node]:
-                new_distance = distances[current_node] + 1  # Her kenar 1 birim uzunluğunda
+            for neighbor, weight in self.weighted_neighbors(current_node):
+                new_distance = distances[current_node] + weight
                 
                 if new_distance < distances[neighbor]:
                     distances[neighbor] = new_distance
                     previous[neighbor] = current_node
                     heapq.heappush(pq, (new_distance, neighbor))
         
+        self.last_settled = settled
+        
         # Yolu geri oluştur
         path = []
         current = end
@@ -70,28 +189,699 @@ class Graph:
         
         return path
     
-    def get_alternative_paths(self, start: int, end: int, num_paths: int = 2) -> List[List[int]]:
+    def a_star(self, start: int, end: int, heuristic: Optional[Heuristic] = None) -> List[int]:
         """
-        Başlangıç ve bitiş noktaları arasında alternatif yollar bulur.
+        A* algoritması ile en kısa yolu bulur.
+        
+        Sezgisel verilmezse ve düğüm koordinatları varsa kuş uçuşu mesafe
+        kullanılır; hiçbiri yoksa arama Dijkstra'ya eşdeğerdir.
         
         Args:
             start (int): Başlangıç düğümü
             end (int): Bitiş düğümü
-            num_paths (int): Bulunacak alternatif yol sayısı
+            heuristic: Kabul edilebilir sezgisel fonksiyon h(düğüm, hedef)
+            
+        Returns:
+            List[int]: Bulunan yol (yol yoksa boş liste)
+        """
+        if heuristic is None:
+            heuristic = straight_line_heuristic(self.coordinates)
+            
+        distances = {start: 0.0}
+        previous = {start: None}
+        closed: Set[int] = set()
+        pq = [(heuristic(start, end), 0.0, start)]
+        
+        while pq:
+            _, current_distance, current_node = heapq.heappop(pq)
+            if current_node in closed:
+                continue
+            closed.add(current_node)
+            
+            if current_node == end:
+                break
+                
+            for neighbor, weight in self.weighted_neighbors(current_node):
+                if neighbor in closed:
+                    continue
+                new_distance = current_distance + weight
+                if new_distance < distances.get(neighbor, math.inf):
+                    distances[neighbor] = new_distance
+                    previous[neighbor] = current_node
+                    heapq.heappush(pq, (new_distance + heuristic(neighbor, end), new_distance, neighbor))
+                    
+        self.last_settled = len(closed)
+        
+        if end not in closed:
+            return []
+        path = []
+        current = end
+        while current is not None:
+            path.append(current)
+            current = previous[current]
+        path.reverse()
+        return path
+    
+    def bidirectional_dijkstra(self, start: int, end: int) -> List[int]:
+        """
+        İki yönlü Dijkstra ile en kısa yolu bulur.
+        
+        Aramalar başlangıç ve bitişten aynı anda ilerler; iki kuyruğun en küçük
+        anahtarları toplamı bulunan en iyi yolu aştığında durulur.
+        
+        Args:
+            start (int): Başlangıç düğümü
+            end (int): Bitiş düğümü
+            
+        Returns:
+            List[int]: Bulunan yol (yol yoksa boş liste)
+        """
+        if start == end:
+            self.last_settled = 1
+            return [start]
+            
+        distances = ({start: 0.0}, {end: 0.0})
+        previous = ({start: None}, {end: None})
+        settled = (set(), set())
+        queues = ([(0.0, start)], [(0.0, end)])
+        best = math.inf
+        meeting = None  # (taraf, düğüm, komşu): en iyi yolu birleştiren kenar
+        
+        while queues[0] and queues[1]:
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+            # Kuyruğu daha kısa olan taraftan ilerle
+            side = 0 if len(queues[0]) <= len(queues[1]) else 1
+            current_distance, current_node = heapq.heappop(queues[side])
+            if current_node in settled[side]:
+                continue
+            settled[side].add(current_node)
+            
+            own_distances = distances[side]
+            other_distances = distances[1 - side]
+            for neighbor, weight in self.weighted_neighbors(current_node):
+                new_distance = current_distance + weight
+                if new_distance < own_distances.get(neighbor, math.inf):
+                    own_distances[neighbor] = new_distance
+                    previous[side][neighbor] = current_node
+                    heapq.heappush(queues[side], (new_distance, neighbor))
+                if neighbor in other_distances and new_distance + other_distances[neighbor] < best:
+                    best = new_distance + other_distances[neighbor]
+                    meeting = (side, current_node, neighbor)
+                    
+        self.last_settled = len(settled[0]) + len(settled[1])
+        
+        if meeting is None:
+            return []
+        side, node, neighbor = meeting
+        if side == 1:
+            node, neighbor = neighbor, node
+        # İleri yarı: başlangıç -> node, geri yarı: neighbor -> bitiş
+        path = []
+        current = node
+        while current is not None:
+            path.append(current)
+            current = previous[0][current]
+        path.reverse()
+        current = neighbor
+        while current is not None:
+            path.append(current)
+            current = previous[1][current]
+        return path
+    
+    def shortest_path(self, start: int, end: int, method: str = 'dijkstra',
+                      heuristic: Optional[Heuristic] = None) -> List[int]:
+        """
+        Seçilen arama motoruyla en kısa yolu bulur.
+        
+        Args:
+            start (int): Başlangıç düğümü
+            end (int): Bitiş düğümü
+            method (str): 'dijkstra', 'astar' veya 'bidirectional'
+            heuristic: Yalnızca 'astar' için sezgisel fonksiyon
+            
+        Returns:
+            List[int]: Bulunan yol
+        """
+        if method == 'dijkstra':
+            return self.dijkstra(start, end)
+        if method == 'astar':
+            return self.a_star(start, end, heuristic)
+        if method == 'bidirectional':
+            return self.bidirectional_dijkstra(start, end)
+        raise ValueError(f"Bilinmeyen arama yöntemi: {method} (seçenekler: {', '.join(SEARCH_METHODS)})")
+        
+    def path_cost(self, path: List[int]) -> float:
+        """
+        Bir yolun toplam kenar maliyetini hesaplar.
+        
+        Args:
+            path (List[int]): Yol düğümleri
+            
+        Returns:
+            float: Toplam maliyet
+        """
+        return sum(self.edge_weight(path[i], path[i + 1]) for i in range(len(path) - 1))
+    
+    def shortest_path_tree(self, source: int) -> 'ShortestPathTree':
+        """
+        Kaynak düğümden tüm düğümlere en kısa yol ağacını döndürür.
+        
+        Ağaç ilk istekte tek bir tam Dijkstra ile kurulur ve önbelleğe alınır;
+        sonraki sorgular yol uzunluğu kadar sürede yanıtlanır. `add_edge` ile
+        eklenen kenarlar önbellekteki ağaçları artımlı olarak onarır. Komşuluk
+        listeleri doğrudan değiştirilirse `invalidate_trees` çağrılmalıdır.
+        
+        Args:
+            source (int): Kaynak düğüm
+            
+        Returns:
+            ShortestPathTree: Kaynağa ait en kısa yol ağacı
+        """
+        tree = self._trees.get(source)
+        if tree is not None:
+            self._trees.move_to_end(source)
+            return tree
+            
+        tree = ShortestPathTree.build(self, source)
+        self._trees[source] = tree
+        while len(self._trees) > self.tree_cache_size:
+            self._trees.popitem(last=False)
+        return tree
+        
+    def invalidate_trees(self):
+        """Önbellekteki tüm en kısa yol ağaçlarını siler (graf doğrudan değiştirildiğinde)"""
+        self._trees.clear()
+        self.version += 1
+        
+    def _first_path(self, start: int, end: int, method: str,
+                    heuristic: Optional[Heuristic]) -> List[int]:
+        """Alternatif yol üretimi için ilk (en kısa) yolu seçilen motordan alır"""
+        if method == 'dijkstra':
+            # Aynı kaynaktan tekrarlanan sorgular önbellekteki ağaçtan yanıtlanır
+            return self.shortest_path_tree(start).path_to(end)
+        path = self.shortest_path(start, end, method, heuristic)
+        return path if path and path[0] == start else []
+        
+    def _restricted_search(self, start: int, end: int, banned_nodes: Set[int],
+                           banned_edges: Set[Tuple[int, int]],
+                           heuristic: Optional[Heuristic] = None) -> Tuple[float, List[int]]:
+        """
+        Yasaklı düğüm ve kenarları atlayarak en kısa yolu bulur.
+        
+        Sezgisel verilirse A*, verilmezse Dijkstra gibi çalışır. Yalnızca
+        dokunulan düğümler için bellek ayırır.
+        
+        Args:
+            start (int): Başlangıç düğümü
+            end (int): Bitiş düğümü
+            banned_nodes: Kullanılamayacak düğümler
+            banned_edges: Kullanılamayacak yönlü kenarlar (u, v)
+            heuristic: Kabul edilebilir sezgisel fonksiyon
+            
+        Returns:
+            Tuple[float, List[int]]: (yol maliyeti, yol); yol yoksa (sonsuz, [])
+        """
+        distances = {start: 0.0}
+        previous = {start: None}
+        closed: Set[int] = set()
+        pq = [(heuristic(start, end) if heuristic else 0.0, 0.0, start)]
+        
+        while pq:
+            _, current_distance, current_node = heapq.heappop(pq)
+            if current_node in closed:
+                continue
+            closed.add(current_node)
+            if current_node == end:
+                break
+            for neighbor, weight in self.weighted_neighbors(current_node):
+                if neighbor in closed or neighbor in banned_nodes or (current_node, neighbor) in banned_edges:
+                    continue
+                new_distance = current_distance + weight
+                if new_distance < distances.get(neighbor, math.inf):
+                    distances[neighbor] = new_distance
+                    previous[neighbor] = current_node
+                    estimate = new_distance + (heuristic(neighbor, end) if heuristic else 0.0)
+                    heapq.heappush(pq, (estimate, new_distance, neighbor))
+                    
+        if end not in closed:
+            return math.inf, []
+        path = []
+        current = end
+        while current is not None:
+            path.append(current)
+            current = previous[current]
+        path.reverse()
+        return distances[end], path
+        
+    def iter_simple_paths(self, start: int, end: int, method: str = 'dijkstra',
+                          heuristic: Optional[Heuristic] = None) -> Iterator[List[int]]:
+        """
+        Döngüsüz yolları artan maliyet sırasıyla tembel olarak üretir (Yen).
+        
+        Lawler iyileştirmesi uygulanır: yeni kabul edilen bir yolun sapma
+        noktasından önceki sapma (spur) aramaları önceki turlarda zaten
+        yapıldığı için tekrarlanmaz. Kabul edilen yolların önekleri bir ağaçta
+        (trie) tutulur; böylece her sapma noktasında yasaklanacak kenarlar yol
+        listesini taramadan bulunur. Bir sonraki yol ancak istendiğinde hesaplanır.
+        
+        Args:
+            start (int): Başlangıç düğümü
+            end (int): Bitiş düğümü
+            method (str): İlk yol için arama motoru
+            heuristic: 'astar' için sezgisel fonksiyon (sapma aramalarında da kullanılır)
+            
+        Returns:
+            Iterator[List[int]]: Yollar
+        """
+        path = self._first_path(start, end, method, heuristic)
+        if not path:
+            return
+        yield path
+        
+        if method == 'astar' and heuristic is None:
+            heuristic = straight_line_heuristic(self.coordinates)
+        spur_heuristic = heuristic if method == 'astar' else None
+        
+        prefix_trie: Dict[int, dict] = {}
+        candidates: List[Tuple[float, int, List[int], int]] = []
+        seen = {tuple(path)}
+        tie_breaker = count()
+        deviation = 0
+        
+        while True:
+            # Kabul edilen yolu önek ağacına ekle
+            node = prefix_trie
+            for hop in path:
+                node = node.setdefault(hop, {})
+                
+            root_costs = [0.0]
+            for i in range(len(path) - 1):
+                root_costs.append(root_costs[-1] + self.edge_weight(path[i], path[i + 1]))
+                
+            trie_node = prefix_trie
+            for i in range(len(path) - 1):
+                trie_node = trie_node[path[i]]
+                if i < deviation:
+                    continue
+                spur = path[i]
+                banned_edges = {(spur, nxt) for nxt in trie_node}
+                banned_nodes = set(path[:i])
+                spur_cost, spur_path = self._restricted_search(
+                    spur, end, banned_nodes, banned_edges, spur_heuristic)
+                if not spur_path:
+                    continue
+                candidate = path[:i] + spur_path
+                key = tuple(candidate)
+                if key in seen:
+                    continue
+                seen.add(key)
+                heapq.heappush(candidates, (root_costs[i] + spur_cost, next(tie_breaker), candidate, i))
+                
+            if not candidates:
+                return
+            _, _, path, deviation = heapq.heappop(candidates)
+            yield path
+            
+    def iter_edge_disjoint_paths(self, start: int, end: int, method: str = 'dijkstra',
+                                 heuristic: Optional[Heuristic] = None) -> Iterator[List[int]]:
+        """
+        Birbiriyle kenar paylaşmayan yolları tembel olarak üretir.
+        
+        Her yol bulunduktan sonra kenarları yasaklanır ve kalan grafta yeniden
+        arama yapılır (açgözlü yaklaşım).
+        
+        Args:
+            start (int): Başlangıç düğümü
+            end (int): Bitiş düğümü
+            method (str): İlk yol için arama motoru
+            heuristic: 'astar' için sezgisel fonksiyon
             
         Returns:
-            List[List[int]]: Alternatif yollar listesi
+            Iterator[List[int]]: Yollar
         """
-        paths = []
-        visited_edges = set()
+        path = self._first_path(start, end, method, heuristic)
+        if method == 'astar' and heuristic is None:
+            heuristic = straight_line_heuristic(self.coordinates)
+        spur_heuristic = heuristic if method == 'astar' else None
+        visited_edges: Set[Tuple[int, int]] = set()
         
-        for _ in range(num_paths):
-            path = self.dijkstra(start, end)
-            paths.append(path)
+        while len(path) > 1:
+            yield path
             
             # Bu yoldaki kenarları işaretle
             for i in range(len(path) - 1):
                 visited_edges.add((path[i], path[i + 1]))
                 visited_edges.add((path[i + 1], path[i]))
+                
+            _, path = self._restricted_search(start, end, set(), visited_edges, spur_heuristic)
+            
+        if path and not visited_edges:
+            yield path  # Başlangıç ve bitiş aynı düğüm
+        
+    def get_alternative_paths(self, start: int, end: int, num_paths: int = 2,
+                              method: str = 'dijkstra',
+                              heuristic: Optional[Heuristic] = None,
+                              mode: str = 'yen') -> List[List[int]]:
+        """
+        Başlangıç ve bitiş noktaları arasında alternatif yollar bulur.
+        
+        Args:
+            start (int): Başlangıç düğümü
+            end (int): Bitiş düğümü
+            num_paths (int): Bulunacak alternatif yol sayısı
+            method (str): Arama motoru ('dijkstra', 'astar', 'bidirectional')
+            heuristic: 'astar' için sezgisel fonksiyon
+            mode (str): 'yen' (k en kısa döngüsüz yol) veya 'disjoint' (kenar ayrık yollar)
+            
+        Returns:
+            List[List[int]]: Birbirinden farklı alternatif yollar (en fazla num_paths adet)
+        """
+        if mode == 'yen':
+            paths = self.iter_simple_paths(start, end, method, heuristic)
+        elif mode == 'disjoint':
+            paths = self.iter_edge_disjoint_paths(start, end, method, heuristic)
+        else:
+            raise ValueError(f"Bilinmeyen yol modu: {mode} (seçenekler: {', '.join(PATH_MODES)})")
+            
+        return list(islice(paths, num_paths))
+
+class ShortestPathTree:
+    """
+    Tek kaynaklı en kısa yol ağacı.
+    
+    Her düğüm için kaynağa olan mesafeyi ve ağaçtaki ebeveynini dizilerde tutar.
+    """
+    def __init__(self, source: int, distances: array, parents: array):
+        """
+        Args:
+            source (int): Kaynak düğüm
+            distances (array): Düğüm başına mesafe (ulaşılamayanlar için sonsuz)
+            parents (array): Düğüm başına ebeveyn (kök ve ulaşılamayanlar için -1)
+        """
+        self.source = source
+        self.distances = distances
+        self.parents = parents
+        
+    @classmethod
+    def build(cls, graph: Graph, source: int) -> 'ShortestPathTree':
+        """
+        Tam Dijkstra çalıştırarak ağacı oluşturur.
+        
+        Args:
+            graph (Graph): Graf
+            source (int): Kaynak düğüm
+            
+        Returns:
+            ShortestPathTree: Oluşturulan ağaç
+        """
+        distances = array('d', [math.inf]) * graph.num_nodes
+        parents = array('i', [-1]) * graph.num_nodes
+        distances[source] = 0.0
+        tree = cls(source, distances, parents)
+        tree._propagate(graph, [(0.0, source)])
+        return tree
+        
+    def _propagate(self, graph: Graph, pq: List[Tuple[float, int]]):
+        """Kuyruktaki düğümlerden başlayarak mesafe azalmalarını yayar"""
+        distances = self.distances
+        parents = self.parents
+        while pq:
+            current_distance, current_node = heapq.heappop(pq)
+            if current_distance > distances[current_node]:
+                continue
+            for neighbor, weight in graph.weighted_neighbors(current_node):
+                new_distance = current_distance + weight
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    parents[neighbor] = current_node
+                    heapq.heappush(pq, (new_distance, neighbor))
+                    
+    def insert_edge(self, graph: Graph, from_node: int, to_node: int, weight: float):
+        """
+        Yeni eklenen (veya ucuzlayan) kenar sonrası ağacı onarır.
+        
+        Kenar eklemek mesafeleri yalnızca azaltabildiğinden, sadece kısalan
+        düğümlerden başlayan sınırlı bir Dijkstra yeterlidir.
+        
+        Args:
+            graph (Graph): Kenarın eklendiği graf
+            from_node (int): Başlangıç düğümü
+            to_node (int): Bitiş düğümü
+            weight (float): Kenar maliyeti
+        """
+        pq = []
+        for u, v in ((from_node, to_node), (to_node, from_node)):
+            new_distance = self.distances[u] + weight
+            if new_distance < self.distances[v]:
+                self.distances[v] = new_distance
+                self.parents[v] = u
+                pq.append((new_distance, v))
+        if pq:
+            heapq.heapify(pq)
+            self._propagate(graph, pq)
+            
+    def distance(self, target: int) -> float:
+        """
+        Kaynaktan hedefe en kısa mesafeyi döndürür.
+        
+        Args:
+            target (int): Hedef düğüm
+            
+        Returns:
+            float: Mesafe (ulaşılamıyorsa sonsuz)
+        """
+        return self.distances[target]
+        
+    def path_to(self, target: int) -> List[int]:
+        """
+        Kaynaktan hedefe en kısa yolu ağaçtan okur.
+        
+        Args:
+            target (int): Hedef düğüm
+            
+        Returns:
+            List[int]: Bulunan yol (yol yoksa boş liste)
+        """
+        if self.distances[target] == math.inf:
+            return []
+        path = []
+        current = target
+        while current != -1:
+            path.append(current)
+            current = self.parents[current]
+        path.reverse()
+        return path
+
+
+class _CSRAdjacency(Mapping):
+    """CSRGraph için `Graph.graph` sözlüğüyle uyumlu salt okunur görünüm"""
+    def __init__(self, csr: 'CSRGraph'):
+        self._csr = csr
+        
+    def __getitem__(self, node: int) -> List[int]:
+        if not 0 <= node < self._csr.num_nodes:
+            raise KeyError(node)
+        return self._csr.neighbors(node)
+        
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._csr.num_nodes))
+        
+    def __len__(self) -> int:
+        return self._csr.num_nodes
+
+
+class CSRGraph(Graph):
+    """
+    Sıkıştırılmış satır (CSR) düzeninde saklanan salt okunur graf.
+    
+    Komşuluk listeleri tek bir `targets` dizisinde art arda tutulur; `offsets[i]`
+    ile `offsets[i + 1]` arası i düğümünün komşularıdır. Dijkstra için mesafe ve
+    önceki-düğüm tamponları bir kez ayrılır ve sorgular arasında yeniden kullanılır;
+    hangi girdilerin geçerli olduğu sorgu damgası (`_stamp`) ile izlenir, böylece
+    her sorguda n boyutlu sıfırlama yapılmaz.
+    """
+    def __init__(self, num_nodes: int, offsets: array, targets: array,
+                 weights: Optional[array] = None,
+                 coordinates: Optional[Dict[int, Tuple[float, float]]] = None):
+        """
+        Args:
+            num_nodes (int): Graf içindeki toplam düğüm sayısı
+            offsets (array): num_nodes + 1 uzunluğunda başlangıç indeksleri
+            targets (array): Art arda dizilmiş komşu düğümler
+            weights (array): `targets` ile hizalı kenar maliyetleri (varsayılan 1.0)
+            coordinates: Düğüm -> (x, y) eşlemesi
+        """
+        self.num_nodes = num_nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.edge_costs = weights if weights is not None else array('d', [1.0]) * len(targets)
+        self.coordinates = coordinates if coordinates is not None else {}
+        self.graph = _CSRAdjacency(self)
+        self.last_settled = 0
+        self._trees = OrderedDict()
+        self.tree_cache_size = 8
+        self.version = 0
+        
+        # Sorgular arasında yeniden kullanılan tamponlar
+        self._distances = array('d', [0.0]) * num_nodes
+        self._previous = array('i', [-1]) * num_nodes
+        self._stamp = array('Q', [0]) * num_nodes
+        self._query = 0
+        
+    def add_edge(self, from_node: int, to_node: int, weight: float = 1.0):
+        raise TypeError("CSRGraph salt okunurdur; kenarları GraphBuilder ile ekleyin")
+        
+    def neighbors(self, node: int) -> List[int]:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]].tolist()
+        
+    def weighted_neighbors(self, node: int) -> Iterator[Tuple[int, float]]:
+        begin, end = self.offsets[node], self.offsets[node + 1]
+        return zip(self.targets[begin:end], self.edge_costs[begin:end])
+        
+    def edge_weight(self, from_node: int, to_node: int) -> float:
+        costs = [weight for neighbor, weight in self.weighted_neighbors(from_node) if neighbor == to_node]
+        return min(costs) if costs else 1.0
+        
+    def set_coordinates(self, node: int, x: float, y: float):
+        self.coordinates[node] = (x, y)
+        
+    def freeze(self) -> 'CSRGraph':
+        return self
+        
+    def dijkstra(self, start: int, end: int) -> List[int]:
+        """
+        Dijkstra algoritması ile en kısa yolu bulur.
+        
+        `Graph.dijkstra` ile aynı sonucu verir, ancak sorgu başına n boyutlu
+        sözlük ayırmak yerine paylaşılan tamponları kullanır.
+        
+        Args:
+            start (int): Başlangıç düğümü
+            end (int): Bitiş düğümü
+            
+        Returns:
+            List[int]: Bulunan yol
+        """
+        self._query += 1
+        query = self._query
+        distances = self._distances
+        previous = self._previous
+        stamp = self._stamp
+        offsets = self.offsets
+        targets = self.targets
+        costs = self.edge_costs
+        
+        distances[start] = 0
+        previous[start] = -1
+        stamp[start] = query
+        
+        pq = [(0, start)]  # Öncelik kuyruğu
+        settled = 0
         
-        return paths
+        while pq:
+            current_distance, current_node = heapq.heappop(pq)
+            
+            if current_node == end:
+                break
+                
+            if current_distance > distances[current_node]:
+                continue
+            settled += 1
+                
+            for k in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[k]
+                new_distance = current_distance + costs[k]
+                if stamp[neighbor] != query or new_distance < distances[neighbor]:
+                    stamp[neighbor] = query
+                    distances[neighbor] = new_distance
+                    previous[neighbor] = current_node
+                    heapq.heappush(pq, (new_distance, neighbor))
+                    
+        self.last_settled = settled
+        
+        # Yolu geri oluştur
+        path = [end]
+        if stamp[end] == query:
+            current = previous[end]
+            while current != -1:
+                path.append(current)
+                current = previous[current]
+        path.reverse()
+        
+        return path
+
+
+class GraphBuilder:
+    """
+    Kenarları kompakt dizilerde biriktirip tek seferde CSRGraph üreten yapıcı.
+    
+    Büyük haritalarda önce `Graph` oluşturup sonra dondurmak, ara sözlük ve
+    liste nesneleri yüzünden gereksiz bellek harcar; bu sınıf `add_edge`
+    çağrılarını doğrudan CSR düzenine aktarır.
+    """
+    def __init__(self, num_nodes: int):
+        """
+        Args:
+            num_nodes (int): Graf içindeki toplam düğüm sayısı
+        """
+        self.num_nodes = num_nodes
+        self.coordinates: Dict[int, Tuple[float, float]] = {}
+        self._sources = array('i')
+        self._targets = array('i')
+        self._weights = array('d')
+        
+    def add_edge(self, from_node: int, to_node: int, weight: float = 1.0):
+        """
+        İki düğüm arasına bağlantı ekler.
+        
+        Args:
+            from_node (int): Başlangıç düğümü
+            to_node (int): Bitiş düğümü
+            weight (float): Kenar maliyeti
+        """
+        # Graph.add_edge ile aynı sıra: önce ileri, sonra geri yön
+        self._sources.append(from_node)
+        self._targets.append(to_node)
+        self._sources.append(to_node)
+        self._targets.append(from_node)
+        self._weights.append(weight)
+        self._weights.append(weight)
+        
+    def set_coordinates(self, node: int, x: float, y: float):
+        """
+        Düğümün düzlemdeki konumunu kaydeder.
+        
+        Args:
+            node (int): Düğüm
+            x (float): X koordinatı
+            y (float): Y koordinatı
+        """
+        self.coordinates[node] = (x, y)
+        
+    def build(self) -> CSRGraph:
+        """
+        Biriken kenarlardan CSRGraph oluşturur.
+        
+        Sayma sıralaması kararlı olduğundan her düğümün komşu sırası, aynı
+        `add_edge` çağrılarıyla oluşturulmuş bir `Graph` ile aynıdır.
+        
+        Returns:
+            CSRGraph: Dondurulmuş graf
+        """
+        n = self.num_nodes
+        offsets = array('q', [0]) * (n + 1)
+        for source in self._sources:
+            offsets[source + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+            
+        cursor = array('q', offsets[:n])
+        targets = array('i', [0]) * len(self._targets)
+        weights = array('d', [0.0]) * len(self._targets)
+        for source, target, weight in zip(self._sources, self._targets, self._weights):
+            targets[cursor[source]] = target
+            weights[cursor[source]] = weight
+            cursor[source] += 1
+            
+        return CSRGraph(n, offsets, targets, weights, dict(self.coordinates))
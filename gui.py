@@ -7,8 +7,7 @@ from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QColor, QPalette
 from main import RescueDroneSimulation
 from tasks import TaskStatus
-import random
-import time
+from events import EventKind
 
 class DroneSimulationGUI(QMainWindow):
     def __init__(self):
@@ -198,8 +197,10 @@ class DroneSimulationGUI(QMainWindow):
                 status_item.setBackground(QColor("#90EE90"))  # Açık yeşil
             elif status_text == "IN_PROGRESS":
                 status_item.setBackground(QColor("#FFD700"))  # Altın sarısı
-            elif status_text == "ERROR":
+            elif status_text == "FAILED":
                 status_item.setBackground(QColor("#FFB6C1"))  # Açık kırmızı
+            elif status_text == "CANCELLED":
+                status_item.setBackground(QColor("#D3D3D3"))  # Açık gri
             self.task_table.setItem(row, 3, status_item)
             
     def start_simulation(self):
@@ -237,58 +238,40 @@ class DroneSimulationGUI(QMainWindow):
     def update_simulation(self):
         if self.is_running:
             try:
-                # Mevcut görevi tamamla
-                for task_id, task in self.simulation.task_queue.tasks.items():
-                    if task.status == TaskStatus.IN_PROGRESS:
-                        try:
-                            self.log_text.append(f"\nGörev #{task.id}: {task.description}")
-                            self.log_text.append(f"Hedef: Düğüm {task.target_node}")
-                            
-                            # Alternatif rotaları bul
-                            paths = self.simulation.graph.get_alternative_paths(0, task.target_node)
-                            
-                            # En iyi rotayı seç
-                            best_path = self.simulation.route_selector.select_best_route(paths)
-                            self.log_text.append(f"Seçilen rota: {best_path}")
-                            
-                            # Rotayı takip et
-                            for i in range(len(best_path) - 1):
-                                current = best_path[i]
-                                next_node = best_path[i + 1]
-                                
-                                # Konum bilgisini ilet
-                                location_data = f"Konum: {current} -> {next_node}"
-                                encoded_data = self.simulation.hamming.encode(location_data)
-                                
-                                # Hata simülasyonu
-                                if random.random() < 0.2:  # %20 hata olasılığı
-                                    encoded_data = self.simulation.hamming.simulate_error(encoded_data)
-                                    self.log_text.append("Konum verisi bozuldu!")
-                                
-                                # Hatayı düzelt
-                                decoded_data = self.simulation.hamming.decode(encoded_data)
-                                self.log_text.append(f"İletilen veri: {decoded_data}")
-                                
-                                # Engel kontrolü
-                                if self.simulation.monte_carlo.is_path_blocked(current, next_node):
-                                    self.log_text.append(f"Uyarı: {current} -> {next_node} arası engelli!")
-                                    delay = self.simulation.monte_carlo.get_delay_factor(current, next_node)
-                                    time.sleep(delay)
-                            
-                            # Görevi tamamla
-                            self.simulation.task_queue.update_task_status(task_id, TaskStatus.COMPLETED)
-                            self.log_text.append(f"Görev #{task.id} tamamlandı!")
-                            
-                            # İstatistikleri göster
-                            stats = self.simulation.task_queue.get_task_stats()
-                            self.log_text.append("\nGörev İstatistikleri:")
-                            for status, count in stats.items():
-                                self.log_text.append(f"{status}: {count}")
-                            
-                        except Exception as e:
-                            self.log_text.append(f"Görev çalıştırılırken hata oluştu: {str(e)}")
-                            self.simulation.task_queue.update_task_status(task_id, TaskStatus.ERROR)
-                        break
+                # Devam eden görevi tamamla (durum kümesinden, tüm görevler taranmadan)
+                for task in self.simulation.task_queue.tasks_by_status(TaskStatus.IN_PROGRESS):
+                    task_id = task.id
+                    try:
+                        self.log_text.append(f"\nGörev #{task.id}: {task.description}")
+                        self.log_text.append(f"Hedef: Düğüm {task.target_node}")
+                        
+                        # Alternatif rotaları bul
+                        paths = self.simulation.graph.get_alternative_paths(0, task.target_node)
+                        
+                        # En iyi rotayı seç
+                        best_path = self.simulation.route_selector.select_best_route(paths)
+                        self.log_text.append(f"Seçilen rota: {best_path}")
+                        
+                        # Rotayı sanal saatte takip et; engel beklemeleri arayüzü dondurmaz
+                        events = self.simulation.events
+                        events.process(self.simulation.fly_route(best_path, log=self.log_text.append))
+                        events.run()
+                        
+                        # Görevi tamamla
+                        self.simulation.task_queue.update_task_status(task_id, TaskStatus.COMPLETED)
+                        events.record(EventKind.TASK_COMPLETED, task_id=task_id, target=task.target_node)
+                        self.log_text.append(f"Görev #{task.id} tamamlandı! (t = {events.now:.1f} s)")
+                        
+                        # İstatistikleri göster
+                        stats = self.simulation.task_queue.get_task_stats()
+                        self.log_text.append("\nGörev İstatistikleri:")
+                        for status, count in stats.items():
+                            self.log_text.append(f"{status}: {count}")
+                        
+                    except Exception as e:
+                        self.log_text.append(f"Görev çalıştırılırken hata oluştu: {str(e)}")
+                        self.simulation.task_queue.update_task_status(task_id, TaskStatus.FAILED)
+                    break
                 
                 # Yeni görev başlat
                 task = self.simulation.task_queue.get_next_task()
@@ -1,8 +1,420 @@
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+FRAME_BLOCK_BYTES = 8                # SECDED(72, 64) bloğu başına veri baytı
+_FRAME_HEADER = struct.Struct('>I')  # Çerçevenin başındaki veri uzunluğu
+_SECDED_CODE_BITS = 71               # Genişletilmiş koddan önceki Hamming(71, 64)
+_SECDED_WORD_BYTES = 9               # Bir SECDED kod sözcüğünün bayt uzunluğu
+_STREAM_TRAILER = struct.Struct('>Q')  # Akışın sonundaki toplam veri uzunluğu
+
+@lru_cache(maxsize=64)
+def _layout(code_bits: int) -> Tuple[List[Tuple[int, int, int]], List[Tuple[int, int, int]]]:
+    """
+    Belirli uzunluktaki kod sözcüğü için önceden hesaplanmış yerleşim tabloları.
+    
+    Kod sözcüğü tamsayıda en anlamlı bitten başlayarak tutulur: 1 numaralı
+    konum `code_bits - 1` numaralı bittir. İki kuvveti konumlar arasındaki veri
+    bitleri bitişik olduğundan veri, bit bit değil parça parça yerleştirilir.
+    
+    Returns:
+        Tuple: (veri parçaları [(veri kaydırması, kod kaydırması, maske)],
+                parite bitleri [(konum, parite biti, kapsadığı konumların maskesi)])
+    """
+    data_bits = code_bits - code_bits.bit_length()
+    chunks = []
+    parities = []
+    copied = 0
+    pos = 1
+    while pos <= code_bits:
+        # pos+1 .. 2*pos-1 konumları tek parça veri bitidir
+        length = min(2 * pos - 1, code_bits) - pos
+        if length > 0:
+            copied += length
+            chunks.append((data_bits - copied, code_bits - (pos + length), (1 << length) - 1))
+        # j & pos koşulu 2*pos periyotla tekrar eder: pos sıfır, pos bir
+        pattern = ('0' * pos + '1' * pos) * (code_bits // (2 * pos) + 1)
+        parities.append((pos, 1 << (code_bits - pos), int(pattern[1:code_bits + 1], 2)))
+        pos *= 2
+    return chunks, parities
+
+def _gf2_matmul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """GF(2) üzerinde matris çarpımı (float32 BLAS; 2^24'e kadar toplamlar kesindir)"""
+    return ((a.astype(np.float32) @ b.astype(np.float32)).astype(np.int64) & 1).astype(np.uint8)
+
+@lru_cache(maxsize=64)
+def _matrices(code_bits: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Kod sözcüğü uzunluğu için veri konumları ve parite denetim matrisi.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (veri konumları, denetim matrisi);
+            matrisin i. satırı 2^i paritesinin kapsadığı 1..code_bits konumlarıdır
+    """
+    positions = np.arange(1, code_bits + 1)
+    data_positions = positions[positions & (positions - 1) != 0]
+    check = (positions[None, :] >> np.arange(code_bits.bit_length())[:, None]) & 1
+    return data_positions, check.astype(np.uint8)
+
+@lru_cache(maxsize=64)
+def _data_runs(code_bits: int) -> List[Tuple[int, int, int]]:
+    """İki kuvveti konumlar arasındaki bitişik veri sütunları: [(veri sütunu, kod sütunu, uzunluk)]"""
+    runs = []
+    copied = 0
+    pos = 1
+    while pos < code_bits:
+        length = min(2 * pos - 1, code_bits) - pos
+        if length > 0:
+            runs.append((copied, pos, length))
+            copied += length
+        pos *= 2
+    return runs
+
+def _extract_data(code: np.ndarray) -> np.ndarray:
+    """(satır, code_bits) kod sözcüklerinden veri bitlerini sütun dilimleriyle toplar"""
+    columns = [code[:, start:start + length] for _, start, length in _data_runs(code.shape[1])]
+    return np.concatenate(columns, axis=1) if columns else code[:, :0].copy()
+
+def _encode_bits(bits: np.ndarray, code_bits: int) -> np.ndarray:
+    """(satır, veri biti) dizisini (satır, code_bits) kod sözcüklerine kodlar; p. konum p-1. sütundur"""
+    data_positions, check = _matrices(code_bits)
+    code = np.zeros((len(bits), code_bits), dtype=np.uint8)
+    # Dağınık indeksleme yerine bitişik sütun dilimleri kopyalanır
+    for data_start, code_start, length in _data_runs(code_bits):
+        code[:, code_start:code_start + length] = bits[:, data_start:data_start + length]
+    code[:, (1 << np.arange(len(check))) - 1] = _gf2_matmul(bits, check[:, data_positions - 1].T)
+    return code
+
+def _syndromes(code: np.ndarray) -> np.ndarray:
+    """(satır, code_bits) kod sözcüklerinin sendromları (hatalı konum; hata yoksa 0)"""
+    _, check = _matrices(code.shape[1])
+    return _gf2_matmul(code, check.T).astype(np.int64) @ (1 << np.arange(len(check)))
+
+@lru_cache(maxsize=1)
+def _secded_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sistematik SECDED(72, 64) için bayt tabanlı kodlama ve sendrom tabloları.
+    
+    Kod sözcüğü 8 veri baytı ve bir denetim baytıdır. Her veri biti
+    Hamming(71, 64) içindeki konumuna eşlenir; denetim baytının düşük 7 biti
+    bu konumların XOR'u (Hamming paritesi), en yüksek biti tüm sözcüğün
+    paritesidir. Böylece parite ve sendrom bit bit değil, bayt başına tablo
+    okumasıyla hesaplanır.
+    
+    Returns:
+        Tuple: (bayt katkıları (8, 256), bayt paritesi (256,),
+                sendrom -> düzeltilebilir mi (128,), sendrom -> veri baytı (128,),
+                sendrom -> bit maskesi (128,))
+    """
+    data_positions, _ = _matrices(_SECDED_CODE_BITS)
+    # Veri biti başına katkı: Hamming konumu ve veri paritesi için en yüksek bit
+    columns = (data_positions | 0x80).astype(np.uint8).reshape(8, 8)
+    value_bits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)
+    contributions = np.bitwise_xor.reduce(value_bits[None, :, :] * columns[:, None, :], axis=2)
+    parity = (value_bits.sum(axis=1) & 1).astype(np.uint8)
+    
+    correctable = np.zeros(128, dtype=bool)
+    correctable[0] = True  # Yalnızca genel parite biti bozuk
+    correctable[1 << np.arange(7)] = True  # Denetim bitlerinden biri bozuk
+    correctable[data_positions] = True
+    flip_byte = np.zeros(128, dtype=np.int64)
+    flip_mask = np.zeros(128, dtype=np.uint8)
+    flip_byte[data_positions] = np.arange(64) // 8
+    flip_mask[data_positions] = 0x80 >> (np.arange(64) % 8)
+    return contributions, parity, correctable, flip_byte, flip_mask
+
+def _secded_check(words: np.ndarray) -> np.ndarray:
+    """(blok, 8) veri baytlarının tablo katkılarının XOR'u (düşük 7 bit Hamming, en yüksek bit veri paritesi)"""
+    contributions = _secded_tables()[0]
+    return np.bitwise_xor.reduce(contributions[np.arange(FRAME_BLOCK_BYTES), words], axis=1)
+
+def _secded_encode(words: np.ndarray, out: np.ndarray):
+    """(blok, 8) veri baytlarını `out` içine (blok, 9) SECDED kod sözcükleri olarak yazar"""
+    parity = _secded_tables()[1]
+    check = _secded_check(words)
+    hamming = check & 0x7F
+    out[:, :FRAME_BLOCK_BYTES] = words
+    # Genel parite: veri paritesi ile Hamming paritelerinin paritesi
+    out[:, FRAME_BLOCK_BYTES] = hamming | ((check >> 7) ^ parity[hamming]) << 7
+
+def _secded_decode(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (blok, 9) SECDED kod sözcüklerini yerinde düzeltir; veri ilk 8 sütundadır.
+    
+    Returns:
+        Tuple: (düzeltilen bloklar, düzeltilemeyen bloklar)
+    """
+    _, parity, correctable, flip_byte, flip_mask = _secded_tables()
+    check = _secded_check(codes[:, :FRAME_BLOCK_BYTES])
+    received = codes[:, FRAME_BLOCK_BYTES]
+    syndrome = (check ^ received) & 0x7F
+    overall = (check >> 7) ^ parity[received]
+    # Tek hata: genel parite bozuk, sendrom hatalı konumu gösterir
+    single = overall == 1
+    corrected = np.flatnonzero(single & correctable[syndrome])
+    rows = corrected[flip_mask[syndrome[corrected]] != 0]
+    codes[rows, flip_byte[syndrome[rows]]] ^= flip_mask[syndrome[rows]]
+    # Genel parite tutarlı ama sendrom sıfır değil: çift (veya daha fazla) hata
+    uncorrectable = np.flatnonzero(~single & (syndrome != 0) | single & ~correctable[syndrome])
+    return corrected, uncorrectable
+
+@dataclass
+class FrameDecodeResult:
+    """`HammingCode.decode_frame` sonucu"""
+    data: bytes               # Çözülen veri (düzeltilemeyen bloklardaki baytlar güvenilmez)
+    corrected: List[int]      # Tek bit hatası düzeltilen bloklar
+    uncorrectable: List[int]  # Hata tespit edilen ama düzeltilemeyen bloklar
+    
+    @property
+    def ok(self) -> bool:
+        """Tüm bloklar doğru çözüldüyse True"""
+        return not self.uncorrectable
+        
+    def resend_ranges(self) -> List[Tuple[int, int]]:
+        """
+        Yeniden istenmesi gereken veri aralıklarını döndürür.
+        
+        Returns:
+            List[Tuple[int, int]]: Düzeltilemeyen blokların kapsadığı [başlangıç, bitiş) bayt aralıkları
+        """
+        ranges = []
+        for block in self.uncorrectable:
+            start = max(block * FRAME_BLOCK_BYTES - _FRAME_HEADER.size, 0)
+            end = min((block + 1) * FRAME_BLOCK_BYTES - _FRAME_HEADER.size, len(self.data))
+            if start < end:
+                ranges.append((start, end))
+        return ranges
+
+@dataclass
+class StreamDecodeChunk:
+    """`HammingCode.decode_stream` tarafından üretilen çözülmüş parça"""
+    offset: int               # Parçanın çözülmüş akıştaki bayt konumu
+    data: memoryview          # Çözülen veri (bir sonraki parçada üzerine yazılır)
+    corrected: List[int]      # Tek bit hatası düzeltilen bloklar (akış genelinde indeks)
+    uncorrectable: List[int]  # Düzeltilemeyen bloklar (akış genelinde indeks)
+
+def _read_into(source, view: memoryview) -> int:
+    """
+    Görünümü kaynaktan olabildiğince doldurur; okunan bayt sayısını döndürür.
+    
+    Kısa okumalar (soket, boru) akış bitene kadar tekrarlanır.
+    """
+    read = getattr(source, 'readinto', None) or getattr(source, 'recv_into')
+    filled = 0
+    while filled < len(view):
+        count = read(view[filled:])
+        if not count:
+            break
+        filled += count
+    return filled
+
+class _BufferReader:
+    """bytes, mmap veya memoryview gibi bellek tamponlarını kopyasız dilimleyerek okur"""
+    def __init__(self, buffer):
+        self.view = memoryview(buffer).cast('B')
+        self.position = 0
+        
+    def readinto(self, target: memoryview) -> int:
+        count = min(len(target), len(self.view) - self.position)
+        target[:count] = self.view[self.position:self.position + count]
+        self.position += count
+        return count
+
+def _stream_source(source):
+    """Kaynağı `readinto` arayüzüne uyarlar"""
+    if hasattr(source, 'readinto') or hasattr(source, 'recv_into'):
+        return source
+    return _BufferReader(source)
+
 class HammingCode:
     """
     Hamming Kod sınıfı, veri iletiminde hata tespiti ve düzeltmesi için kullanılır.
     Dronun konum bilgilerinin güvenli iletimini sağlar.
+    
+    Kodlayıcı bit paketli tamsayılar üzerinde çalışır: veri bitleri parça parça
+    yerleştirilir, parite bitleri ve sendrom önceden hesaplanmış konum
+    maskeleriyle bulunur. `encode`/`decode` metin arayüzü bunun ince bir
+    sarmalayıcısıdır ve eski '0'/'1' çıktısının aynısını üretir.
     """
+    @staticmethod
+    def code_length(data_bits: int) -> int:
+        """
+        Veri bit sayısı için kod sözcüğü uzunluğunu döndürür.
+        
+        Args:
+            data_bits (int): Veri bit sayısı
+            
+        Returns:
+            int: Kod sözcüğü bit sayısı
+        """
+        r = 1
+        while 2**r < data_bits + r + 1:
+            r += 1
+        return data_bits + r
+        
+    @staticmethod
+    def encode_int(data: int, data_bits: int) -> int:
+        """
+        Bit paketli veriyi Hamming kod ile kodlar.
+        
+        Args:
+            data (int): Veri (en anlamlı bit ilk veri bitidir)
+            data_bits (int): Veri bit sayısı
+            
+        Returns:
+            int: `code_length(data_bits)` bitlik kod sözcüğü
+        """
+        chunks, parities = _layout(HammingCode.code_length(data_bits))
+        code = 0
+        for data_shift, code_shift, mask in chunks:
+            code |= ((data >> data_shift) & mask) << code_shift
+        for _, bit, mask in parities:
+            if (code & mask).bit_count() & 1:
+                code |= bit
+        return code
+        
+    @staticmethod
+    def decode_int(code: int, code_bits: int) -> Tuple[int, int]:
+        """
+        Bit paketli kod sözcüğünü çözer ve tek bit hatayı düzeltir.
+        
+        Args:
+            code (int): Kod sözcüğü (en anlamlı bit 1 numaralı konumdur)
+            code_bits (int): Kod sözcüğü bit sayısı
+            
+        Returns:
+            Tuple[int, int]: (veri, hatalı konum; hata yoksa 0)
+        """
+        chunks, parities = _layout(code_bits)
+        # Sendrom doğrudan hatalı bitin konumudur
+        error_pos = 0
+        for pos, _, mask in parities:
+            if (code & mask).bit_count() & 1:
+                error_pos |= pos
+        if 0 < error_pos <= code_bits:
+            code ^= 1 << (code_bits - error_pos)
+            
+        data = 0
+        for data_shift, code_shift, mask in chunks:
+            data |= ((code >> code_shift) & mask) << data_shift
+        return data, error_pos
+        
+    @staticmethod
+    def encode_bytes(data: bytes) -> bytes:
+        """
+        Bayt dizisini Hamming kod ile kodlar.
+        
+        Args:
+            data (bytes): Kodlanacak veri
+            
+        Returns:
+            bytes: Kod sözcüğü (en anlamlı bitten başlayarak paketlenmiş,
+                son bayt sıfırlarla tamamlanmış)
+        """
+        data_bits = 8 * len(data)
+        code_bits = HammingCode.code_length(data_bits)
+        code = HammingCode.encode_int(int.from_bytes(data, 'big'), data_bits)
+        padding = -code_bits % 8
+        return (code << padding).to_bytes((code_bits + padding) // 8, 'big')
+        
+    @staticmethod
+    def decode_bytes(encoded: bytes) -> Tuple[bytes, int]:
+        """
+        `encode_bytes` çıktısını çözer ve tek bit hatayı düzeltir.
+        
+        Args:
+            encoded (bytes): Kod sözcüğü
+            
+        Returns:
+            Tuple[bytes, int]: (veri, hatalı konum; hata yoksa 0)
+        """
+        # Veri uzunluğu, paketlenmiş uzunluğu veren en büyük bayt sayısıdır
+        data_length = len(encoded)
+        while data_length > 0 and -(-HammingCode.code_length(8 * data_length) // 8) > len(encoded):
+            data_length -= 1
+        code_bits = HammingCode.code_length(8 * data_length)
+        code = int.from_bytes(encoded, 'big') >> (8 * len(encoded) - code_bits)
+        data, error_pos = HammingCode.decode_int(code, code_bits)
+        return data.to_bytes(data_length, 'big'), error_pos
+        
+    @staticmethod
+    def encode_many(frames: np.ndarray, packed: bool = True, chunk_frames: int = 1 << 16) -> np.ndarray:
+        """
+        Eşit uzunluktaki çok sayıda çerçeveyi tek seferde kodlar.
+        
+        Parite bitleri tüm çerçeveler için GF(2) üzerinde tek bir matris
+        çarpımıyla hesaplanır; bellek kullanımı `chunk_frames` ile sınırlıdır.
+        
+        Args:
+            frames (np.ndarray): (çerçeve, bayt) uint8 dizisi veya `packed=False`
+                ise (çerçeve, bit) 0/1 dizisi
+            packed (bool): Giriş ve çıkış bayt olarak paketli mi?
+            chunk_frames (int): Tek adımda işlenecek en fazla çerçeve
+            
+        Returns:
+            np.ndarray: Kod sözcükleri; paketli ise her satır `encode_bytes`
+                çıktısıyla aynıdır, değilse (çerçeve, kod biti) dizisi
+        """
+        frames = np.asarray(frames, dtype=np.uint8)
+        if frames.ndim != 2:
+            raise ValueError(f"Çerçeveler 2 boyutlu bir dizi olmalıdır: {frames.shape}")
+        data_bits = frames.shape[1] * (8 if packed else 1)
+        code_bits = HammingCode.code_length(data_bits)
+        out_columns = -(-code_bits // 8) if packed else code_bits
+        encoded = np.empty((len(frames), out_columns), dtype=np.uint8)
+        for start in range(0, len(frames), chunk_frames):
+            chunk = frames[start:start + chunk_frames]
+            bits = np.unpackbits(chunk, axis=1) if packed else chunk
+            code = _encode_bits(bits, code_bits)
+            encoded[start:start + len(chunk)] = np.packbits(code, axis=1) if packed else code
+        return encoded
+        
+    @staticmethod
+    def decode_many(codes: np.ndarray, packed: bool = True,
+                    chunk_frames: int = 1 << 16) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        `encode_many` çıktısını tek seferde çözer ve çerçeve başına tek bit hatayı düzeltir.
+        
+        Args:
+            codes (np.ndarray): (çerçeve, bayt) paketli veya `packed=False` ise
+                (çerçeve, kod biti) kod sözcükleri
+            packed (bool): Giriş ve çıkış bayt olarak paketli mi?
+            chunk_frames (int): Tek adımda işlenecek en fazla çerçeve
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (düzeltilmiş veriler, çerçeve başına
+                hatalı konum; hata yoksa 0)
+        """
+        codes = np.asarray(codes, dtype=np.uint8)
+        if codes.ndim != 2:
+            raise ValueError(f"Kod sözcükleri 2 boyutlu bir dizi olmalıdır: {codes.shape}")
+        if packed:
+            # Veri uzunluğu, paketlenmiş uzunluğu veren en büyük bayt sayısıdır
+            data_bytes = codes.shape[1]
+            while data_bytes > 0 and -(-HammingCode.code_length(8 * data_bytes) // 8) > codes.shape[1]:
+                data_bytes -= 1
+            code_bits = HammingCode.code_length(8 * data_bytes)
+            out_columns = data_bytes
+        else:
+            code_bits = codes.shape[1]
+            out_columns = code_bits - code_bits.bit_length()
+        
+        decoded = np.empty((len(codes), out_columns), dtype=np.uint8)
+        error_positions = np.empty(len(codes), dtype=np.int64)
+        for start in range(0, len(codes), chunk_frames):
+            chunk = codes[start:start + chunk_frames]
+            code = np.unpackbits(chunk, axis=1)[:, :code_bits] if packed else chunk.copy()
+            syndrome = _syndromes(code)
+            rows = np.flatnonzero((syndrome > 0) & (syndrome <= code_bits))
+            code[rows, syndrome[rows] - 1] ^= 1
+            data = _extract_data(code)
+            decoded[start:start + len(chunk)] = np.packbits(data, axis=1) if packed else data
+            error_positions[start:start + len(chunk)] = syndrome
+        return decoded, error_positions
+        
     @staticmethod
     def encode(data: str) -> str:
         """
@@ -14,35 +426,17 @@ class HammingCode:
         Returns:
             str: Hamming kod ile kodlanmış veri
         """
-        # String'i binary'e çevir
-        binary = ''.join(format(ord(c), '08b') for c in data)
-        
-        # Gerekli parite biti sayısını hesapla
-        m = len(binary)
-        r = 1
-        while 2**r < m + r + 1:
-            r += 1
-            
-        # Parite bitleriyle birlikte kodlanmış mesajı oluştur
-        encoded = ['0'] * (m + r)
-        j = 0
-        for i in range(1, m + r + 1):
-            if i & (i - 1) == 0:  # 2'nin kuvveti
-                continue
-            encoded[i-1] = binary[j]
-            j += 1
-            
-        # Parite bitlerini hesapla
-        for i in range(r):
-            pos = 2**i
-            count = 0
-            for j in range(pos, len(encoded) + 1):
-                if j & pos:
-                    if encoded[j-1] == '1':
-                        count += 1
-            encoded[pos-1] = '1' if count % 2 else '0'
+        # String'i binary'e çevir (her karakter 8 bit)
+        try:
+            raw = data.encode('latin-1')
+            value, data_bits = int.from_bytes(raw, 'big'), 8 * len(raw)
+        except UnicodeEncodeError:
+            # 255'ten büyük kodlu karakterler 8 bitten uzun yazılır
+            binary = ''.join(format(ord(c), '08b') for c in data)
+            value, data_bits = int(binary, 2), len(binary)
             
-        return ''.join(encoded)
+        code_bits = HammingCode.code_length(data_bits)
+        return format(HammingCode.encode_int(value, data_bits), f'0{code_bits}b')
     
     @staticmethod
     def decode(encoded: str) -> str:
@@ -55,41 +449,178 @@ class HammingCode:
         Returns:
             str: Çözülmüş ve düzeltilmiş veri
         """
-        # Parite biti sayısını hesapla
-        r = 1
-        while 2**r < len(encoded) + 1:
-            r += 1
+        code_bits = len(encoded)
+        if not code_bits:
+            return ''
+        data, _ = HammingCode.decode_int(int(encoded, 2), code_bits)
+        data_bits = code_bits - code_bits.bit_length()
+        
+        # Binary'i string'e çevir; son karakter 8 bitten kısa olabilir
+        tail_bits = data_bits % 8
+        text = (data >> tail_bits).to_bytes(data_bits // 8, 'big').decode('latin-1')
+        if tail_bits:
+            text += chr(data & ((1 << tail_bits) - 1))
+        return text
+    
+    @staticmethod
+    def encode_frame(data: bytes) -> bytes:
+        """
+        Veriyi serpiştirilmiş SECDED bloklarından oluşan bir çerçeveye kodlar.
+        
+        Veri (başında 4 baytlık uzunlukla) 8 baytlık bloklara bölünür; her blok
+        genişletilmiş Hamming(72, 64) koduyla kodlanır ve tek hatayı düzeltip
+        çift hatayı tespit eder. Bloklar bit düzeyinde serpiştirilir: önce tüm
+        blokların 0. biti, sonra 1. biti gönderilir. Böylece blok sayısı kadar
+        uzunluktaki bir hata patlaması her bloğa en fazla bir hata olarak düşer.
+        
+        Args:
+            data (bytes): Kodlanacak veri
             
-        # Hataları kontrol et
-        error_pos = 0
-        for i in range(r):
-            pos = 2**i
-            count = 0
-            for j in range(pos, len(encoded) + 1):
-                if j & pos:
-                    if encoded[j-1] == '1':
-                        count += 1
-            if count % 2:
-                error_pos += pos
+        Returns:
+            bytes: Çerçeve (blok başına 9 bayt)
+        """
+        payload = _FRAME_HEADER.pack(len(data)) + bytes(data)
+        payload += bytes(-len(payload) % FRAME_BLOCK_BYTES)
+        words = np.frombuffer(payload, dtype=np.uint8).reshape(-1, FRAME_BLOCK_BYTES)
+        codes = np.empty((len(words), _SECDED_WORD_BYTES), dtype=np.uint8)
+        _secded_encode(words, codes)
+        return np.packbits(np.unpackbits(codes, axis=1).T).tobytes()
+        
+    @staticmethod
+    def decode_frame(frame: bytes) -> FrameDecodeResult:
+        """
+        `encode_frame` çıktısını çözer; düzeltilen ve düzeltilemeyen blokları ayrı bildirir.
+        
+        Args:
+            frame (bytes): Çerçeve
+            
+        Returns:
+            FrameDecodeResult: Veri ve blok durumları
+        """
+        if not frame or len(frame) % _SECDED_WORD_BYTES:
+            raise ValueError(f"Çerçeve uzunluğu {_SECDED_WORD_BYTES} baytın katı olmalıdır: {len(frame)}")
+        bits = np.unpackbits(np.frombuffer(frame, dtype=np.uint8))
+        codes = np.packbits(bits.reshape(8 * _SECDED_WORD_BYTES, -1).T, axis=1)
+        corrected, uncorrectable = _secded_decode(codes)
+        payload = codes[:, :FRAME_BLOCK_BYTES].tobytes()
+        # Başlık bloğu bozuksa uzunluk, çerçevedeki yer ile sınırlanır
+        length = min(_FRAME_HEADER.unpack_from(payload)[0], len(payload) - _FRAME_HEADER.size)
+        return FrameDecodeResult(payload[_FRAME_HEADER.size:_FRAME_HEADER.size + length],
+                                 corrected.tolist(), uncorrectable.tolist())
+        
+    @staticmethod
+    def encode_stream(source, chunk_size: int = 1 << 16) -> Iterator[memoryview]:
+        """
+        İkili bir akışı SECDED(72, 64) kod sözcüklerine kodlar.
+        
+        Kaynak sabit boyutlu parçalar halinde önceden ayrılmış tampona okunur
+        ve her 8 bayt 9 baytlık bir kod sözcüğüne dönüşür. Akışın sonuna toplam
+        veri uzunluğunu taşıyan bir kod sözcüğü eklenir. Bellek kullanımı akış
+        boyundan bağımsızdır.
+        
+        Args:
+            source: `readinto`/`recv_into` destekleyen nesne (dosya, soket
+                sarmalayıcısı) veya bellek tamponu (bytes, mmap, memoryview)
+            chunk_size (int): Tek adımda okunacak veri baytı (8'in katına yuvarlanır)
+            
+        Yields:
+            memoryview: Kodlanmış parça; tampon bir sonraki adımda yeniden
+                kullanıldığından saklanacaksa kopyalanmalıdır
+        """
+        source = _stream_source(source)
+        blocks = max(1, chunk_size // FRAME_BLOCK_BYTES)
+        data = np.zeros((blocks, FRAME_BLOCK_BYTES), dtype=np.uint8)
+        data_view = memoryview(data).cast('B')
+        encoded = np.empty((blocks, _SECDED_WORD_BYTES), dtype=np.uint8)
+        encoded_view = memoryview(encoded).cast('B')
+        total = 0
+        
+        while True:
+            count = _read_into(source, data_view)
+            total += count
+            if count:
+                used = -(-count // FRAME_BLOCK_BYTES)
+                data_view[count:used * FRAME_BLOCK_BYTES] = bytes(used * FRAME_BLOCK_BYTES - count)
+                _secded_encode(data[:used], encoded[:used])
+                yield encoded_view[:used * _SECDED_WORD_BYTES]
+            if count < len(data_view):
+                break
                 
-        # Hatayı düzelt
-        if error_pos:
-            encoded = list(encoded)
-            encoded[error_pos-1] = '1' if encoded[error_pos-1] == '0' else '0'
-            encoded = ''.join(encoded)
-            
-        # Parite bitlerini kaldır ve string'e çevir
-        result = ''
-        j = 0
-        for i in range(1, len(encoded) + 1):
-            if i & (i - 1) == 0:  # 2'nin kuvveti
-                continue
-            result += encoded[i-1]
-            j += 1
-            
-        # Binary'i string'e çevir
-        return ''.join(chr(int(result[i:i+8], 2)) for i in range(0, len(result), 8))
-    
+        data_view[:FRAME_BLOCK_BYTES] = _STREAM_TRAILER.pack(total)
+        _secded_encode(data[:1], encoded[:1])
+        yield encoded_view[:_SECDED_WORD_BYTES]
+        
+    @staticmethod
+    def decode_stream(source, chunk_size: int = 1 << 16) -> Iterator[StreamDecodeChunk]:
+        """
+        `encode_stream` ile kodlanmış akışı çözer ve tek bit hataları düzeltir.
+        
+        Son kod sözcüğü uzunluk bilgisi, ondan önceki ise dolgulu olabilecek son
+        veri bloğu olduğundan her adımda iki kod sözcüğü geride tutulur; akış
+        bitince dolgu baytları atılır.
+        
+        Args:
+            source: `readinto`/`recv_into` destekleyen nesne veya bellek tamponu
+            chunk_size (int): Tek adımda okunacak kodlanmış bayt (9'un katına yuvarlanır)
+            
+        Yields:
+            StreamDecodeChunk: Çözülen parça ve blok durumları
+        """
+        source = _stream_source(source)
+        words = max(1, chunk_size // _SECDED_WORD_BYTES)
+        # Geride tutulan iki sözcük için fazladan yer
+        held = 2 * _SECDED_WORD_BYTES
+        encoded = np.empty(words * _SECDED_WORD_BYTES + held, dtype=np.uint8)
+        encoded_view = memoryview(encoded)
+        codes = encoded.reshape(-1, _SECDED_WORD_BYTES)
+        decoded = np.empty((len(codes), FRAME_BLOCK_BYTES), dtype=np.uint8)
+        decoded_view = memoryview(decoded).cast('B')
+        filled = 0
+        block = 0
+        offset = 0
+        
+        while True:
+            filled += _read_into(source, encoded_view[filled:])
+            final = filled < len(encoded)
+            if filled % _SECDED_WORD_BYTES or (final and not filled):
+                raise ValueError(f"Kodlanmış akış eksik: {block * _SECDED_WORD_BYTES + filled} bayt")
+            # Akış sürüyorsa son iki sözcük bir sonraki adıma taşınır
+            used = (filled if final else filled - held) // _SECDED_WORD_BYTES
+            corrected, uncorrectable = _secded_decode(codes[:used])
+            decoded[:used] = codes[:used, :FRAME_BLOCK_BYTES]
+            
+            size = used * FRAME_BLOCK_BYTES
+            if final:
+                # Son sözcük toplam uzunluktur; bozuksa eldeki veri sınırı kullanılır
+                total = _STREAM_TRAILER.unpack_from(decoded, size - FRAME_BLOCK_BYTES)[0]
+                size = max(0, min(total - offset, size - FRAME_BLOCK_BYTES))
+            yield StreamDecodeChunk(offset, decoded_view[:size],
+                                    (corrected + block).tolist(), (uncorrectable + block).tolist())
+            if final:
+                return
+            block += used
+            offset += size
+            encoded[:held] = encoded[used * _SECDED_WORD_BYTES:filled]
+            filled = held
+            
+    @staticmethod
+    def simulate_burst(frame: bytes, length: int) -> bytes:
+        """
+        Çerçevede rastgele bir konumda ardışık bit hatası patlaması oluşturur (test için).
+        
+        Args:
+            frame (bytes): Çerçeve
+            length (int): Bozulacak ardışık bit sayısı
+            
+        Returns:
+            bytes: Hatalı çerçeve
+        """
+        import random
+        bits = np.unpackbits(np.frombuffer(frame, dtype=np.uint8))
+        start = random.randint(0, max(len(bits) - length, 0))
+        bits[start:start + length] ^= 1
+        return np.packbits(bits).tobytes()
+        
     @staticmethod
     def simulate_error(encoded: str, num_errors: int = 1) -> str:
         """
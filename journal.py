@@ -0,0 +1,370 @@
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from typing import Optional, Tuple
+
+from tasks import TaskQueue, TaskStatus
+
+_STATUSES = tuple(TaskStatus)
+
+# Günlük kayıtları (küçük sonlu): işlem kodu + sabit boyutlu alanlar
+_OP_ADD, _OP_STATUS, _OP_PRIORITY, _OP_DESCRIPTION = 1, 2, 3, 4
+_ADD = struct.Struct('<BiidI')          # kod, hedef, öncelik, oluşturulma, açıklama indeksi
+_STATUS = struct.Struct('<BqBd')        # kod, görev, durum kodu, tamamlanma (NaN: yok)
+_PRIORITY = struct.Struct('<Bqi')       # kod, görev, öncelik
+_DESCRIPTION = struct.Struct('<BI')     # kod, UTF-8 uzunluğu (ardından metin)
+_GROUP = struct.Struct('<II')           # grup uzunluğu, CRC32
+_JOURNAL_HEADER = struct.Struct('<4sQ')  # sihirli sayı, günlük kimliği
+_SNAPSHOT_HEADER = struct.Struct('<4sBQQQQQ')
+
+class TaskJournal:
+    """
+    `TaskQueue` için yalnızca sona eklenen ikili günlük ve anlık görüntüler.
+    
+    `add_task`, `update_task_status` ve `update_task_priority` işlemleri
+    sabit boyutlu kayıtlar olarak belleğe yazılır ve gruplar halinde diske
+    aktarılır (group commit): grup `group_records` kayda ulaştığında ya da
+    ilk kaydından bu yana `group_interval` saniye geçtiğinde tek bir yazma
+    ve `fsync` yapılır. Süre sınırı yeni kayıt gelmese de geçerlidir: grubun
+    ilk kaydı bir zamanlayıcı başlatır ve süre dolunca grup arka planda
+    diske aktarılır. Her grubun başında uzunluk ve CRC32 bulunur; çökme
+    sırasında yarım kalan son grup kurtarmada atılır.
+    
+    Günlük `snapshot_every` kayda ulaştığında kuyruğun tüm sütunları (yığın
+    dahil) tek bir anlık görüntü dosyasına yazılır ve günlük yeni bir
+    kimlikle boşaltılır. Açılışta anlık görüntü bellek eşlemli okunup
+    sütunlara doğrudan kopyalanır, ardından yalnızca sonrasındaki günlük
+    kuyruğu yeniden oynatılır.
+    
+    `group_interval` 0 ise zamanlayıcı kullanılmaz; kaydedilmemiş son grup
+    `commit` veya `close` çağrılana kadar bellektedir.
+    """
+    JOURNAL_MAGIC = b'TJR1'
+    SNAPSHOT_MAGIC = b'TSN1'
+    
+    def __init__(self, path: str, group_records: int = 1024, group_interval: float = 0.01,
+                 snapshot_every: int = 1_000_000, sync: bool = True):
+        """
+        Args:
+            path (str): Dosya yolu öneki (`.journal` ve `.snapshot` dosyaları)
+            group_records (int): Tek grupta diske aktarılacak en fazla kayıt
+            group_interval (float): Bir kaydın bellekte bekleyebileceği en uzun süre
+                (saniye; 0: yalnızca grup dolunca veya `commit` ile)
+            snapshot_every (int): Anlık görüntü alınmadan önce günlüğe yazılacak kayıt sayısı
+            sync (bool): True ise her grup `fsync` ile kalıcılaştırılır
+        """
+        self.path = path
+        self.journal_path = path + '.journal'
+        self.snapshot_path = path + '.snapshot'
+        self.group_records = group_records
+        self.group_interval = group_interval
+        self.snapshot_every = snapshot_every
+        self.sync = sync
+        
+        self.queue: Optional[TaskQueue] = None
+        self.journal_id = 0
+        self.records = 0          # Son anlık görüntüden bu yana kayıt sayısı
+        self._file = None
+        self._buffer = bytearray()
+        self._pending = 0         # Bellekteki grupta bekleyen kayıt sayısı
+        self._group_started = 0.0
+        self._descriptions = 0    # Günlüğe yazılmış açıklama sayısı
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None  # Grubu süresi dolunca yazan zamanlayıcı
+        
+    @classmethod
+    def open_queue(cls, path: str, **options) -> TaskQueue:
+        """
+        Kuyruğu diskten kurtarır (yoksa boş oluşturur) ve günlüğe bağlar.
+        
+        Args:
+            path (str): Dosya yolu öneki
+            **options: `TaskJournal` ayarları
+            
+        Returns:
+            TaskQueue: Günlüğü `journal` özniteliğinde olan kuyruk
+        """
+        journal = cls(path, **options)
+        queue, next_id = TaskQueue(), None
+        if os.path.exists(journal.snapshot_path):
+            queue, next_id = read_snapshot(journal.snapshot_path)
+            
+        end = 0
+        journal_id = None
+        if os.path.exists(journal.journal_path):
+            journal_id, end = journal._replay(queue, next_id)
+            
+        journal.queue = queue
+        journal._descriptions = len(queue.store.descriptions)
+        if journal_id is None or (next_id is not None and journal_id != next_id):
+            # Günlük yok ya da tamamı anlık görüntüde: yeni günlük başlat
+            journal._rotate(next_id)
+        else:
+            journal.journal_id = journal_id
+            journal._file = open(journal.journal_path, 'r+b')
+            journal._file.truncate(end)  # Yarım kalan son grubu at
+            journal._file.seek(end)
+        queue.journal = journal
+        return queue
+        
+    def _replay(self, queue: TaskQueue, next_id: Optional[int]) -> Tuple[Optional[int], int]:
+        """
+        Günlükteki eksiksiz grupları kuyruğa uygular.
+        
+        Returns:
+            Tuple[Optional[int], int]: (günlük kimliği, son geçerli grubun bittiği konum)
+        """
+        with open(self.journal_path, 'rb') as f:
+            data = f.read()
+        if len(data) < _JOURNAL_HEADER.size:
+            return None, 0
+        magic, journal_id = _JOURNAL_HEADER.unpack_from(data)
+        if magic != self.JOURNAL_MAGIC:
+            raise ValueError(f"Geçersiz görev günlüğü dosyası: {self.journal_path}")
+        if next_id is not None and journal_id != next_id:
+            # Anlık görüntü alınmış ama günlük henüz yenilenmemiş: kayıtlar zaten görüntüde
+            return journal_id, len(data)
+            
+        store = queue.store
+        offset = _JOURNAL_HEADER.size
+        records = 0
+        while offset + _GROUP.size <= len(data):
+            length, checksum = _GROUP.unpack_from(data, offset)
+            start = offset + _GROUP.size
+            group = data[start:start + length]
+            if len(group) < length or zlib.crc32(group) != checksum:
+                break
+            position = 0
+            while position < length:
+                op = group[position]
+                if op == _OP_ADD:
+                    _, target, priority, created_at, description = _ADD.unpack_from(group, position)
+                    task = queue.add_task(target, priority, store.descriptions[description])
+                    store.created_at[task.id - 1] = created_at
+                    position += _ADD.size
+                elif op == _OP_STATUS:
+                    _, task_id, code, completed_at = _STATUS.unpack_from(group, position)
+                    queue.update_task_status(task_id, _STATUSES[code])
+                    store.completed_at[task_id - 1] = completed_at
+                    position += _STATUS.size
+                elif op == _OP_PRIORITY:
+                    _, task_id, priority = _PRIORITY.unpack_from(group, position)
+                    queue.update_task_priority(task_id, priority)
+                    position += _PRIORITY.size
+                elif op == _OP_DESCRIPTION:
+                    _, size = _DESCRIPTION.unpack_from(group, position)
+                    position += _DESCRIPTION.size
+                    text = group[position:position + size].decode('utf-8')
+                    store._description_index[text] = len(store.descriptions)
+                    store.descriptions.append(sys.intern(text))
+                    position += size
+                else:
+                    raise ValueError(f"Bilinmeyen günlük kaydı: {op}")
+                records += 1
+            offset = start + length
+        self.records = records
+        return journal_id, offset
+        
+    def log_add(self, task_id: int):
+        """Eklenen görevi günlüğe yazar"""
+        store = self.queue.store
+        row = task_id - 1
+        description = store.description_ids[row]
+        with self._lock:
+            while self._descriptions <= description:
+                # Yeni açıklama metni yalnızca ilk kullanımında yazılır
+                text = store.descriptions[self._descriptions].encode('utf-8')
+                self._buffer += _DESCRIPTION.pack(_OP_DESCRIPTION, len(text))
+                self._buffer += text
+                self._descriptions += 1
+            self._buffer += _ADD.pack(_OP_ADD, store.target_nodes[row], store.priorities[row],
+                                      store.created_at[row], description)
+            self._logged()
+        
+    def log_status(self, task_id: int):
+        """Görevin durum değişikliğini günlüğe yazar"""
+        store = self.queue.store
+        row = task_id - 1
+        with self._lock:
+            self._buffer += _STATUS.pack(_OP_STATUS, task_id, store.statuses[row], store.completed_at[row])
+            self._logged()
+        
+    def log_priority(self, task_id: int):
+        """Görevin öncelik değişikliğini günlüğe yazar"""
+        with self._lock:
+            self._buffer += _PRIORITY.pack(_OP_PRIORITY, task_id, self.queue.store.priorities[task_id - 1])
+            self._logged()
+        
+    def _logged(self):
+        """Grup dolduysa veya süresi geçtiyse diske aktarır (kilit altında çağrılır)"""
+        self.records += 1
+        self._pending += 1
+        now = time.monotonic()
+        if self._pending == 1:
+            self._group_started = now
+        expired = self.group_interval > 0 and now - self._group_started >= self.group_interval
+        if self._pending >= self.group_records or expired:
+            self._commit_group()
+        elif self._pending == 1 and self.group_interval > 0:
+            # Yeni kayıt gelmezse grubu süre dolunca arka planda yaz
+            self._timer = threading.Timer(self.group_interval, self._flush_expired)
+            self._timer.daemon = True
+            self._timer.start()
+            
+    def _flush_expired(self):
+        """Zamanlayıcı: süresi dolan grubu diske aktarır"""
+        with self._lock:
+            if self._file is not None:
+                self._commit_group()
+                
+    def _commit_group(self):
+        """Grubu diske aktarır; günlük yeterince büyüdüyse anlık görüntü alır"""
+        self.commit()
+        if self.records >= self.snapshot_every:
+            self.snapshot()
+            
+    def commit(self):
+        """Bellekteki grubu tek yazmayla diske aktarır"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            group = bytes(self._buffer)
+            self._file.write(_GROUP.pack(len(group), zlib.crc32(group)))
+            self._file.write(group)
+            self._file.flush()
+            if self.sync:
+                os.fsync(self._file.fileno())
+            self._buffer.clear()
+            self._pending = 0
+        
+    def snapshot(self):
+        """
+        Kuyruğun anlık görüntüsünü alır ve günlüğü boşaltır.
+        
+        Görüntü geçici dosyaya yazılıp atomik olarak yerine taşınır; çökme
+        hangi adımda olursa olsun açılışta tutarlı bir durum kurtarılır.
+        """
+        with self._lock:
+            self.commit()
+            next_id = self._new_id()
+            write_snapshot(self.queue, self.snapshot_path, next_id, self.sync)
+            self._rotate(next_id)
+        
+    def _new_id(self) -> int:
+        while True:
+            journal_id = random.getrandbits(64)
+            if journal_id != self.journal_id:
+                return journal_id
+                
+    def _rotate(self, journal_id: Optional[int]):
+        """Verilen kimlikle boş bir günlük dosyası başlatır"""
+        if self._file is not None:
+            self._file.close()
+        self.journal_id = journal_id if journal_id is not None else self._new_id()
+        temporary = self.journal_path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(_JOURNAL_HEADER.pack(self.JOURNAL_MAGIC, self.journal_id))
+            f.flush()
+            if self.sync:
+                os.fsync(f.fileno())
+        os.replace(temporary, self.journal_path)
+        self._file = open(self.journal_path, 'r+b')
+        self._file.seek(0, os.SEEK_END)
+        self.records = 0
+        
+    def close(self):
+        """Bekleyen grubu yazar ve günlüğü kapatır"""
+        with self._lock:
+            if self._file is not None:
+                self.commit()
+                self._file.close()
+                self._file = None
+        if self.queue is not None and self.queue.journal is self:
+            self.queue.journal = None
+
+def write_snapshot(queue: TaskQueue, path: str, journal_id: int = 0, sync: bool = True):
+    """
+    Kuyruğun tüm sütunlarını (bekleyen görev yığını dahil) ikili dosyaya yazar.
+    
+    Args:
+        queue (TaskQueue): Kaydedilecek kuyruk
+        path (str): Dosya yolu
+        journal_id (int): Bu görüntüden sonra başlayacak günlüğün kimliği
+        sync (bool): True ise dosya yerine taşınmadan önce `fsync` yapılır
+    """
+    store = queue.store
+    texts = [text.encode('utf-8') for text in store.descriptions]
+    offsets = array('q', [0])
+    for text in texts:
+        offsets.append(offsets[-1] + len(text))
+        
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(_SNAPSHOT_HEADER.pack(TaskJournal.SNAPSHOT_MAGIC, sys.byteorder == 'little', journal_id,
+                                      len(store), len(texts), len(queue._heap), offsets[-1]))
+        for values in (store.target_nodes, store.priorities, store.statuses, store.created_at,
+                       store.completed_at, store.description_ids, store.status_counts,
+                       queue._heap, queue._position, offsets):
+            values.tofile(f)
+        f.write(b''.join(texts))
+        f.flush()
+        if sync:
+            os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+def read_snapshot(path: str) -> Tuple[TaskQueue, int]:
+    """
+    `write_snapshot` ile yazılmış kuyruğu bellek eşlemli okuyarak kurar.
+    
+    Sütunlar eşlenmiş dosyadan tek kopyayla tip dizilerine alınır; yığın
+    yeniden kurulmaz.
+    
+    Args:
+        path (str): Dosya yolu
+        
+    Returns:
+        Tuple[TaskQueue, int]: (kuyruk, sonraki günlüğün kimliği)
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            magic, little, journal_id, num_tasks, num_texts, heap_size, text_bytes = \
+                _SNAPSHOT_HEADER.unpack_from(view)
+            if magic != TaskJournal.SNAPSHOT_MAGIC:
+                raise ValueError(f"Geçersiz görev anlık görüntüsü dosyası: {path}")
+                
+            queue = TaskQueue()
+            store = queue.store
+            offset = _SNAPSHOT_HEADER.size
+            columns = []
+            for typecode, length in (('i', num_tasks), ('i', num_tasks), ('b', num_tasks), ('d', num_tasks),
+                                     ('d', num_tasks), ('i', num_tasks), ('q', len(_STATUSES)),
+                                     ('q', heap_size), ('q', num_tasks), ('q', num_texts + 1)):
+                values = array(typecode)
+                size = length * values.itemsize
+                values.frombytes(view[offset:offset + size])
+                if bool(little) != (sys.byteorder == 'little'):
+                    values.byteswap()
+                columns.append(values)
+                offset += size
+            blob = bytes(view[offset:offset + text_bytes])
+        finally:
+            view.release()
+            
+    (store.target_nodes, store.priorities, store.statuses, store.created_at, store.completed_at,
+     store.description_ids, store.status_counts, queue._heap, queue._position, offsets) = columns
+    store.reindex()
+    for index in range(num_texts):
+        description = sys.intern(blob[offsets[index]:offsets[index + 1]].decode('utf-8'))
+        store._description_index[description] = index
+        store.descriptions.append(description)
+    return queue, journal_id
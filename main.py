@@ -1,9 +1,14 @@
-from graph import Graph
+from graph import Graph, Heuristic
+from generators import erdos_renyi_graph
 from hamming import HammingCode
 from montecarlo import MonteCarloSimulation
 from minimax import MinimaxRouteSelector
 from tasks import TaskQueue, TaskStatus
-import time
+from replanning import DStarLite
+from tour import TourPlanner
+from events import EventKind, EventSimulator
+from typing import Callable, List, Optional
+import math
 import random
 
 class RescueDroneSimulation:
@@ -11,26 +16,33 @@ class RescueDroneSimulation:
     Kurtarma Dronu Simülasyonu ana sınıfı.
     Tüm bileşenleri bir araya getirir ve simülasyonu yönetir.
     """
-    def __init__(self, num_nodes: int = 10):
+    def __init__(self, num_nodes: int = 10, compact: bool = False, seed: Optional[int] = None):
         """python main.py
         Args:
             num_nodes (int): Simülasyon alanındaki düğüm sayısı
+            compact (bool): True ise graf doğrudan kompakt CSR düzeninde
+                oluşturulur (büyük haritalar için)
+            seed (int): Graf üretimi ve ortam simülasyonu için tohum değeri
         """
+        self.compact = compact
+        self.seed = seed
         self.graph = Graph(num_nodes)
-        self.monte_carlo = MonteCarloSimulation(num_nodes)
-        self.route_selector = MinimaxRouteSelector()
+        self.monte_carlo = MonteCarloSimulation(num_nodes, seed)
         self.task_queue = TaskQueue()
         self.hamming = HammingCode()
+        # Sanal saat: geçişler ve beklemeler duvar saatinde uyumadan simüle edilir
+        self.events = EventSimulator()
+        self.hop_time = 1.0  # Birim kenar ağırlığının uçuş süresi (sanal saniye)
         
         # Grafı başlat
         self._initialize_graph()
+        # Rota seçici, oluşturulan graf üzerinde dron-ortam oyun ağacı kurar
+        self.route_selector = MinimaxRouteSelector(graph=self.graph, monte_carlo=self.monte_carlo)
         
     def _initialize_graph(self):
         """Grafı rastgele bağlantılarla başlatır"""
-        for i in range(self.graph.num_nodes):
-            for j in range(i + 1, self.graph.num_nodes):
-                if random.random() < 0.3:  # %30 olasılıkla bağlantı ekle
-                    self.graph.add_edge(i, j)
+        # %30 olasılıkla bağlantı; çiftler tek tek değil geometrik atlamayla örneklenir
+        self.graph = erdos_renyi_graph(self.graph.num_nodes, 0.3, self.seed, compact=self.compact)
                     
     def add_rescue_task(self, target_node: int, priority: int, description: str):
         """
@@ -43,67 +55,192 @@ class RescueDroneSimulation:
         """
         self.task_queue.add_task(target_node, priority, description)
         
-    def simulate_rescue_mission(self):
+    def schedule_task(self, at: float, target_node: int, priority: int, description: str):
         """
-        Kurtarma görevini simüle eder.
-        Dron, görevleri öncelik sırasına göre gerçekleştirir.
+        Görevin verilen sanal zamanda kuyruğa eklenmesini zamanlar.
+        
+        Args:
+            at (float): Geliş zamanı (sanal saniye)
+            target_node (int): Hedef düğüm
+            priority (int): Görev önceliği
+            description (str): Görev açıklaması
+        """
+        self.events.schedule_at(at, self._task_arrived, target_node, priority, description)
+        
+    def _task_arrived(self, target_node: int, priority: int, description: str):
+        task = self.task_queue.add_task(target_node, priority, description)
+        self.events.record(EventKind.TASK_ARRIVED, task_id=task.id, target=target_node)
+        
+    def fly_route(self, path: List[int], replan: bool = False, heuristic: Optional[Heuristic] = None,
+                  log: Callable[[str], None] = print):
+        """
+        Dronun rotayı izlemesini simüle eden süreç (`EventSimulator.process` ile çalıştırılır).
+        
+        Her geçiş kenar ağırlığı ile orantılı sanal süre alır; engelli
+        kenarda dron gecikme faktörü kadar sanal saniye bekler.
+        
+        Args:
+            path (List[int]): İzlenecek rota
+            replan (bool): True ise engelde rota D* Lite ile yeniden planlanır
+            heuristic: D* Lite için sezgisel fonksiyon
+            log: Mesajların yazılacağı fonksiyon
+            
+        Returns:
+            List[int]: Fiilen izlenen rota (generator dönüş değeri)
+        """
+        events = self.events
+        planner = None
+        i = 0
+        while i < len(path) - 1:
+            current = path[i]
+            next_node = path[i + 1]
+            
+            # Konum bilgisini ilet
+            location_data = f"Konum: {current} -> {next_node}"
+            encoded_data = self.hamming.encode(location_data)
+            
+            # Hata simülasyonu
+            if random.random() < 0.2:  # %20 hata olasılığı
+                encoded_data = self.hamming.simulate_error(encoded_data)
+                log("Konum verisi bozuldu!")
+            
+            # Hatayı düzelt
+            decoded_data = self.hamming.decode(encoded_data)
+            log(f"İletilen veri: {decoded_data}")
+            
+            # Engel kontrolü
+            if self.monte_carlo.is_path_blocked(current, next_node):
+                log(f"Uyarı: {current} -> {next_node} arası engelli!")
+                events.record(EventKind.BLOCKAGE, from_node=current, to_node=next_node)
+                if replan:
+                    # Planlayıcı ilk engelde kurulur, sonraki engellerde yalnızca onarılır
+                    if planner is None:
+                        planner = DStarLite(self.graph, current, path[-1], heuristic)
+                    else:
+                        planner.move_to(current)
+                    planner.block_edge(current, next_node)
+                    detour = planner.current_path()
+                    if detour:
+                        path = path[:i] + detour
+                        log(f"Rota yeniden planlandı: {path}")
+                        continue
+                    # Başka yol yok: engelin kalkmasını bekle
+                    planner.unblock_edge(current, next_node)
+                delay = self.monte_carlo.get_delay_factor(current, next_node)
+                events.record(EventKind.DELAY, from_node=current, to_node=next_node, duration=delay)
+                yield delay
+                
+            yield self.graph.edge_weight(current, next_node) * self.hop_time
+            events.record(EventKind.HOP, from_node=current, to_node=next_node)
+            i += 1
+        return path
+        
+    def mission(self, method: str = 'dijkstra', heuristic: Optional[Heuristic] = None,
+                replan: bool = False, tour: bool = False, log: Callable[[str], None] = print):
         """
-        print("Kurtarma görevi başlıyor...")
+        Kurtarma görevlerini yürüten süreç (`EventSimulator.process` ile çalıştırılır).
         
+        Bekleyen görev kalmadığında ileride gelecek görev zamanlanmışsa onu
+        bekler; yoksa süreç sona erer. Parametreler için bkz. `simulate_rescue_mission`.
+        """
+        events = self.events
+        position = 0
+        tour_planner = None
+        seen_id = 0  # Tura eklenmek üzere incelenen son görev ID'si
+        if tour:
+            tour_planner = TourPlanner(self.graph, position)
+            tour_planner.plan(self.task_queue.tasks_by_status(TaskStatus.PENDING))
+            seen_id = self.task_queue.next_id - 1
+            log(f"Planlanan tur: {[task.target_node for task in tour_planner.tasks_in_order()]}")
+            
         while True:
             # Sonraki görevi al
-            task = self.task_queue.get_next_task()
+            if tour_planner is not None:
+                # Görev sırasında eklenen görevler tura artımlı olarak yerleştirilir
+                # (yalnızca son incelemeden sonra eklenen ID'ler, tüm kuyruk taranmadan)
+                for task_id in range(seen_id + 1, self.task_queue.next_id):
+                    pending = self.task_queue.tasks[task_id]
+                    if pending.status == TaskStatus.PENDING:
+                        tour_planner.add_task(pending)
+                seen_id = self.task_queue.next_id - 1
+                task = tour_planner.next_task()
+                while task is not None and task.status != TaskStatus.PENDING:
+                    # Tur dışında başlatılan veya iptal edilen görevler turdan çıkar
+                    tour_planner.remove_task(task.id)
+                    task = tour_planner.next_task()
+            else:
+                task = self.task_queue.get_next_task()
             if not task:
-                print("Tüm görevler tamamlandı!")
-                break
+                # Zamanlanmış görev gelişi varsa onu bekle
+                next_event = events.peek()
+                if next_event == math.inf:
+                    log("Tüm görevler tamamlandı!")
+                    break
+                yield next_event - events.now
+                continue
                 
-            print(f"\nGörev #{task.id}: {task.description}")
-            print(f"Hedef: Düğüm {task.target_node}")
+            log(f"\nGörev #{task.id}: {task.description}")
+            log(f"Hedef: Düğüm {task.target_node}")
             
             # Görevi başlat
             self.task_queue.update_task_status(task.id, TaskStatus.IN_PROGRESS)
             
             # Alternatif rotaları bul
-            paths = self.graph.get_alternative_paths(0, task.target_node)
+            paths = self.graph.get_alternative_paths(position, task.target_node, method=method, heuristic=heuristic)
             
             # En iyi rotayı seç
             best_path = self.route_selector.select_best_route(paths)
             
-            print(f"Seçilen rota: {best_path}")
+            log(f"Seçilen rota: {best_path}")
             
             # Rotayı takip et
-            for i in range(len(best_path) - 1):
-                current = best_path[i]
-                next_node = best_path[i + 1]
-                
-                # Konum bilgisini ilet
-                location_data = f"Konum: {current} -> {next_node}"
-                encoded_data = self.hamming.encode(location_data)
-                
-                # Hata simülasyonu
-                if random.random() < 0.2:  # %20 hata olasılığı
-                    encoded_data = self.hamming.simulate_error(encoded_data)
-                    print("Konum verisi bozuldu!")
-                
-                # Hatayı düzelt
-                decoded_data = self.hamming.decode(encoded_data)
-                print(f"İletilen veri: {decoded_data}")
-                
-                # Engel kontrolü
-                if self.monte_carlo.is_path_blocked(current, next_node):
-                    print(f"Uyarı: {current} -> {next_node} arası engelli!")
-                    delay = self.monte_carlo.get_delay_factor(current, next_node)
-                    time.sleep(delay)
+            best_path = yield from self.fly_route(best_path, replan, heuristic, log)
+            
+            if tour_planner is not None:
+                tour_planner.visit(task.id)
+                if best_path:
+                    position = best_path[-1]
                     
             # Görevi tamamla
             self.task_queue.update_task_status(task.id, TaskStatus.COMPLETED)
-            print(f"Görev #{task.id} tamamlandı!")
+            events.record(EventKind.TASK_COMPLETED, task_id=task.id, target=task.target_node)
+            log(f"Görev #{task.id} tamamlandı! (t = {events.now:.1f} s)")
             
+    def simulate_rescue_mission(self, method: str = 'dijkstra', heuristic: Optional[Heuristic] = None,
+                                replan: bool = False, tour: bool = False, realtime_factor: float = 0.0,
+                                until: float = math.inf, log: Callable[[str], None] = print):
+        """
+        Kurtarma görevini simüle eder.
+        Dron, görevleri öncelik sırasına göre gerçekleştirir.
+        
+        Görev akışı sanal saatli olay çekirdeğinde (`self.events`) yürür;
+        geçişler ve engel beklemeleri için uyunmaz, simülasyon işlemcinin
+        izin verdiği hızda ilerler.
+        
+        Args:
+            method (str): Rota arama motoru ('dijkstra', 'astar', 'bidirectional')
+            heuristic: 'astar' için sezgisel fonksiyon (varsayılan: kuş uçuşu mesafe)
+            replan (bool): True ise engelle karşılaşıldığında rota dronun
+                konumundan D* Lite ile artımlı olarak yeniden planlanır
+            tour (bool): True ise dron her görevden sonra başlangıca dönmez;
+                bekleyen hedefler öncelik sırasına uyan bir tur halinde
+                dolaşılır ve rotalar dronun bulunduğu düğümden hesaplanır
+            realtime_factor (float): Gösterim için duvar saatine göre hız katı
+                (0: beklemeden, 1.0: gerçek zaman)
+            until (float): Simülasyonun durdurulacağı sanal zaman (saniye)
+            log: Mesajların yazılacağı fonksiyon
+        """
+        log("Kurtarma görevi başlıyor...")
+        
+        self.events.realtime_factor = realtime_factor
+        self.events.process(self.mission(method, heuristic, replan, tour, log))
+        self.events.run(until)
+        
         # İstatistikleri göster
         stats = self.task_queue.get_task_stats()
-        print("\nGörev İstatistikleri:")
+        log("\nGörev İstatistikleri:")
         for status, count in stats.items():
-            print(f"{status}: {count}")
+            log(f"{status}: {count}")
 
 if __name__ == "__main__":
     # Simülasyonu başlat
@@ -1,17 +1,322 @@
-from typing import List, Tuple, Dict
 import math
+import multiprocessing
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from graph import Graph
+from montecarlo import MonteCarloSimulation
+
+_MASK64 = (1 << 64) - 1
+_EXACT, _LOWER, _UPPER = 0, 1, 2  # Transpozisyon tablosu değer türleri
+
+def _splitmix64(value: int) -> int:
+    """64 bitlik karıştırma fonksiyonu; Zobrist anahtarlarını saklamadan üretir"""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+class ZobristKeys:
+    """
+    Oyun durumunun (dron konumu, hedef, engellenmiş kenarlar, kalan engel
+    hakkı) Zobrist anahtar bileşenleri.
+    
+    Durum anahtarı bileşenlerin XOR'udur; hamle yapılırken ve geri alınırken
+    yalnızca değişen bileşenler XOR'lanarak artımlı güncellenir.
+    """
+    def __init__(self, seed: int = 0):
+        """
+        Args:
+            seed (int): Anahtar üretimi için tohum değeri
+        """
+        self.seed = seed
+        self._edges: Dict[Tuple[int, int], int] = {}
+        
+    def node(self, node: int) -> int:
+        return _splitmix64(self.seed ^ (node << 2))
+        
+    def target(self, node: int) -> int:
+        return _splitmix64(self.seed ^ (node << 2 | 1))
+        
+    def budget(self, remaining: int) -> int:
+        return _splitmix64(self.seed ^ (remaining << 2 | 2))
+        
+    def edge(self, from_node: int, to_node: int) -> int:
+        edge = (from_node, to_node) if from_node < to_node else (to_node, from_node)
+        key = self._edges.get(edge)
+        if key is None:
+            key = self._edges[edge] = _splitmix64(self.seed ^ ((edge[0] << 32 | edge[1]) << 2 | 3))
+        return key
+
+class TranspositionTable:
+    """
+    Sabit boyutlu transpozisyon tablosu.
+    
+    Her kovada iki yuva vardır: derinlik öncelikli yuva yalnızca daha derin
+    (veya eşit) aramalarla değiştirilir, ikinci yuva her zaman en son sonucu
+    tutar. Böylece bellek sınırlı kalır ve değerli derin sonuçlar sığ
+    aramaların seli altında kaybolmaz.
+    """
+    def __init__(self, size_bits: int = 16):
+        """
+        Args:
+            size_bits (int): Kova sayısının 2 tabanında logaritması
+        """
+        self.mask = (1 << size_bits) - 1
+        self.slots: List[Optional[Tuple[int, int, float, int, int]]] = [None] * (2 << size_bits)
+        
+    def clear(self):
+        """Tüm girdileri siler"""
+        self.slots = [None] * len(self.slots)
+        
+    def get(self, key: int) -> Optional[Tuple[int, int, float, int, int]]:
+        """
+        Anahtarın girdisini döndürür.
+        
+        Returns:
+            Tuple: (anahtar, derinlik, değer, değer türü, en iyi hamle) veya None
+        """
+        index = (key & self.mask) << 1
+        for entry in (self.slots[index], self.slots[index + 1]):
+            if entry is not None and entry[0] == key:
+                return entry
+        return None
+        
+    def store(self, key: int, depth: int, value: float, flag: int, move: int):
+        """Arama sonucunu kaydeder"""
+        index = (key & self.mask) << 1
+        entry = (key, depth, value, flag, move)
+        deep = self.slots[index]
+        if deep is None or deep[0] == key or depth >= deep[1]:
+            self.slots[index] = entry
+        else:
+            self.slots[index + 1] = entry
+
+@dataclass
+class SearchStats:
+    """Son oyun ağacı aramasının istatistikleri"""
+    depth: int = 0            # Tamamen aranan en büyük derinlik
+    nodes: int = 0            # Ziyaret edilen düğüm sayısı
+    generated: int = 0        # Üretilen hamle sayısı
+    pruned: int = 0           # Alpha-beta kesmeleri nedeniyle açılmayan hamleler
+    cutoffs: int = 0          # Kesme sayısı
+    tt_hits: int = 0          # Transpozisyon tablosundan yanıtlanan düğümler
+    elapsed: float = 0.0      # Saniye
+    timed_out: bool = False   # Süre sınırı doldu mu?
+    
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+        
+    @property
+    def pruning_ratio(self) -> float:
+        """Üretilen hamlelerden budanarak hiç açılmayanların oranı"""
+        return self.pruned / self.generated if self.generated else 0.0
+
+class _SearchTimeout(Exception):
+    pass
+
+# Kök bölmeli paralel aramada işçi sürecine ait seçici ve paylaşılan sınır
+_worker_selector: Optional['MinimaxRouteSelector'] = None
+_worker_bound = None
+
+def _init_root_worker(graph: Graph, monte_carlo: Optional[MonteCarloSimulation], options: dict, bound):
+    """İşçi süreci başlatıcısı: graf ve ortam her sürece bir kez aktarılır"""
+    global _worker_selector, _worker_bound
+    _worker_selector = MinimaxRouteSelector(graph=graph, monte_carlo=monte_carlo, **options)
+    _worker_bound = bound
+    
+def _search_root_move(task: tuple) -> Tuple[Optional[float], float, Tuple[int, ...]]:
+    """Tek bir kök hamlesini işçi sürecinde arar"""
+    return _worker_selector._search_root_move(*task, shared_bound=_worker_bound)
+
+class RouteScorer:
+    """
+    Risk duyarlı rota puanlama motoru.
+    
+    Rota maliyeti düğüm sayısı ile kenarların Monte Carlo engel olasılıkları
+    ve gecikme faktörlerinin ağırlıklı toplamıdır; puan 1 / (1 + maliyet)
+    olarak 0-1 arasındadır. Ortam bilgisi yokken varsayılan ağırlıklarla puan
+    eski `1 / (1 + len(path))` değeriyle aynıdır.
+    
+    Kenar başına ek maliyetler bir kez sıralı dizilere yazılır ve çok sayıda
+    aday rota tek bir vektörel geçişte puanlanır; hesaplanan puanlar rota
+    bazında önbelleğe alınır. Ortam tabloları değiştiğinde
+    (`MonteCarloSimulation.version`) diziler ve önbellek kendiliğinden
+    yenilenir; sözlükler elle değiştirildiyse `refresh` çağrılmalıdır.
+    """
+    def __init__(self, monte_carlo: Optional[MonteCarloSimulation] = None, hop_weight: float = 1.0,
+                 obstacle_weight: float = 1.0, delay_weight: float = 1.0, cache_size: int = 4096):
+        """
+        Args:
+            monte_carlo (MonteCarloSimulation): Engel olasılıkları ve gecikmeler
+            hop_weight (float): Rotadaki düğüm başına maliyet
+            obstacle_weight (float): Kenar engel olasılığının ağırlığı
+            delay_weight (float): Kenar gecikmesinin (faktör - 1) ağırlığı
+            cache_size (int): Önbellekte tutulacak en fazla rota puanı
+        """
+        self.monte_carlo = monte_carlo
+        self.hop_weight = hop_weight
+        self.obstacle_weight = obstacle_weight
+        self.delay_weight = delay_weight
+        self.cache_size = cache_size
+        
+        self._version = None
+        self._keys = np.empty(0, dtype=np.int64)  # Sıralı (küçük << 32 | büyük) kenar anahtarları
+        self._extra = np.empty(0)                 # Anahtar başına ek kenar maliyeti
+        self._cache: 'OrderedDict[Tuple[int, ...], float]' = OrderedDict()
+        
+    def refresh(self):
+        """Kenar maliyet dizilerini ortam tablolarından yeniden kurar ve önbelleği siler"""
+        self._cache.clear()
+        monte_carlo = self.monte_carlo
+        if monte_carlo is None:
+            return
+        self._version = monte_carlo.version
+        
+        extra: Dict[Tuple[int, int], float] = {}
+        for (u, v), probability in monte_carlo.obstacles.items():
+            if u < v:
+                extra[(u, v)] = self.obstacle_weight * probability
+        for (u, v), factor in monte_carlo.delays.items():
+            if u < v:
+                extra[(u, v)] = extra.get((u, v), 0.0) + self.delay_weight * (factor - 1.0)
+        keys = np.fromiter((u << 32 | v for u, v in extra), dtype=np.int64, count=len(extra))
+        values = np.fromiter(extra.values(), dtype=np.float64, count=len(extra))
+        order = np.argsort(keys)
+        self._keys, self._extra = keys[order], values[order]
+        
+    def _sync(self):
+        """Ortam tabloları değiştiyse dizileri yeniler"""
+        if self.monte_carlo is not None and self.monte_carlo.version != self._version:
+            self.refresh()
+            
+    def score(self, path: List[int]) -> float:
+        """
+        Tek bir rotayı puanlar.
+        
+        Args:
+            path (List[int]): Rota düğümleri
+            
+        Returns:
+            float: Rota puanı (0-1 arası, yüksek daha iyi)
+        """
+        self._sync()
+        value = self._cache.get(tuple(path))
+        if value is None:
+            value = float(self.score_many([path])[0])
+        return value
+        
+    def score_many(self, paths: Sequence[List[int]]) -> np.ndarray:
+        """
+        Rotaları tek bir vektörel geçişte puanlar.
+        
+        Önbellekte olan rotalar yeniden hesaplanmaz.
+        
+        Args:
+            paths: Puanlanacak rotalar
+            
+        Returns:
+            np.ndarray: Rota başına puan
+        """
+        self._sync()
+        cache = self._cache
+        scores = np.empty(len(paths))
+        missing = []
+        for index, path in enumerate(paths):
+            value = cache.get(tuple(path))
+            if value is None:
+                missing.append(index)
+            else:
+                scores[index] = value
+                
+        if missing:
+            computed = self._compute([paths[index] for index in missing])
+            scores[missing] = computed
+            for index, value in zip(missing, computed.tolist()):
+                cache[tuple(paths[index])] = value
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return scores
+        
+    def _compute(self, paths: Sequence[List[int]]) -> np.ndarray:
+        """Rotaları önbelleğe bakmadan puanlar"""
+        lengths = np.fromiter(map(len, paths), dtype=np.int64, count=len(paths))
+        cost = self.hop_weight * lengths
+        if len(self._keys):
+            nodes = np.fromiter(chain.from_iterable(paths), dtype=np.int64, count=int(lengths.sum()))
+            owner = np.repeat(np.arange(len(paths)), lengths)
+            # Ardışık düğüm çiftlerinden yalnızca aynı rotaya ait olanlar kenardır
+            inner = owner[1:] == owner[:-1]
+            u, v = nodes[:-1][inner], nodes[1:][inner]
+            keys = np.minimum(u, v) << 32 | np.maximum(u, v)
+            positions = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+            found = self._keys[positions] == keys
+            cost = cost + np.bincount(owner[1:][inner][found], weights=self._extra[positions[found]],
+                                      minlength=len(paths))
+        return 1.0 / (1.0 + cost)
 
 class MinimaxRouteSelector:
     """
     Minimax Rota Seçici sınıfı, dronun en uygun rotayı seçmesi için kullanılır.
     Yolları değerlendirerek en iyi rotayı belirler.
+    
+    Graf verilirse seçim dron ile ortam arasındaki bir oyun ağacında yapılır:
+    dron sıradaki düğümü seçer, ortam ise bu kenarı (Monte Carlo engel
+    olasılığı yeterince yüksekse ve engel hakkı kaldıysa) engelleyebilir.
+    Dron toplam yolculuk maliyetini en aza, ortam en çoğa indirmeye çalışır.
+    Arama yinelemeli derinleştirme, Zobrist anahtarlı transpozisyon tablosu,
+    hamle sıralaması ve süre sınırıyla alpha-beta budamalı yapılır.
     """
-    def __init__(self, max_depth: int = 3):
+    def __init__(self, max_depth: int = 3, graph: Optional[Graph] = None,
+                 monte_carlo: Optional[MonteCarloSimulation] = None,
+                 time_budget: float = 0.05, max_blockages: int = 1,
+                 block_threshold: float = 0.5, table_bits: int = 16,
+                 scorer: Optional[RouteScorer] = None, workers: int = 1):
         """
         Args:
-            max_depth (int): Minimax algoritmasının maksimum derinliği
+            max_depth (int): Minimax algoritmasının maksimum derinliği (dron hamlesi)
+            graph (Graph): Oyun ağacının kurulacağı graf (verilmezse rotalar
+                yalnızca uzunluklarına göre seçilir)
+            monte_carlo (MonteCarloSimulation): Engel olasılıkları ve gecikmeler
+            time_budget (float): Karar başına süre sınırı (saniye)
+            max_blockages (int): Ortamın bir aramada engelleyebileceği kenar sayısı
+            block_threshold (float): Ortamın engelleyebileceği en düşük engel olasılığı
+            table_bits (int): Transpozisyon tablosu boyutu (2 tabanında)
+            scorer (RouteScorer): Rota puanlama motoru (varsayılan: `monte_carlo`
+                üzerinde varsayılan ağırlıklar)
+            workers (int): Kök hamlelerinin dağıtılacağı süreç sayısı (1: seri arama)
         """
+        if workers < 1:
+            raise ValueError(f"İşçi sayısı en az 1 olmalıdır: {workers}")
         self.max_depth = max_depth
+        self.graph = graph
+        self.monte_carlo = monte_carlo
+        self.time_budget = time_budget
+        self.max_blockages = max_blockages
+        self.block_threshold = block_threshold
+        self.keys = ZobristKeys()
+        self.table = TranspositionTable(table_bits)
+        self.scorer = scorer or RouteScorer(monte_carlo)
+        self.last_stats = SearchStats()
+        
+        self._moves: Dict[int, List[Tuple[int, float, bool]]] = {}
+        self._blocked: Set[Tuple[int, int]] = set()
+        self._heuristic = None
+        self._deadline = math.inf
+        self._stats = SearchStats()
+        
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_version = None
+        self._shared_bound = None
+        self._decision = 0
         
     def evaluate_route(self, path: List[int]) -> float:
         """
@@ -23,8 +328,8 @@ class MinimaxRouteSelector:
         Returns:
             float: Rota değerlendirme puanı (0-1 arası)
         """
-        # Yol uzunluğuna göre değerlendirme
-        return 1.0 / (1.0 + len(path))
+        # Yol uzunluğu, engel olasılıkları ve gecikmelere göre değerlendirme
+        return self.scorer.score(path)
         
     def minimax(self, paths: List[List[int]], depth: int, 
                 alpha: float, beta: float, maximizing: bool) -> Tuple[float, int]:
@@ -88,16 +393,340 @@ class MinimaxRouteSelector:
         if not paths:
             return []
             
-        # Tüm rotaları değerlendir
-        evaluated_paths = []
-        for path in paths:
-            score = self.evaluate_route(path)
-            evaluated_paths.append((path, score))
+        if self.graph is not None:
+            # Oyun ağacında kök hamleleri adayların ilk adımlarıyla sınırlanır
+            start, target = paths[0][0], paths[0][-1]
+            first_hops = [path[1] for path in paths if len(path) > 1]
+            if first_hops:
+                best_hop, _ = self.search(start, target, root_moves=first_hops)
+                for path in paths:
+                    if len(path) > 1 and path[1] == best_hop:
+                        return path
+                        
+        # Kökte tam pencereli minimax en yüksek puanlı ilk rotayı seçer; tüm
+        # adaylar tek geçişte puanlanır
+        scores = self.scorer.score_many(paths)
+        return paths[int(np.argmax(scores))]
+        
+    def search(self, start: int, target: int, root_moves: Optional[Iterable[int]] = None,
+               blocked: Iterable[Tuple[int, int]] = ()) -> Tuple[Optional[int], float]:
+        """
+        Dron-ortam oyun ağacında en iyi sonraki düğümü arar.
+        
+        Derinlik 1'den `max_depth`'e kadar artırılır; süre sınırı dolarsa son
+        tamamlanan derinliğin sonucu döndürülür. Sonraki derinlikte ilk önce
+        önceki derinliğin en iyi hamlesi denenir. İstatistikler `last_stats`
+        içindedir. `workers` > 1 ise her derinlikte kök hamleleri süreç
+        havuzuna bölünür (bkz. `_parallel_root`).
+        
+        Args:
+            start (int): Dronun bulunduğu düğüm
+            target (int): Hedef düğüm
+            root_moves: Kökte denenebilecek sonraki düğümler (varsayılan: tüm komşular)
+            blocked: Bilinen engelli kenarlar
+            
+        Returns:
+            Tuple[Optional[int], float]: (en iyi sonraki düğüm, en kötü durumda
+                hedefe kalan maliyet); hamle yoksa (None, sonsuz)
+        """
+        if self.graph is None:
+            raise ValueError("Oyun ağacı araması için graf verilmelidir")
+        if start == target:
+            return None, 0.0
+        self._prepare(target, blocked)
+        self._decision += 1
+        stats = self._stats = SearchStats()
+        begin = time.perf_counter()
+        self._deadline = begin + self.time_budget
+        pool = self._root_pool() if self.workers > 1 else None
+        
+        moves = self._ordered_moves(start, None)
+        if root_moves is not None:
+            allowed = set(root_moves)
+            moves = [move for move in moves if move[0] in allowed]
+        best_move = moves[0][0] if moves else None
+        best_value = math.inf
+        key = self._root_key(start, target)
+        
+        try:
+            for depth in range(1, self.max_depth + 1):
+                if pool is not None and len(moves) > 1:
+                    value, move = self._parallel_root(pool, start, target, key, depth, moves)
+                else:
+                    value, move = self._root(start, key, depth, moves)
+                best_value, best_move = value, move
+                stats.depth = depth
+                # İlk önce önceki derinliğin en iyi hamlesini dene
+                moves.sort(key=lambda item: item[0] != move)
+                if value == math.inf:
+                    break
+        except _SearchTimeout:
+            stats.timed_out = True
+            
+        stats.elapsed = time.perf_counter() - begin
+        self.last_stats = stats
+        return best_move, best_value
+        
+    def close(self):
+        """Paralel arama için açılan süreç havuzunu kapatır"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            
+    def _root_pool(self) -> ProcessPoolExecutor:
+        """
+        Kök bölmeli arama havuzunu döndürür.
+        
+        Havuz kararlar arasında korunur; işçilerdeki graf veya ortam kopyası
+        eskidiyse (`Graph.version`, `MonteCarloSimulation.version`) yeniden kurulur.
+        """
+        version = (self.graph.version if self.graph is not None else None,
+                   self.monte_carlo.version if self.monte_carlo is not None else None)
+        if self._pool is not None and self._pool_version != version:
+            self.close()
+        if self._pool is None:
+            options = {'max_depth': self.max_depth, 'time_budget': self.time_budget,
+                       'max_blockages': self.max_blockages, 'block_threshold': self.block_threshold,
+                       'table_bits': (self.table.mask + 1).bit_length() - 1}
+            # [dönem, sınır]: süresi dolmuş eski işler yeni dönemin sınırını değiştiremez
+            self._shared_bound = multiprocessing.Array('d', [0.0, math.inf])
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_root_worker,
+                                             initargs=(self.graph, self.monte_carlo, options,
+                                                       self._shared_bound))
+            self._pool_version = version
+        return self._pool
+        
+    def _parallel_root(self, pool: ProcessPoolExecutor, start: int, target: int, key: int, depth: int,
+                       moves: List[Tuple[int, float, bool]]) -> Tuple[float, Optional[int]]:
+        """
+        Kök hamlelerini süreç havuzuna bölerek arar.
+        
+        Genç kardeşler bekler (young brothers wait): en umut verici ilk hamle
+        bu süreçte tam pencereyle aranır, kalan hamleler onun değerini üst
+        sınır alarak işçilere dağıtılır. İşçiler buldukları kesin değerlerle
+        paylaşılan sınırı daraltır, sonradan başlayan hamleler daha dar
+        pencereyle aranır. Sonuçlar hamle sırasıyla birleştirilir; sınırla
+        eşit çıkan önceki bir hamle yeniden aranarak seçim seri aramayla
+        aynı kalır. Süre sınırı dolarsa yavaş alt ağaçlar beklenmez.
+        """
+        budget = self.max_blockages
+        neighbor, cost, blockable = moves[0]
+        best = self._environment(start, neighbor, cost, blockable and budget > 0, key, budget, depth,
+                                 -math.inf, math.inf)
+        best_move = neighbor
+        self._stats.generated += len(moves)
+        if best == 0.0:
+            return best, best_move
+            
+        shared = self._shared_bound
+        with shared.get_lock():
+            epoch = shared[0] = shared[0] + 1
+            shared[1] = best
+        blocked = tuple(sorted(self._blocked))
+        remaining = self._deadline - time.perf_counter()
+        futures = [pool.submit(_search_root_move, (self._decision, epoch, start, target, blocked, move,
+                                                   depth, best, remaining))
+                   for move in moves[1:]]
+        done, pending = wait(futures, timeout=max(remaining, 0.0))
+        if pending:
+            for future in pending:
+                future.cancel()
+            raise _SearchTimeout()
+            
+        results = [future.result() for future in futures]
+        stats = self._stats
+        for value, _, counters in results:
+            if value is None:
+                raise _SearchTimeout()
+            stats.nodes += counters[0]
+            stats.generated += counters[1]
+            stats.pruned += counters[2]
+            stats.cutoffs += counters[3]
+            stats.tt_hits += counters[4]
+            
+        # Yalnızca pencere içinde kalan (kesin) değerler ilk hamleyi geçebilir
+        best_index = 0
+        for index, (value, beta, _) in enumerate(results, 1):
+            if value < beta and value < best:
+                best, best_index = value, index
+        # En iyi değeri sınır alıp aşan önceki hamleler ona eşit olabilir
+        for index, (value, beta, _) in enumerate(results[:max(best_index - 1, 0)], 1):
+            if beta == best:
+                neighbor, cost, blockable = moves[index]
+                exact = self._environment(start, neighbor, cost, blockable and budget > 0, key, budget,
+                                          depth, -math.inf, math.nextafter(best, math.inf))
+                if exact == best:
+                    best_index = index
+                    break
+        return best, moves[best_index][0]
+        
+    def _search_root_move(self, decision: int, epoch: float, start: int, target: int,
+                          blocked: Tuple[Tuple[int, int], ...], move: Tuple[int, float, bool], depth: int,
+                          beta: float, remaining: float,
+                          shared_bound=None) -> Tuple[Optional[float], float, Tuple[int, ...]]:
+        """
+        İşçi tarafı: tek bir kök hamlesini (-sonsuz, beta) penceresiyle arar.
+        
+        Aynı karara ait işler transpozisyon tablosunu paylaşır.
+        
+        Returns:
+            Tuple: (değer veya süre dolduysa None, kullanılan beta, sayaçlar)
+        """
+        if decision != self._decision:
+            self._prepare(target, blocked)
+            self._decision = decision
+        stats = self._stats = SearchStats()
+        self._deadline = time.perf_counter() + remaining
+        if shared_bound is not None:
+            with shared_bound.get_lock():
+                if shared_bound[0] == epoch:
+                    beta = min(beta, shared_bound[1])
             
-        # Rotaları puana göre sırala
-        evaluated_paths.sort(key=lambda x: x[1], reverse=True)
+        neighbor, cost, blockable = move
+        budget = self.max_blockages
+        try:
+            value = self._environment(start, neighbor, cost, blockable and budget > 0,
+                                      self._root_key(start, target), budget, depth, -math.inf, beta)
+        except _SearchTimeout:
+            value = None
+        if value is not None and value < beta and shared_bound is not None:
+            with shared_bound.get_lock():
+                if shared_bound[0] == epoch and value < shared_bound[1]:
+                    shared_bound[1] = value
+        return value, beta, (stats.nodes, stats.generated, stats.pruned, stats.cutoffs, stats.tt_hits)
+        
+    def _prepare(self, target: int, blocked: Iterable[Tuple[int, int]]):
+        """Arama öncesi hedefe özgü tabloları hazırlar"""
+        self._target = target
+        self._heuristic = self.graph.shortest_path_tree(target).distance
+        self._blocked = {(min(u, v), max(u, v)) for u, v in blocked}
+        self._moves = {}
+        self.table.clear()
+        
+    def _root_key(self, start: int, target: int) -> int:
+        key = self.keys.node(start) ^ self.keys.target(target) ^ self.keys.budget(self.max_blockages)
+        for u, v in self._blocked:
+            key ^= self.keys.edge(u, v)
+        return key
         
-        # Minimax ile en iyi rotayı seç
-        _, best_idx = self.minimax(paths, self.max_depth, float('-inf'), float('inf'), True)
+    def _edge_moves(self, node: int) -> List[Tuple[int, float, bool]]:
+        """Düğümün (komşu, maliyet, engellenebilir mi) hamleleri (önbellekli)"""
+        moves = self._moves.get(node)
+        if moves is None:
+            moves = []
+            for neighbor, weight in self.graph.weighted_neighbors(node):
+                factor, probability = 1.0, 0.0
+                if self.monte_carlo is not None:
+                    factor = self.monte_carlo.get_delay_factor(node, neighbor)
+                    probability = self.monte_carlo.obstacles.get((min(node, neighbor), max(node, neighbor)), 0.0)
+                moves.append((neighbor, weight * factor, probability >= self.block_threshold))
+            self._moves[node] = moves
+        return moves
         
-        return paths[best_idx]
+    def _ordered_moves(self, node: int, first: Optional[int]) -> List[Tuple[int, float, bool]]:
+        """Engelsiz hamleleri umut vadeden önce gelecek şekilde sıralar"""
+        heuristic = self._heuristic
+        moves = [move for move in self._edge_moves(node)
+                 if (min(node, move[0]), max(node, move[0])) not in self._blocked]
+        moves.sort(key=lambda move: (move[0] != first, move[1] + heuristic(move[0])))
+        return moves
+        
+    def _root(self, node: int, key: int, depth: int,
+              moves: List[Tuple[int, float, bool]]) -> Tuple[float, Optional[int]]:
+        """Kök düğümü tam pencereyle arar; (değer, en iyi hamle) döndürür"""
+        best, best_move = math.inf, moves[0][0] if moves else None
+        budget = self.max_blockages
+        self._stats.generated += len(moves)
+        for neighbor, cost, blockable in moves:
+            value = self._environment(node, neighbor, cost, blockable and budget > 0, key, budget, depth,
+                                      -math.inf, best)
+            if value < best:
+                best, best_move = value, neighbor
+        return best, best_move
+        
+    def _drone(self, node: int, key: int, budget: int, depth: int, alpha: float, beta: float) -> float:
+        """Dronun hamle sırası: hedefe kalan maliyeti en aza indirir"""
+        stats = self._stats
+        stats.nodes += 1
+        if not stats.nodes & 255 and time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+        if node == self._target:
+            return 0.0
+        if depth == 0:
+            return self._heuristic(node)
+            
+        alpha_orig, beta_orig = alpha, beta
+        entry = self.table.get(key)
+        first = None
+        if entry is not None:
+            first = entry[4]
+            if entry[1] >= depth:
+                value, flag = entry[2], entry[3]
+                if flag == _EXACT:
+                    stats.tt_hits += 1
+                    return value
+                if flag == _LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    stats.tt_hits += 1
+                    return value
+                    
+        moves = self._ordered_moves(node, first)
+        stats.generated += len(moves)
+        heuristic = self._heuristic
+        best, best_move = math.inf, -1
+        for index, (neighbor, cost, blockable) in enumerate(moves):
+            # Sezgisel tutarlı olduğundan cost + h(komşu) bu hamlenin alt sınırıdır
+            bound = cost + heuristic(neighbor)
+            if bound >= beta:
+                best = min(best, bound)
+                if index > 0:
+                    # İlk hamleden sonrakiler alt sınıra göre sıralı: kalanlar da geçemez
+                    stats.cutoffs += 1
+                    stats.pruned += len(moves) - index
+                    break
+                stats.pruned += 1
+                continue
+            value = self._environment(node, neighbor, cost, blockable and budget > 0, key, budget, depth,
+                                      alpha, beta)
+            if value < best:
+                best, best_move = value, neighbor
+                beta = min(beta, best)
+            if best <= alpha:
+                stats.cutoffs += 1
+                stats.pruned += len(moves) - index - 1
+                break
+                
+        flag = _UPPER if best <= alpha_orig else _LOWER if best >= beta_orig else _EXACT
+        self.table.store(key, depth, best, flag, best_move)
+        return best
+        
+    def _environment(self, node: int, neighbor: int, cost: float, blockable: bool, key: int,
+                     budget: int, depth: int, alpha: float, beta: float) -> float:
+        """
+        Ortamın hamle sırası: dronun seçtiği kenarı engelleyip engellememeye
+        karar verir ve kalan maliyeti en çoğa çıkarır.
+        """
+        keys = self.keys
+        best = -math.inf
+        if blockable:
+            # Engel: dron aynı düğümde kalır, kenar kalıcı olarak kapanır. Engel
+            # hakkı sınırlı olduğundan bu dal derinlik tüketmeden sonlanır.
+            edge = (min(node, neighbor), max(node, neighbor))
+            self._blocked.add(edge)
+            blocked_key = key ^ keys.edge(node, neighbor) ^ keys.budget(budget) ^ keys.budget(budget - 1)
+            try:
+                best = self._drone(node, blocked_key, budget - 1, depth, alpha, beta)
+            finally:
+                self._blocked.discard(edge)
+            if best >= beta:
+                self._stats.cutoffs += 1
+                self._stats.pruned += 1
+                return best
+            alpha = max(alpha, best)
+            
+        moved_key = key ^ keys.node(node) ^ keys.node(neighbor)
+        value = cost + self._drone(neighbor, moved_key, budget, depth - 1, alpha - cost, beta - cost)
+        return max(best, value)
@@ -1,19 +1,271 @@
 import random
-from typing import List, Tuple, Dict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Iterator, List, Optional, Sequence, Tuple, Dict
+
+import numpy as np
+
+from streamstats import EnvironmentStats
+
+DELAY_PROBABILITY = 0.4  # %40 gecikme olasılığı
+
+# Toplu motorda tek bir (simülasyon, kenar) örneği için ayrılan yaklaşık bayt
+_BYTES_PER_SAMPLE = 24
+
+@dataclass
+class _BlockResult:
+    """
+    Bir simülasyon bloğunun, önceki bloklardan bağımsız olarak hesaplanmış özeti.
+    
+    Engel ve gecikme sözlükleri simülasyonlar arasında temizlenmediği için her
+    simülasyonun sonucu öncekilere bağlıdır; blok bu bağımlılığı kenar başına
+    "ilk çekiliş" indeksleriyle taşır, birleştirme sırasında çözülür.
+    """
+    iterations: int
+    obstacle_first: np.ndarray  # Kenar başına ilk engel çekilişi (yoksa iterations)
+    delay_first: np.ndarray     # Kenar başına ilk gecikme çekilişi (yoksa iterations)
+    delay_last: np.ndarray      # Kenar başına son çekilen gecikme
+    delay_row_sums: np.ndarray  # Önceki bloklar yokmuş gibi simülasyon başına gecikme toplamı
+    obstacle_draws: np.ndarray  # Kenar başına engel çekilişi sayısı
+    delay_draws: np.ndarray     # Kenar başına gecikme çekilişi sayısı
+    max_delay: float
+
+def _simulate_block(num_edges: int, iterations: int, seed: np.random.SeedSequence,
+                    obstacle_probability: float, delay_probability: float,
+                    max_delay: float) -> _BlockResult:
+    """Bir blok simülasyonun tüm çekilişlerini kenar indeksleri üzerinde toplu yapar"""
+    rng = np.random.default_rng(seed)
+    
+    # Diziler (kenar, simülasyon) düzenindedir; düz indeksler kenar, sonra simülasyon sırasıyla gelir
+    edges, rows = np.divmod(np.flatnonzero(rng.random((num_edges, iterations)) < obstacle_probability), iterations)
+    first_of_edge = np.ones(len(edges), dtype=bool)
+    first_of_edge[1:] = edges[1:] != edges[:-1]
+    obstacle_first = np.full(num_edges, iterations, dtype=np.int64)
+    obstacle_first[edges[first_of_edge]] = rows[first_of_edge]
+    obstacle_draws = np.bincount(edges, minlength=num_edges)
+    
+    edges, rows = np.divmod(np.flatnonzero(rng.random((num_edges, iterations)) < delay_probability), iterations)
+    values = rng.uniform(1.0, max_delay, len(edges))
+    first_of_edge = np.ones(len(edges), dtype=bool)
+    first_of_edge[1:] = edges[1:] != edges[:-1]
+    last_of_edge = np.ones(len(edges), dtype=bool)
+    last_of_edge[:-1] = first_of_edge[1:]
+    
+    # Her çekiliş, aynı kenarın bir sonraki çekilişine kadar toplama katkı verir
+    until = np.empty_like(rows)
+    until[:-1] = rows[1:]
+    until[last_of_edge] = iterations
+    change = (np.bincount(rows, weights=values, minlength=iterations + 1)
+              - np.bincount(until, weights=values, minlength=iterations + 1))
+    
+    delay_first = np.full(num_edges, iterations, dtype=np.int64)
+    delay_first[edges[first_of_edge]] = rows[first_of_edge]
+    delay_last = np.zeros(num_edges)
+    delay_last[edges[last_of_edge]] = values[last_of_edge]
+    
+    return _BlockResult(
+        iterations=iterations,
+        obstacle_first=obstacle_first,
+        delay_first=delay_first,
+        delay_last=delay_last,
+        delay_row_sums=np.cumsum(change)[:iterations],
+        obstacle_draws=obstacle_draws,
+        delay_draws=np.bincount(edges, minlength=num_edges),
+        max_delay=float(values.max(initial=0.0)),
+    )
+
+def _run_blocks(jobs: List[tuple], workers: int) -> Iterator[_BlockResult]:
+    """
+    Blok işlerini çalıştırır ve sonuçları iş sırasıyla döndürür.
+    
+    Paralel çalışmada bellekte bekleyen sonuç sayısı sınırlı kalsın diye
+    havuza aynı anda en fazla `2 * workers` iş verilir.
+    """
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield _simulate_block(*job)
+        return
+        
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        pending = deque()
+        for job in jobs:
+            pending.append(pool.submit(_simulate_block, *job))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+class _EnvironmentMerger:
+    """
+    Blok özetlerini sırayla birleştirip skaler döngünün ürettiği simülasyon
+    başına değerleri (engel sözlüğü boyu, gecikme toplamı) yeniden kurar.
+    """
+    def __init__(self, num_nodes: int, obstacles: Dict[Tuple[int, int], float],
+                 delays: Dict[Tuple[int, int], float]):
+        self.num_nodes = num_nodes
+        num_edges = num_nodes * (num_nodes - 1) // 2
+        # Başlangıç durumu: mevcut sözlüklerdeki (i < j) kenarlar
+        self.had_obstacle = np.zeros(num_edges, dtype=bool)
+        self.had_obstacle[self._edge_indices(obstacles)] = True
+        self.base_obstacles = len(obstacles) - 2 * int(self.had_obstacle.sum())
+        self.delay = np.zeros(num_edges)
+        delay_keys = [edge for edge in delays if edge[0] < edge[1]]
+        self.delay[self._edge_indices(delay_keys)] = [delays[edge] for edge in delay_keys]
+        self.drawn_obstacle = np.zeros(num_edges, dtype=bool)
+        self.drawn_delay = np.zeros(num_edges, dtype=bool)
+        self.max_delay = float(max(delays.values(), default=0.0))
+        
+    def _edge_indices(self, edges) -> np.ndarray:
+        """(i, j) çiftlerini i < j üst üçgen dizisindeki indekslere çevirir"""
+        pairs = np.array([edge for edge in edges if edge[0] < edge[1]], dtype=np.int64).reshape(-1, 2)
+        i, j = pairs[:, 0], pairs[:, 1]
+        return i * (2 * self.num_nodes - i - 1) // 2 + (j - i - 1)
+        
+    def add(self, block: _BlockResult) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bloğu birleştirir.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Bloktaki her simülasyon için
+                (engel sözlüğü boyu, gecikme değerleri toplamı)
+        """
+        rows = block.iterations
+        
+        # Sözlük boyu yalnızca ilk kez engel çekilen kenarlarla büyür
+        new_obstacles = ~self.had_obstacle & (block.obstacle_first < rows)
+        first_seen = np.cumsum(np.bincount(block.obstacle_first[new_obstacles], minlength=rows))
+        obstacle_counts = self.base_obstacles + 2 * (int(self.had_obstacle.sum()) + first_seen)
+        self.had_obstacle |= new_obstacles
+        self.drawn_obstacle |= block.obstacle_first < rows
+        
+        # Önceki bloklardan kalan gecikmeler, kenar yeniden çekilene kadar toplama katkı verir
+        redrawn = block.delay_first < rows
+        dropped = np.bincount(block.delay_first[redrawn], weights=self.delay[redrawn], minlength=rows)
+        carried = self.delay.sum() - np.cumsum(dropped)
+        delay_sums = 2 * (block.delay_row_sums + carried)
+        self.delay = np.where(redrawn, block.delay_last, self.delay)
+        self.drawn_delay |= redrawn
+        
+        self.max_delay = max(self.max_delay, block.max_delay)
+        return obstacle_counts, delay_sums
+        
+    def write_state(self, simulation: 'MonteCarloSimulation', seed: np.random.SeedSequence):
+        """Son simülasyondaki engel ve gecikme sözlüklerini simülasyon nesnesine yazar"""
+        rows, cols = np.triu_indices(self.num_nodes, 1)
+        
+        drawn = np.nonzero(self.drawn_obstacle)[0]
+        # Son engel çekilişinin değeri diğer çekilişlerden bağımsızdır; bir kez çekmek yeterli
+        probabilities = np.random.default_rng(seed).uniform(0.1, 1.0, len(drawn)).tolist()
+        forward = list(zip(rows[drawn].tolist(), cols[drawn].tolist()))
+        simulation.obstacles.update(zip(forward, probabilities))
+        simulation.obstacles.update(zip(((j, i) for i, j in forward), probabilities))
+        
+        drawn = np.nonzero(self.drawn_delay)[0]
+        values = self.delay[drawn].tolist()
+        forward = list(zip(rows[drawn].tolist(), cols[drawn].tolist()))
+        simulation.delays.update(zip(forward, values))
+        simulation.delays.update(zip(((j, i) for i, j in forward), values))
+
+@dataclass
+class RouteRisk:
+    """Bir rotanın örneklemeyle kestirilmiş risk özeti"""
+    path: List[int]
+    block_probability: float  # Rotada en az bir kenarın engelli olma olasılığı
+    block_ci: float           # Engel olasılığı Wilson güven aralığının yarı genişliği
+    expected_delay: float     # Engelli kenarlarda beklenen toplam gecikme
+    delay_ci: float           # Beklenen gecikme güven aralığının yarı genişliği
+    samples: int              # Kullanılan örnek sayısı
+
+ROUTE_RANKINGS = ('block_probability', 'expected_delay')
+
+class _RouteSampler:
+    """
+    Aday rotaları ortak rastgele sayılarla örnekler.
+    
+    Her örnekte kenar başına tek bir engel çekilişi yapılır ve o kenarı
+    kullanan tüm rotalar aynı sonucu görür. Böylece rotalar arasındaki farkın
+    varyansı küçülür ve sıralama çok daha az örnekle netleşir.
+    """
+    def __init__(self, paths: Sequence[List[int]], obstacles: Dict[Tuple[int, int], float],
+                 delays: Dict[Tuple[int, int], float], rng: np.random.Generator):
+        index: Dict[Tuple[int, int], int] = {}
+        for path in paths:
+            for u, v in zip(path, path[1:]):
+                index.setdefault((min(u, v), max(u, v)), len(index))
+        self.incidence = np.zeros((len(paths), len(index)))  # rota x kenar kullanım sayısı
+        for row, path in enumerate(paths):
+            for u, v in zip(path, path[1:]):
+                self.incidence[row, index[(min(u, v), max(u, v))]] += 1
+        self.probabilities = np.array([obstacles.get(edge, 0.0) for edge in index])
+        self.weighted = self.incidence * np.array([delays.get(edge, 1.0) for edge in index])
+        self.rng = rng
+        
+        self.count = 0
+        # Ölçüt başına (0: engel, 1: gecikme) toplamlar ve rota çiftleri için çarpım toplamları
+        self.sums = np.zeros((2, len(paths)))
+        self.products = np.zeros((2, len(paths), len(paths)))
+        
+    def sample(self, size: int):
+        """`size` yeni örnek çekip toplamlara ekler"""
+        blocked = (self.rng.random((size, len(self.probabilities))) < self.probabilities).astype(np.float64)
+        values = np.stack(((blocked @ self.incidence.T > 0).astype(np.float64), blocked @ self.weighted.T))
+        self.sums += values.sum(axis=1)
+        self.products += np.einsum('msr,mst->mrt', values, values)
+        self.count += size
+        
+    def means(self) -> np.ndarray:
+        return self.sums / self.count
+        
+    def half_widths(self, z: float) -> np.ndarray:
+        """
+        Her ölçüt ve rota için ortalamanın güven aralığı yarı genişliği.
+        
+        Engel olasılığı bir oran olduğundan Wilson skor aralığı kullanılır;
+        Wald aralığından farklı olarak hiç engel görülmediğinde de sıfır
+        genişlik vermez. Gecikme için normal yaklaşım kullanılır.
+        """
+        n = self.count
+        squares = np.diagonal(self.products, axis1=1, axis2=2)
+        variance = np.maximum(squares - self.sums ** 2 / n, 0.0) / max(n - 1, 1)
+        widths = z * np.sqrt(variance / n)
+        p = self.sums[0] / n
+        widths[0] = z / (1 + z * z / n) * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+        return widths
+        
+    def difference_half_width(self, metric: int, a: int, b: int, z: float) -> float:
+        """İki rotanın aynı örneklerdeki farkının güven aralığı yarı genişliği"""
+        n = self.count
+        squares = self.products[metric]
+        total = self.sums[metric, a] - self.sums[metric, b]
+        square_total = squares[a, a] + squares[b, b] - 2 * squares[a, b]
+        variance = max(square_total - total ** 2 / n, 0.0) / max(n - 1, 1)
+        return z * float(np.sqrt(variance / n))
+        
+    def results(self, paths: Sequence[List[int]], z: float) -> List[RouteRisk]:
+        means = self.means()
+        widths = self.half_widths(z)
+        return [RouteRisk(list(path), float(means[0, r]), float(widths[0, r]),
+                          float(means[1, r]), float(widths[1, r]), self.count)
+                for r, path in enumerate(paths)]
 
 class MonteCarloSimulation:
     """
     Monte Carlo Simülasyon sınıfı, ortamdaki rastgele engelleri ve gecikmeleri simüle eder.
     Dronun karşılaşabileceği çevresel faktörleri modellemek için kullanılır.
     """
-    def __init__(self, num_nodes: int):
+    def __init__(self, num_nodes: int, seed: Optional[int] = None):
         """
         Args:
             num_nodes (int): Simülasyon alanındaki toplam düğüm sayısı
+            seed (int): Tohum değeri; verilirse tüm çekilişler tekrarlanabilir olur
         """
         self.num_nodes = num_nodes
+        self.rng = random.Random(seed)  # Genel `random` durumundan bağımsız üreteç
         self.obstacles: Dict[Tuple[int, int], float] = {}  # (düğüm1, düğüm2) -> engel_olasılığı
         self.delays: Dict[Tuple[int, int], float] = {}     # (düğüm1, düğüm2) -> gecikme_faktörü
+        self.version = 0  # Engel veya gecikme tabloları her değiştiğinde artar
         
     def generate_obstacles(self, probability: float = 0.3):
         """
@@ -21,12 +273,19 @@ class MonteCarloSimulation:
         
         Args:
             probability (float): Engel oluşturma olasılığı (0-1 arası)
+            
+        Returns:
+            List[Tuple[int, int]]: Bu çağrıda engel çekilen (i < j) kenarlar
         """
+        drawn = []
         for i in range(self.num_nodes):
             for j in range(i + 1, self.num_nodes):
-                if random.random() < probability:
-                    self.obstacles[(i, j)] = random.uniform(0.1, 1.0)
+                if self.rng.random() < probability:
+                    self.obstacles[(i, j)] = self.rng.uniform(0.1, 1.0)
                     self.obstacles[(j, i)] = self.obstacles[(i, j)]
+                    drawn.append((i, j))
+        self.version += 1
+        return drawn
                     
     def generate_delays(self, max_delay: float = 2.0):
         """
@@ -34,13 +293,20 @@ class MonteCarloSimulation:
         
         Args:
             max_delay (float): Maksimum gecikme faktörü
+            
+        Returns:
+            List[Tuple[int, int]]: Bu çağrıda gecikme çekilen (i < j) kenarlar
         """
+        drawn = []
         for i in range(self.num_nodes):
             for j in range(i + 1, self.num_nodes):
-                if random.random() < 0.4:  # %40 gecikme olasılığı
-                    delay = random.uniform(1.0, max_delay)
+                if self.rng.random() < DELAY_PROBABILITY:
+                    delay = self.rng.uniform(1.0, max_delay)
                     self.delays[(i, j)] = delay
                     self.delays[(j, i)] = delay
+                    drawn.append((i, j))
+        self.version += 1
+        return drawn
                     
     def is_path_blocked(self, from_node: int, to_node: int) -> bool:
         """
@@ -55,7 +321,7 @@ class MonteCarloSimulation:
         """
         edge = (min(from_node, to_node), max(from_node, to_node))
         if edge in self.obstacles:
-            return random.random() < self.obstacles[edge]
+            return self.rng.random() < self.obstacles[edge]
         return False
         
     def get_delay_factor(self, from_node: int, to_node: int) -> float:
@@ -72,31 +338,205 @@ class MonteCarloSimulation:
         edge = (min(from_node, to_node), max(from_node, to_node))
         return self.delays.get(edge, 1.0)
         
-    def simulate_environment(self, num_simulations: int = 1000) -> Dict[str, float]:
+    def simulate_environment(self, num_simulations: int = 1000, engine: str = 'python',
+                             seed: Optional[int] = None,
+                             max_batch_bytes: int = 64 * 1024 * 1024,
+                             workers: int = 1,
+                             stats: Optional[EnvironmentStats] = None) -> Dict[str, float]:
         """
         Monte Carlo simülasyonu çalıştırarak ortamı analiz eder.
         
+        'numpy' motoru tüm simülasyonların çekilişlerini kenar indeksleri
+        üzerinde toplu diziler olarak yapar ve aynı sonuç sözlüğüne indirger.
+        Aynı dağılımlardan çektiği için istatistikler 'python' motoruyla aynıdır;
+        rastgele sayı akışları farklı olduğundan tek tek değerler birebir eşleşmez.
+        
+        `workers` > 1 ise bloklar süreç havuzunda paralel üretilir. Blok
+        bölümlemesi ve alt tohumlar yalnızca `seed` ve `max_batch_bytes` ile
+        belirlendiği, bloklar da her zaman aynı sırayla birleştirildiği için
+        sonuç işçi sayısından bağımsız olarak bit düzeyinde aynıdır.
+        
+        Sonuçlar simülasyon başına `EnvironmentStats` toplayıcısına akıtılır;
+        bellek kullanımı simülasyon sayısından bağımsızdır. Toplayıcı
+        verilirse çalışma sürerken `stats.snapshot()` ile ara sonuç alınabilir
+        ve dönen özet toplayıcıdaki tüm simülasyonları kapsar.
+        
         Args:
             num_simulations (int): Simülasyon sayısı
+            engine (str): 'python' (skaler döngü) veya 'numpy' (toplu motor)
+            seed (int): 'numpy' motoru için tohum değeri (verilmezse nesnenin
+                üretecinden türetilir)
+            max_batch_bytes (int): 'numpy' motorunda tek blok için bellek üst sınırı
+            workers (int): 'numpy' motorunda kullanılacak süreç sayısı
+            stats (EnvironmentStats): Sonuçların ekleneceği toplayıcı (kenar
+                başına engel sıklıkları `stats.edges` içindedir)
             
         Returns:
-            Dict[str, float]: Simülasyon sonuçları
+            Dict[str, float]: Simülasyon sonuçları (`EnvironmentStats.snapshot`)
                 - avg_obstacles: Ortalama engel sayısı
                 - avg_delays: Ortalama gecikme faktörü
                 - max_delay: Maksimum gecikme faktörü
+                - obstacle_variance, delay_variance: Varyanslar
+                - delay_p50, delay_p95, delay_p99: Gecikme toplamı yüzdelikleri
         """
-        results = {
-            'avg_obstacles': 0,
-            'avg_delays': 0,
-            'max_delay': 0
-        }
-        
+        if workers < 1:
+            raise ValueError(f"İşçi sayısı en az 1 olmalıdır: {workers}")
+        if stats is None:
+            stats = EnvironmentStats(self.num_nodes)
+        if engine == 'numpy':
+            if seed is None:
+                seed = self.rng.getrandbits(128)
+            self._simulate_environment_batched(num_simulations, seed, max_batch_bytes, workers, stats)
+            return stats.snapshot()
+        if engine != 'python':
+            raise ValueError(f"Bilinmeyen simülasyon motoru: {engine} (seçenekler: python, numpy)")
+        if workers != 1:
+            raise ValueError("Paralel simülasyon yalnızca 'numpy' motoruyla kullanılabilir")
+            
         for _ in range(num_simulations):
-            self.generate_obstacles()
-            self.generate_delays()
+            obstacle_edges = self.generate_obstacles()
+            delay_edges = self.generate_delays()
+            
+            stats.update([len(self.obstacles)], [sum(self.delays.values())],
+                         max(self.delays.values()) if self.delays else 0)
+            stats.update_edges(obstacle_edges, delay_edges)
+            
+        return stats.snapshot()
+        
+    def _simulate_environment_batched(self, num_simulations: int, seed: int, max_batch_bytes: int,
+                                      workers: int, stats: EnvironmentStats):
+        """
+        `simulate_environment` için NumPy tabanlı toplu motor.
+        
+        Simülasyonlar bellek sınırına sığan bloklara bölünür; her blok kendi alt
+        tohumuyla bağımsız üretilir ve blok sırasıyla birleştirilir.
+        """
+        num_edges = self.num_nodes * (self.num_nodes - 1) // 2
+        rows_per_block = max(1, max_batch_bytes // (_BYTES_PER_SAMPLE * max(num_edges, 1)))
+        num_blocks = -(-num_simulations // rows_per_block)
+        seeds = np.random.SeedSequence(seed).spawn(num_blocks + 1)
+        jobs = [(num_edges, min(rows_per_block, num_simulations - block * rows_per_block),
+                 seeds[block], 0.3, DELAY_PROBABILITY, 2.0) for block in range(num_blocks)]
+        
+        merger = _EnvironmentMerger(self.num_nodes, self.obstacles, self.delays)
+        for result in _run_blocks(jobs, workers):
+            obstacle_counts, delay_sums = merger.add(result)
+            stats.update(obstacle_counts, delay_sums, merger.max_delay,
+                         result.obstacle_draws, result.delay_draws)
+        merger.write_state(self, seeds[-1])
+        self.version += 1
+        
+    def estimate_route_risk(self, path: List[int], confidence: float = 0.95,
+                            ci_width: float = 0.02, delay_ci_width: float = 0.1,
+                            max_samples: int = 100000, seed: Optional[int] = None,
+                            min_samples: int = 1000) -> RouteRisk:
+        """
+        Bir rotanın engellenme olasılığını ve beklenen gecikmesini kestirir.
+        
+        Her örnekte rota boyunca tüm kenarlar `is_path_blocked` ile aynı
+        olasılıklarla çekilir; engelli kenarlarda `get_delay_factor` kadar
+        beklenir. Örnekleme, güven aralıkları istenen genişliğe inince durur.
+        
+        Args:
+            path (List[int]): Rota düğümleri
+            confidence (float): Güven düzeyi
+            ci_width (float): Engel olasılığı için hedef güven aralığı genişliği
+            delay_ci_width (float): Beklenen gecikme için hedef güven aralığı genişliği
+            max_samples (int): En fazla örnek sayısı
+            seed (int): Tohum değeri (verilmezse nesnenin üretecinden türetilir)
+            min_samples (int): Durmadan önce çekilecek en az örnek sayısı
+            
+        Returns:
+            RouteRisk: Kestirilen risk
+        """
+        return self.estimate_route_risks([path], confidence, ci_width, delay_ci_width,
+                                         max_samples, seed, min_samples=min_samples)[0]
+        
+    def estimate_route_risks(self, paths: Sequence[List[int]], confidence: float = 0.95,
+                             ci_width: float = 0.02, delay_ci_width: float = 0.1,
+                             max_samples: int = 100000, seed: Optional[int] = None,
+                             batch_size: int = 256, min_samples: int = 1000) -> List[RouteRisk]:
+        """
+        Birden fazla rotanın riskini ortak rastgele sayılarla birlikte kestirir.
+        
+        Args:
+            paths: Rotalar (ör. `Graph.get_alternative_paths` sonucu)
+            confidence (float): Güven düzeyi
+            ci_width (float): Engel olasılığı için hedef güven aralığı genişliği
+            delay_ci_width (float): Beklenen gecikme için hedef güven aralığı genişliği
+            max_samples (int): En fazla örnek sayısı
+            seed (int): Tohum değeri (verilmezse nesnenin üretecinden türetilir)
+            batch_size (int): Durma koşulunun kontrol edildiği örnek adımı
+            min_samples (int): Durmadan önce çekilecek en az örnek sayısı (düşük
+                olasılıklı engeller ilk örneklerde hiç görülmeyebilir)
+            
+        Returns:
+            List[RouteRisk]: Rotalarla aynı sırada risk kestirimleri
+        """
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        sampler = self._route_sampler(paths, seed)
+        while paths and sampler.count < max_samples:
+            sampler.sample(min(batch_size, max_samples - sampler.count))
+            if sampler.count < min_samples:
+                continue
+            widths = sampler.half_widths(z)
+            if (2 * widths[0]).max() <= ci_width and (2 * widths[1]).max() <= delay_ci_width:
+                break
+        return sampler.results(paths, z) if paths else []
+        
+    def rank_routes(self, paths: Sequence[List[int]], by: str = 'block_probability',
+                    confidence: float = 0.95, ci_width: float = 0.02,
+                    delay_ci_width: float = 0.1, max_samples: int = 100000,
+                    seed: Optional[int] = None, batch_size: int = 256,
+                    min_samples: int = 1000) -> List[RouteRisk]:
+        """
+        Rotaları riske göre (en güvenliden başlayarak) sıralar.
+        
+        Örnekleme, komşu sıradaki her rota çifti için ya farkın güven aralığı
+        sıfırı dışlayınca ya da iki rotanın güven aralığı da hedef genişliğe
+        inince (fark önemsiz) durur. Rotalar ortak kenar çekilişlerini
+        paylaştığından fark çoğu zaman birkaç yüz örnekte netleşir.
+        
+        Args:
+            paths: Sıralanacak rotalar
+            by (str): Sıralama ölçütü ('block_probability' veya 'expected_delay')
+            confidence (float): Güven düzeyi
+            ci_width (float): Engel olasılığı için hedef güven aralığı genişliği
+            delay_ci_width (float): Beklenen gecikme için hedef güven aralığı genişliği
+            max_samples (int): En fazla örnek sayısı
+            seed (int): Tohum değeri (verilmezse nesnenin üretecinden türetilir)
+            batch_size (int): Durma koşulunun kontrol edildiği örnek adımı
+            min_samples (int): Durmadan önce çekilecek en az örnek sayısı (düşük
+                olasılıklı engeller ilk örneklerde hiç görülmeyebilir)
             
-            results['avg_obstacles'] += len(self.obstacles) / num_simulations
-            results['avg_delays'] += sum(self.delays.values()) / num_simulations
-            results['max_delay'] = max(results['max_delay'], max(self.delays.values()) if self.delays else 0)
+        Returns:
+            List[RouteRisk]: Riske göre artan sırada kestirimler
+        """
+        if by not in ROUTE_RANKINGS:
+            raise ValueError(f"Bilinmeyen sıralama ölçütü: {by} (seçenekler: {', '.join(ROUTE_RANKINGS)})")
+        if not paths:
+            return []
             
-        return results
+        metric = ROUTE_RANKINGS.index(by)
+        target = (ci_width, delay_ci_width)[metric] / 2
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        sampler = self._route_sampler(paths, seed)
+        while sampler.count < max_samples:
+            sampler.sample(min(batch_size, max_samples - sampler.count))
+            if sampler.count < min_samples:
+                continue
+            means = sampler.means()[metric]
+            widths = sampler.half_widths(z)[metric]
+            order = np.argsort(means, kind='stable')
+            if all(abs(means[a] - means[b]) > sampler.difference_half_width(metric, a, b, z)
+                   or (widths[a] <= target and widths[b] <= target)
+                   for a, b in zip(order, order[1:])):
+                break
+                
+        risks = sampler.results(paths, z)
+        return sorted(risks, key=lambda risk: (risk.block_probability, risk.expected_delay)[metric])
+        
+    def _route_sampler(self, paths: Sequence[List[int]], seed: Optional[int]) -> _RouteSampler:
+        if seed is None:
+            seed = self.rng.getrandbits(128)
+        return _RouteSampler(paths, self.obstacles, self.delays, np.random.default_rng(seed))
@@ -0,0 +1,182 @@
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+from graph import Graph, Heuristic, straight_line_heuristic
+from montecarlo import MonteCarloSimulation
+
+class DStarLite:
+    """
+    D* Lite artımlı en kısa yol planlayıcısı.
+    
+    Arama hedeften başlangıca doğru yapılır; böylece dron ilerledikçe ve kenar
+    maliyetleri değiştikçe yalnızca değişiklikten etkilenen düğümler yeniden
+    hesaplanır. Maliyet değişiklikleri grafı değiştirmez, planlayıcıya ait bir
+    katmanda tutulur.
+    """
+    def __init__(self, graph: Graph, start: int, goal: int, heuristic: Optional[Heuristic] = None):
+        """
+        Args:
+            graph (Graph): Üzerinde planlama yapılacak graf
+            start (int): Dronun bulunduğu düğüm
+            goal (int): Hedef düğüm
+            heuristic: Kabul edilebilir sezgisel h(a, b) (varsayılan: kuş uçuşu mesafe)
+        """
+        self.graph = graph
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic or straight_line_heuristic(graph.coordinates)
+        self.cost_overrides: Dict[Tuple[int, int], float] = {}  # (küçük, büyük) -> maliyet
+        self.expanded = 0  # Toplam genişletilen düğüm sayısı
+        
+        self._km = 0.0
+        self._last = start
+        self._g: Dict[int, float] = {}
+        self._rhs: Dict[int, float] = {goal: 0.0}
+        self._queue: List[Tuple[Tuple[float, float], int]] = []
+        self._queued: Dict[int, Tuple[float, float]] = {}  # Kuyruktaki geçerli anahtarlar
+        self._push(goal)
+        
+    def _cost(self, u: int, v: int, weight: float) -> float:
+        """Planlayıcı katmanı uygulanmış kenar maliyeti"""
+        return self.cost_overrides.get((u, v) if u < v else (v, u), weight)
+        
+    def _key(self, node: int) -> Tuple[float, float]:
+        best = min(self._g.get(node, math.inf), self._rhs.get(node, math.inf))
+        return (best + self.heuristic(self.start, node) + self._km, best)
+        
+    def _push(self, node: int):
+        key = self._key(node)
+        self._queued[node] = key
+        heapq.heappush(self._queue, (key, node))
+        
+    def _update_vertex(self, node: int):
+        if node != self.goal:
+            best = math.inf
+            for neighbor, weight in self.graph.weighted_neighbors(node):
+                cost = self._cost(node, neighbor, weight) + self._g.get(neighbor, math.inf)
+                if cost < best:
+                    best = cost
+            self._rhs[node] = best
+        self._queued.pop(node, None)
+        if self._g.get(node, math.inf) != self._rhs.get(node, math.inf):
+            self._push(node)
+            
+    def _top_key(self) -> Tuple[float, float]:
+        # Geçersiz (eski) kuyruk girdilerini at
+        while self._queue:
+            key, node = self._queue[0]
+            if self._queued.get(node) == key:
+                return key
+            heapq.heappop(self._queue)
+        return (math.inf, math.inf)
+        
+    def compute_shortest_path(self):
+        """Bekleyen değişiklikleri işleyerek başlangıç düğümünün planını günceller"""
+        while (self._top_key() < self._key(self.start)
+               or self._rhs.get(self.start, math.inf) != self._g.get(self.start, math.inf)):
+            if not self._queue:
+                break
+            old_key, node = heapq.heappop(self._queue)
+            del self._queued[node]
+            new_key = self._key(node)
+            self.expanded += 1
+            
+            if old_key < new_key:
+                self._push(node)
+            elif self._g.get(node, math.inf) > self._rhs.get(node, math.inf):
+                self._g[node] = self._rhs[node]
+                for neighbor in self.graph.neighbors(node):
+                    self._update_vertex(neighbor)
+            else:
+                self._g[node] = math.inf
+                self._update_vertex(node)
+                for neighbor in self.graph.neighbors(node):
+                    self._update_vertex(neighbor)
+                    
+    def update_edge_cost(self, from_node: int, to_node: int, cost: float):
+        """
+        Bir kenarın maliyetini değiştirir; plan bir sonraki sorguda onarılır.
+        
+        Args:
+            from_node (int): Başlangıç düğümü
+            to_node (int): Bitiş düğümü
+            cost (float): Yeni maliyet (math.inf = geçilemez)
+        """
+        self.cost_overrides[(min(from_node, to_node), max(from_node, to_node))] = cost
+        self._update_vertex(from_node)
+        self._update_vertex(to_node)
+        
+    def block_edge(self, from_node: int, to_node: int):
+        """
+        Kenarı geçilemez olarak işaretler.
+        
+        Args:
+            from_node (int): Başlangıç düğümü
+            to_node (int): Bitiş düğümü
+        """
+        self.update_edge_cost(from_node, to_node, math.inf)
+        
+    def unblock_edge(self, from_node: int, to_node: int):
+        """
+        Kenarın maliyetini graftaki özgün değerine döndürür.
+        
+        Args:
+            from_node (int): Başlangıç düğümü
+            to_node (int): Bitiş düğümü
+        """
+        self.cost_overrides.pop((min(from_node, to_node), max(from_node, to_node)), None)
+        self._update_vertex(from_node)
+        self._update_vertex(to_node)
+        
+    def apply_delays(self, monte_carlo: MonteCarloSimulation, nodes: List[int]):
+        """
+        Verilen düğümlerin kenarlarına Monte Carlo gecikme faktörlerini uygular.
+        
+        Args:
+            monte_carlo (MonteCarloSimulation): Ortam simülasyonu
+            nodes (List[int]): Kenarları güncellenecek düğümler (ör. dronun çevresi)
+        """
+        for node in nodes:
+            for neighbor, weight in self.graph.weighted_neighbors(node):
+                factor = monte_carlo.get_delay_factor(node, neighbor)
+                if factor != 1.0:
+                    self.update_edge_cost(node, neighbor, weight * factor)
+                    
+    def move_to(self, node: int):
+        """
+        Dronun yeni konumunu bildirir.
+        
+        Args:
+            node (int): Dronun ulaştığı düğüm
+        """
+        self._km += self.heuristic(self._last, node)
+        self._last = node
+        self.start = node
+        
+    def current_path(self) -> List[int]:
+        """
+        Dronun konumundan hedefe güncel planı döndürür.
+        
+        Returns:
+            List[int]: Yol (hedefe ulaşılamıyorsa boş liste)
+        """
+        self.compute_shortest_path()
+        if self._g.get(self.start, math.inf) == math.inf:
+            return []
+            
+        path = [self.start]
+        visited = {self.start}
+        node = self.start
+        while node != self.goal:
+            best, best_cost = None, math.inf
+            for neighbor, weight in self.graph.weighted_neighbors(node):
+                cost = self._cost(node, neighbor, weight) + self._g.get(neighbor, math.inf)
+                if cost < best_cost and neighbor not in visited:
+                    best, best_cost = neighbor, cost
+            if best is None:
+                return []
+            path.append(best)
+            visited.add(best)
+            node = best
+        return path
@@ -0,0 +1,255 @@
+import asyncio
+import random
+import selectors
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+from main import RescueDroneSimulation
+from tasks import TaskStatus
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """
+    Döngü boşta beklerken uyumak yerine sanal saati ilerleten seçici.
+    
+    Yürütücüde iş varken gerçek olarak beklenir; böylece işin sonucu, sanal
+    saat sıradaki zamanlayıcıya atlamadan önce teslim alınır. Zamanlayıcı
+    yoksa (`timeout` None) atlanacak bir an olmadığından da gerçek olarak
+    beklenir; döngü başka iş parçacığından gelecek çağrıyı boşa dönmeden bekler.
+    """
+    def __init__(self):
+        super().__init__()
+        self.loop: Optional['VirtualTimeEventLoop'] = None
+        
+    def select(self, timeout: Optional[float] = None):
+        if timeout is not None and timeout <= 0:
+            return super().select(0)
+        if timeout is None or self.loop.offloaded:
+            return super().select(None)
+        ready = super().select(0)
+        if not ready:
+            self.loop.advance(timeout)
+        return ready
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """
+    Sanal saatli asyncio döngüsü.
+    
+    `loop.time()` sanal saati döndürür; `asyncio.sleep` ve zamanlayıcılar bu
+    saate göre çalışır. Hazır iş kalmadığında saat en yakın zamanlayıcıya
+    atlar, beklemeler için uyunmaz. `run_in_executor` ile gönderilen işler
+    sürerken saat ilerlemez.
+    """
+    def __init__(self):
+        selector = _VirtualSelector()
+        super().__init__(selector)
+        selector.loop = self
+        self.virtual_time = 0.0
+        self.offloaded = 0  # Yürütücüde süren iş sayısı
+        
+    def time(self) -> float:
+        return self.virtual_time
+        
+    def advance(self, seconds: float):
+        """Sanal saati ilerletir"""
+        self.virtual_time += seconds
+        
+    def run_in_executor(self, executor, func, *args) -> asyncio.Future:
+        future = super().run_in_executor(executor, func, *args)
+        self.offloaded += 1
+        future.add_done_callback(self._offload_done)
+        return future
+        
+    def _offload_done(self, future: asyncio.Future):
+        self.offloaded -= 1
+
+@dataclass
+class RunnerStats:
+    """Eşzamanlı görev koşusunun özeti"""
+    drones: int
+    completed: int = 0          # Tamamlanan görev sayısı
+    hops: int = 0               # Toplam kenar geçişi
+    blocked: int = 0            # Engelle karşılaşılan geçiş sayısı
+    corrupted: int = 0          # Bozulan telemetri çerçevesi sayısı
+    unreachable: int = 0        # Rotası bulunamayan görev sayısı
+    virtual_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+class AsyncMissionRunner:
+    """
+    Çok sayıda dronun görevlerini tek süreçte asyncio ile yürütür.
+    
+    Her dron bir eşyordamdır ve ortak `TaskQueue`'dan sıradaki görevi alır;
+    görevi alma ile başlatma arasında `await` olmadığından iki dron aynı
+    görevi alamaz. Geçiş süreleri ve engel gecikmeleri
+    (`MonteCarloSimulation.get_delay_factor`) `asyncio.sleep` ile beklenir;
+    döngü `VirtualTimeEventLoop` ise bekleme sanal zamanda geçer.
+    
+    Rota planlama (ve istenirse telemetri kodlama/çözme) yürütücüye
+    aktarılabilir. Graf ve rota seçicisi iş parçacığı güvenli olmayan
+    önbellekler tuttuğundan varsayılan yürütücü tek iş parçacıklıdır;
+    aynı anda yürütücüde bekleyen iş sayısı `max_offloaded` ile sınırlanır.
+    Dron başına yalnızca eşyordam çerçevesi ve birkaç sayaç tutulur.
+    """
+    def __init__(self, simulation: RescueDroneSimulation, executor: Optional[Executor] = None,
+                 offload_planning: bool = True, offload_telemetry: bool = False,
+                 select_route: bool = True, error_rate: float = 0.2, max_offloaded: int = 64,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            simulation (RescueDroneSimulation): Graf, ortam, görev kuyruğu ve rota seçicisi
+            executor (Executor): Aktarılan işlerin yürütücüsü (varsayılan: tek iş parçacığı)
+            offload_planning (bool): Rota planlamayı yürütücüde yap
+            offload_telemetry (bool): Telemetri kodlama/çözmeyi yürütücüde yap
+            select_route (bool): True ise rota alternatifler arasından minimax ile
+                seçilir, False ise en kısa yol kullanılır
+            error_rate (float): Telemetri çerçevesinin bozulma olasılığı
+            max_offloaded (int): Yürütücüde aynı anda bekleyebilecek iş sayısı
+            seed (int): Telemetri bozulma çekilişleri için tohum (verilmezse
+                simülasyonun tohumu kullanılır)
+        """
+        self.simulation = simulation
+        self._own_executor = executor is None
+        self.executor = executor if executor is not None else ThreadPoolExecutor(max_workers=1)
+        self.offload_planning = offload_planning
+        self.offload_telemetry = offload_telemetry
+        self.select_route = select_route
+        self.error_rate = error_rate
+        self.max_offloaded = max_offloaded
+        # Genel `random` durumundan bağımsız üreteç; aynı tohumla koşular tekrarlanabilir
+        self.rng = random.Random(simulation.seed if seed is None else seed)
+        self.stats = RunnerStats(0)
+        self._slots: Optional[asyncio.Semaphore] = None
+        
+    async def _offload(self, func, *args):
+        """Fonksiyonu yürütücüde çalıştırır (bekleyen iş sayısı sınırlı)"""
+        async with self._slots:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+            
+    def plan(self, start: int, target: int) -> List[int]:
+        """
+        Başlangıçtan hedefe rotayı planlar (yürütücüde çalışabilir).
+        
+        Args:
+            start (int): Başlangıç düğümü
+            target (int): Hedef düğüm
+            
+        Returns:
+            List[int]: Rota (ulaşılamıyorsa boş liste)
+        """
+        simulation = self.simulation
+        if not self.select_route:
+            return simulation.graph.shortest_path_tree(start).path_to(target)
+        paths = simulation.graph.get_alternative_paths(start, target)
+        return simulation.route_selector.select_best_route(paths)
+        
+    def _telemetry(self, current: int, next_node: int, corrupt: bool) -> str:
+        """Konum çerçevesini kodlar, istenirse bozar ve çözer"""
+        hamming = self.simulation.hamming
+        encoded_data = hamming.encode(f"Konum: {current} -> {next_node}")
+        if corrupt:
+            encoded_data = hamming.simulate_error(encoded_data)
+        return hamming.decode(encoded_data)
+        
+    async def fly_route(self, path: List[int]):
+        """
+        Rotayı izler: her geçişte telemetri gönderir, geçiş süresi ve engel gecikmesi kadar bekler.
+        
+        Args:
+            path (List[int]): İzlenecek rota
+        """
+        simulation, stats = self.simulation, self.stats
+        monte_carlo = simulation.monte_carlo
+        for current, next_node in zip(path, path[1:]):
+            corrupt = self.rng.random() < self.error_rate
+            if self.offload_telemetry:
+                await self._offload(self._telemetry, current, next_node, corrupt)
+            else:
+                self._telemetry(current, next_node, corrupt)
+            stats.corrupted += corrupt
+            
+            if monte_carlo.is_path_blocked(current, next_node):
+                stats.blocked += 1
+                await asyncio.sleep(monte_carlo.get_delay_factor(current, next_node))
+            await asyncio.sleep(simulation.graph.edge_weight(current, next_node) * simulation.hop_time)
+            stats.hops += 1
+            
+    async def drone_mission(self, start: int = 0):
+        """
+        Bir dronun görev döngüsü: kuyruk boşalana kadar görev alır ve yürütür.
+        
+        Args:
+            start (int): Dronun başlangıç düğümü
+        """
+        queue = self.simulation.task_queue
+        position = start
+        while True:
+            task = queue.get_next_task()
+            if task is None:
+                return
+            queue.update_task_status(task.id, TaskStatus.IN_PROGRESS)
+            target = task.target_node
+            
+            if self.offload_planning:
+                path = await self._offload(self.plan, position, target)
+            else:
+                path = self.plan(position, target)
+            if not path:
+                self.stats.unreachable += 1
+                queue.update_task_status(task.id, TaskStatus.FAILED)
+                continue
+                
+            await self.fly_route(path)
+            position = target
+            queue.update_task_status(task.id, TaskStatus.COMPLETED)
+            self.stats.completed += 1
+            
+    async def run(self, num_drones: int, start: int = 0) -> RunnerStats:
+        """
+        `num_drones` dronu eşzamanlı olarak görevlere gönderir ve hepsi bitene kadar bekler.
+        
+        Args:
+            num_drones (int): Dron sayısı
+            start (int): Dronların başlangıç düğümü
+            
+        Returns:
+            RunnerStats: Koşu özeti
+        """
+        if num_drones < 1:
+            raise ValueError("Dron sayısı en az 1 olmalı")
+        loop = asyncio.get_running_loop()
+        self.stats = RunnerStats(num_drones)
+        self._slots = asyncio.Semaphore(self.max_offloaded)
+        wall_start, virtual_start = time.perf_counter(), loop.time()
+        await asyncio.gather(*(self.drone_mission(start) for _ in range(num_drones)))
+        self.stats.virtual_seconds = loop.time() - virtual_start
+        self.stats.wall_seconds = time.perf_counter() - wall_start
+        return self.stats
+        
+    def close(self):
+        """Runner'ın oluşturduğu yürütücüyü kapatır"""
+        if self._own_executor:
+            self.executor.shutdown(wait=True)
+
+def run_missions(simulation: RescueDroneSimulation, num_drones: int, virtual: bool = True,
+                 **options) -> RunnerStats:
+    """
+    Kuyruktaki görevleri `num_drones` eşzamanlı dronla yürütür.
+    
+    Args:
+        simulation (RescueDroneSimulation): Simülasyon
+        num_drones (int): Dron sayısı
+        virtual (bool): True ise sanal saatli döngü kullanılır (beklemeler anında geçer)
+        **options: `AsyncMissionRunner` seçenekleri
+        
+    Returns:
+        RunnerStats: Koşu özeti
+    """
+    runner = AsyncMissionRunner(simulation, **options)
+    loop = VirtualTimeEventLoop() if virtual else asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(runner.run(num_drones))
+    finally:
+        runner.close()
+        loop.close()
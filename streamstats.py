@@ -0,0 +1,424 @@
+import math
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+class RunningMoments:
+    """
+    Welford yöntemiyle sabit bellekte ortalama ve varyans tutar.
+    
+    Toplu eklemeler ve parçalar arası birleştirme Chan'ın paralel
+    formülüyle yapılır; tekrarlı bölme ile biriken yuvarlama hatası oluşmaz.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Ortalamadan sapmaların kareleri toplamı
+        self.min = math.inf
+        self.max = -math.inf
+        
+    def add(self, value: float):
+        """
+        Tek bir değer ekler.
+        
+        Args:
+            value (float): Eklenecek değer
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        
+    def add_many(self, values: np.ndarray):
+        """
+        Bir dizi değeri tek adımda ekler.
+        
+        Args:
+            values (np.ndarray): Eklenecek değerler
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        mean = float(values.mean())
+        self._combine(len(values), mean, float(((values - mean) ** 2).sum()),
+                      float(values.min()), float(values.max()))
+                      
+    def merge(self, other: 'RunningMoments'):
+        """
+        Başka bir parçanın momentlerini ekler.
+        
+        Args:
+            other (RunningMoments): Birleştirilecek momentler
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.min, other.max)
+            
+    def _combine(self, count: int, mean: float, m2: float, low: float, high: float):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+        
+    @property
+    def variance(self) -> float:
+        """Örneklem varyansı (n - 1 ile)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+        
+    @property
+    def std(self) -> float:
+        """Örneklem standart sapması"""
+        return math.sqrt(self.variance)
+
+class QuantileSketch:
+    """
+    Göreli hata garantili, birleştirilebilir yüzdelik özeti (DDSketch).
+    
+    Negatif olmayan değerler logaritmik kovalara sayılır; her yüzdelik,
+    gerçek değere en fazla `relative_accuracy` göreli hatayla döndürülür.
+    Kova sayısı `max_bins` ile sınırlıdır; aşılırsa en küçük kovalar
+    birleştirilir (üst yüzdeliklerin doğruluğu korunur).
+    """
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        """
+        Args:
+            relative_accuracy (float): Yüzdeliklerin göreli hata sınırı (0-1 arası)
+            max_bins (int): En fazla kova sayısı
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"Göreli doğruluk 0 ile 1 arasında olmalıdır: {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.offset = 0  # counts[0] kovasının indeksi
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.zero_count = 0  # Sıfır (ve negatif) değerler
+        self.count = 0
+        
+    def add(self, value: float):
+        """
+        Tek bir değer ekler.
+        
+        Args:
+            value (float): Eklenecek değer
+        """
+        self.add_many(np.array([value], dtype=np.float64))
+        
+    def add_many(self, values: np.ndarray):
+        """
+        Bir dizi değeri ekler.
+        
+        Args:
+            values (np.ndarray): Eklenecek değerler
+        """
+        values = np.asarray(values, dtype=np.float64)
+        positive = values[values > 0]
+        self.zero_count += len(values) - len(positive)
+        self.count += len(values)
+        if len(positive):
+            indices = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+            low = int(indices.min())
+            self._add_counts(low, np.bincount(indices - low))
+            
+    def merge(self, other: 'QuantileSketch'):
+        """
+        Aynı doğrulukla oluşturulmuş başka bir özeti ekler.
+        
+        Args:
+            other (QuantileSketch): Birleştirilecek özet
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Farklı göreli doğruluktaki yüzdelik özetleri birleştirilemez")
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(other.counts):
+            self._add_counts(other.offset, other.counts)
+            
+    def _add_counts(self, offset: int, counts: np.ndarray):
+        """`offset` indeksinden başlayan kova sayılarını ekler"""
+        if not len(self.counts):
+            self.offset, self.counts = offset, counts.astype(np.int64)
+        else:
+            low = min(self.offset, offset)
+            high = max(self.offset + len(self.counts), offset + len(counts))
+            merged = np.zeros(high - low, dtype=np.int64)
+            merged[self.offset - low:self.offset - low + len(self.counts)] += self.counts
+            merged[offset - low:offset - low + len(counts)] += counts
+            self.offset, self.counts = low, merged
+            
+        excess = len(self.counts) - self.max_bins
+        if excess > 0:
+            # En küçük kovaları ilk korunan kovaya kat
+            self.counts[excess] += self.counts[:excess].sum()
+            self.counts = self.counts[excess:]
+            self.offset += excess
+            
+    def quantile(self, q: float) -> float:
+        """
+        Yaklaşık yüzdelik değerini döndürür.
+        
+        Args:
+            q (float): Yüzdelik (0-1 arası)
+            
+        Returns:
+            float: Yüzdelik değeri (özet boşsa nan)
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Yüzdelik 0 ile 1 arasında olmalıdır: {q}")
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        bucket = int(np.searchsorted(np.cumsum(self.counts), rank - self.zero_count, side='right'))
+        bucket = min(bucket, len(self.counts) - 1)
+        return 2 * self.gamma ** (self.offset + bucket) / (self.gamma + 1)
+
+class EdgeCounters:
+    """
+    Kenar başına engel ve gecikme çekiliş sayıları.
+    
+    Kenarlar (i < j) üst üçgen sırasıyla indekslenir:
+    `i * (2n - i - 1) / 2 + (j - i - 1)`. Yalnızca en az bir kez çekilen
+    kenarlar, sıralı indeks ve sayı dizileri olarak saklanır; bellek
+    düğüm çifti sayısıyla değil çekiliş görülen kenar sayısıyla büyür.
+    """
+    def __init__(self, num_nodes: int):
+        """
+        Args:
+            num_nodes (int): Düğüm sayısı
+        """
+        self.num_nodes = num_nodes
+        self.obstacle_edges = np.zeros(0, dtype=np.int64)  # Sıralı kenar indeksleri
+        self.obstacle_draws = np.zeros(0, dtype=np.int64)
+        self.delay_edges = np.zeros(0, dtype=np.int64)
+        self.delay_draws = np.zeros(0, dtype=np.int64)
+        self.simulations = 0
+        
+    def edge_index(self, from_node: int, to_node: int) -> int:
+        """İki düğüm arasındaki kenarın üst üçgen indeksi"""
+        i, j = min(from_node, to_node), max(from_node, to_node)
+        return i * (2 * self.num_nodes - i - 1) // 2 + (j - i - 1)
+        
+    def edge_nodes(self, edges: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Üst üçgen indekslerini (i, j) düğüm çiftlerine çevirir.
+        
+        Args:
+            edges (np.ndarray): Kenar indeksleri
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: i ve j düğüm dizileri (i < j)
+        """
+        n = self.num_nodes
+        edges = np.asarray(edges, dtype=np.int64)
+        # i. satırdan önceki kenar sayısı i * (2n - i - 1) / 2; kökten tahmin edip tam sayıyla düzeltilir
+        i = np.floor(((2 * n - 1) - np.sqrt((2 * n - 1) ** 2 - 8 * edges.astype(np.float64))) / 2).astype(np.int64)
+        i = np.clip(i, 0, max(n - 2, 0))
+        i -= (i * (2 * n - i - 1) // 2) > edges
+        i += ((i + 1) * (2 * n - i - 2) // 2) <= edges
+        return i, edges - i * (2 * n - i - 1) // 2 + i + 1
+        
+    @staticmethod
+    def _accumulate(edges: np.ndarray, draws: np.ndarray,
+                    new_edges: np.ndarray, new_draws: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Seyrek (indeks, sayı) dizilerine yeni sayıları ekler"""
+        if not len(new_edges):
+            return edges, draws
+        merged, inverse = np.unique(np.concatenate((edges, new_edges)), return_inverse=True)
+        counts = np.zeros(len(merged), dtype=np.int64)
+        np.add.at(counts, inverse, np.concatenate((draws, new_draws)))
+        return merged, counts
+        
+    def add(self, obstacle_draws: np.ndarray, delay_draws: np.ndarray, simulations: int):
+        """
+        Kenar başına çekiliş sayılarını ekler.
+        
+        Yoğun dizilerin yalnızca sıfır olmayan girdileri saklanır.
+        
+        Args:
+            obstacle_draws (np.ndarray): Üst üçgen sırasıyla kenar başına engel çekilişi sayısı
+            delay_draws (np.ndarray): Üst üçgen sırasıyla kenar başına gecikme çekilişi sayısı
+            simulations (int): Bu sayıların kapsadığı simülasyon sayısı
+        """
+        drawn = np.flatnonzero(obstacle_draws)
+        self.obstacle_edges, self.obstacle_draws = self._accumulate(
+            self.obstacle_edges, self.obstacle_draws, drawn, np.asarray(obstacle_draws)[drawn])
+        drawn = np.flatnonzero(delay_draws)
+        self.delay_edges, self.delay_draws = self._accumulate(
+            self.delay_edges, self.delay_draws, drawn, np.asarray(delay_draws)[drawn])
+        self.simulations += simulations
+        
+    def add_edges(self, obstacle_edges: Iterable[Tuple[int, int]],
+                  delay_edges: Iterable[Tuple[int, int]]):
+        """
+        Tek bir simülasyonda çekilen kenarları ekler.
+        
+        Args:
+            obstacle_edges: Engel çekilen (i, j) kenarları
+            delay_edges: Gecikme çekilen (i, j) kenarları
+        """
+        drawn = np.array([self.edge_index(*edge) for edge in obstacle_edges], dtype=np.int64)
+        self.obstacle_edges, self.obstacle_draws = self._accumulate(
+            self.obstacle_edges, self.obstacle_draws, drawn, np.ones(len(drawn), dtype=np.int64))
+        drawn = np.array([self.edge_index(*edge) for edge in delay_edges], dtype=np.int64)
+        self.delay_edges, self.delay_draws = self._accumulate(
+            self.delay_edges, self.delay_draws, drawn, np.ones(len(drawn), dtype=np.int64))
+        self.simulations += 1
+        
+    def merge(self, other: 'EdgeCounters'):
+        """
+        Başka bir parçanın sayaçlarını ekler (`other` kendisi olabilir).
+        
+        Args:
+            other (EdgeCounters): Birleştirilecek sayaçlar
+        """
+        if other.num_nodes != self.num_nodes:
+            raise ValueError("Farklı düğüm sayılı kenar sayaçları birleştirilemez")
+        # Diziler yerinde değiştirilmez; `other is self` iken de birleştirmeden önceki değerler eklenir
+        self.obstacle_edges, self.obstacle_draws = self._accumulate(
+            self.obstacle_edges, self.obstacle_draws, other.obstacle_edges, other.obstacle_draws)
+        self.delay_edges, self.delay_draws = self._accumulate(
+            self.delay_edges, self.delay_draws, other.delay_edges, other.delay_draws)
+        self.simulations += other.simulations
+        
+    def blockage_frequencies(self) -> Dict[Tuple[int, int], float]:
+        """
+        Returns:
+            Dict[Tuple[int, int], float]: En az bir kez engel çekilen (i, j)
+                kenarları için engel çekilen simülasyon oranı
+        """
+        rows, cols = self.edge_nodes(self.obstacle_edges)
+        frequencies = (self.obstacle_draws / max(self.simulations, 1)).tolist()
+        return dict(zip(zip(rows.tolist(), cols.tolist()), frequencies))
+        
+    def blockage_frequency(self, from_node: int, to_node: int) -> float:
+        """
+        Bir kenara engel çekilen simülasyon oranını döndürür.
+        
+        Args:
+            from_node (int): Başlangıç düğümü
+            to_node (int): Bitiş düğümü
+            
+        Returns:
+            float: Engel sıklığı (0-1 arası)
+        """
+        edge = self.edge_index(from_node, to_node)
+        position = int(np.searchsorted(self.obstacle_edges, edge))
+        if position == len(self.obstacle_edges) or self.obstacle_edges[position] != edge:
+            return 0.0
+        return float(self.obstacle_draws[position]) / max(self.simulations, 1)
+
+class EnvironmentStats:
+    """
+    `MonteCarloSimulation.simulate_environment` için akan istatistik toplayıcı.
+    
+    Simülasyon başına engel sayısı ve gecikme toplamı için momentleri,
+    gecikme toplamının yüzdeliklerini ve kenar başına sayaçları simülasyon
+    sayısından bağımsız sabit bellekte tutar. Parçalar (ör. farklı
+    makinelerdeki çalıştırmalar) `merge` ile birleştirilebilir; uzun bir
+    çalıştırma sürerken başka bir iş parçacığından `snapshot` alınabilir.
+    """
+    QUANTILES = (0.5, 0.95, 0.99)
+    
+    def __init__(self, num_nodes: int, relative_accuracy: float = 0.01):
+        """
+        Args:
+            num_nodes (int): Düğüm sayısı
+            relative_accuracy (float): Gecikme yüzdeliklerinin göreli hata sınırı
+        """
+        self.obstacles = RunningMoments()
+        self.delays = RunningMoments()
+        self.delay_sketch = QuantileSketch(relative_accuracy)
+        self.edges = EdgeCounters(num_nodes)
+        self.max_delay = 0.0
+        self._lock = threading.Lock()
+        
+    def update(self, obstacle_counts: np.ndarray, delay_sums: np.ndarray, max_delay: float,
+               obstacle_draws: Optional[np.ndarray] = None,
+               delay_draws: Optional[np.ndarray] = None):
+        """
+        Bir grup simülasyonun sonuçlarını ekler.
+        
+        Args:
+            obstacle_counts (np.ndarray): Simülasyon başına engel sözlüğü boyu
+            delay_sums (np.ndarray): Simülasyon başına gecikme değerleri toplamı
+            max_delay (float): Bu simülasyonlardaki en büyük gecikme faktörü
+            obstacle_draws (np.ndarray): Kenar başına engel çekilişi sayısı
+            delay_draws (np.ndarray): Kenar başına gecikme çekilişi sayısı
+        """
+        with self._lock:
+            self.obstacles.add_many(obstacle_counts)
+            self.delays.add_many(delay_sums)
+            self.delay_sketch.add_many(delay_sums)
+            self.max_delay = max(self.max_delay, max_delay)
+            if obstacle_draws is not None:
+                self.edges.add(obstacle_draws, delay_draws, len(obstacle_counts))
+                
+    def update_edges(self, obstacle_edges: Iterable[Tuple[int, int]],
+                     delay_edges: Iterable[Tuple[int, int]]):
+        """
+        Tek bir simülasyonda çekilen kenarları kenar sayaçlarına ekler.
+        
+        Args:
+            obstacle_edges: Engel çekilen (i, j) kenarları
+            delay_edges: Gecikme çekilen (i, j) kenarları
+        """
+        with self._lock:
+            self.edges.add_edges(obstacle_edges, delay_edges)
+            
+    def merge(self, other: 'EnvironmentStats'):
+        """
+        Başka bir parçanın istatistiklerini ekler.
+        
+        Args:
+            other (EnvironmentStats): Birleştirilecek istatistikler
+        """
+        if other is self:
+            # Bileşen birleştirmeleri kendileriyle de doğru çalışır; aynı kilit iki kez alınmaz
+            with self._lock:
+                self._merge(other)
+            return
+        # Kilitler her zaman aynı sırayla alınır; eşzamanlı a.merge(b) ve b.merge(a) kilitlenmez
+        first, second = sorted((self, other), key=id)
+        with first._lock, second._lock:
+            self._merge(other)
+            
+    def _merge(self, other: 'EnvironmentStats'):
+        """`merge` gövdesi; kilitler çağıran tarafından alınmıştır"""
+        self.obstacles.merge(other.obstacles)
+        self.delays.merge(other.delays)
+        self.delay_sketch.merge(other.delay_sketch)
+        self.edges.merge(other.edges)
+        self.max_delay = max(self.max_delay, other.max_delay)
+            
+    def snapshot(self) -> Dict[str, float]:
+        """
+        O ana kadarki özet istatistikleri döndürür.
+        
+        Returns:
+            Dict[str, float]: Özet
+                - simulations: Simülasyon sayısı
+                - avg_obstacles, obstacle_variance: Engel sayısı ortalaması ve varyansı
+                - avg_delays, delay_variance: Gecikme toplamı ortalaması ve varyansı
+                - delay_p50, delay_p95, delay_p99: Gecikme toplamı yüzdelikleri
+                - max_delay: Maksimum gecikme faktörü
+        """
+        with self._lock:
+            summary = {
+                'simulations': self.obstacles.count,
+                'avg_obstacles': self.obstacles.mean,
+                'obstacle_variance': self.obstacles.variance,
+                'avg_delays': self.delays.mean,
+                'delay_variance': self.delays.variance,
+            }
+            for q in self.QUANTILES:
+                summary[f'delay_p{round(q * 100)}'] = self.delay_sketch.quantile(q)
+            summary['max_delay'] = self.max_delay
+            return summary
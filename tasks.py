@@ -1,34 +1,228 @@
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import Iterator, List, Dict, Mapping, Optional, Tuple
+from array import array
 from enum import Enum
+import math
+import sys
 import time
 
+import numpy as np
+
 class TaskStatus(Enum):
     """Görev durumlarını temsil eden enum sınıfı"""
     PENDING = "beklemede"
     IN_PROGRESS = "devam_ediyor"
     COMPLETED = "tamamlandı"
     FAILED = "başarısız"
+    CANCELLED = "iptal_edildi"
+
+# Durum kodları: `TaskStore.statuses` dizisinde durumlar bu sıradaki indeksleriyle tutulur
+_STATUSES: Tuple[TaskStatus, ...] = tuple(TaskStatus)
+_STATUS_CODES: Dict[TaskStatus, int] = {status: code for code, status in enumerate(_STATUSES)}
+# Az sayıda görevin bulunduğu "canlı" durumlar ayrıca ID kümelerinde indekslenir
+_LIVE_CODES: Tuple[int, ...] = (_STATUS_CODES[TaskStatus.PENDING], _STATUS_CODES[TaskStatus.IN_PROGRESS])
 
-@dataclass
 class Task:
-    """Görev sınıfı, dronun yapması gereken işlemleri temsil eder"""
-    id: int
-    target_node: int
-    priority: int
-    description: str
-    status: TaskStatus = TaskStatus.PENDING
-    created_at: float = time.time()
-    completed_at: Optional[float] = None
+    """
+    Görev sınıfı, dronun yapması gereken işlemleri temsil eder.
+    
+    `TaskStore` içindeki bir satıra bakan hafif görünümdür; alanlar her
+    erişimde depodan okunur. Durum ve öncelik yalnızca `TaskQueue`
+    yöntemleriyle değiştirilir.
+    """
+    __slots__ = ('_store', 'id')
+    
+    def __init__(self, store: 'TaskStore', task_id: int):
+        """
+        Args:
+            store (TaskStore): Görevin saklandığı depo
+            task_id (int): Görev ID'si
+        """
+        self._store = store
+        self.id = task_id
+        
+    @property
+    def target_node(self) -> int:
+        return self._store.target_nodes[self.id - 1]
+        
+    @property
+    def priority(self) -> int:
+        return self._store.priorities[self.id - 1]
+        
+    @property
+    def description(self) -> str:
+        store = self._store
+        return store.descriptions[store.description_ids[self.id - 1]]
+        
+    @property
+    def status(self) -> TaskStatus:
+        return _STATUSES[self._store.statuses[self.id - 1]]
+        
+    @property
+    def created_at(self) -> float:
+        return self._store.created_at[self.id - 1]
+        
+    @property
+    def completed_at(self) -> Optional[float]:
+        value = self._store.completed_at[self.id - 1]
+        return None if math.isnan(value) else value
+        
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Task) and other._store is self._store and other.id == self.id
+        
+    def __hash__(self) -> int:
+        return hash((id(self._store), self.id))
+        
+    def __repr__(self) -> str:
+        return (f"Task(id={self.id}, target_node={self.target_node}, priority={self.priority}, "
+                f"description={self.description!r}, status={self.status}, "
+                f"created_at={self.created_at}, completed_at={self.completed_at})")
+
+class TaskStore(Mapping):
+    """
+    Görevleri sütun düzeninde tutan kompakt depo.
+    
+    Her alan ayrı bir tip dizisindedir (hedef, öncelik, durum kodu, zaman
+    damgaları); aynı açıklamalar bir kez saklanıp indeksle paylaşılır. Görev
+    ID'leri 1'den başlayarak sırayla verilir ve satır numarası `id - 1`'dir.
+    Görev başına Python nesnesi tutulmaz; `Task` görünümleri yalnızca
+    istendiğinde oluşturulur. Durum sayaçları her güncellemede tutulur.
+    Bekleyen ve devam eden görevlerin ID'leri ayrıca küçük kümelerde
+    tutulduğundan bu durumlar O(k) listelenir; sayısı sürekli büyüyen
+    tamamlanmış/iptal edilmiş görevler NumPy ile vektörel taranır.
+    
+    `Graph.graph` ile aynı biçimde ID -> `Task` eşlemesi olarak da kullanılabilir.
+    """
+    def __init__(self):
+        self.target_nodes = array('i')
+        self.priorities = array('i')
+        self.statuses = array('b')            # `_STATUSES` indeksi
+        self.created_at = array('d')
+        self.completed_at = array('d')        # Tamamlanmamış görevler için NaN
+        self.description_ids = array('i')
+        self.descriptions: List[str] = []
+        self.status_counts = array('q', [0]) * len(_STATUSES)
+        self._description_index: Dict[str, int] = {}
+        self._live: Dict[int, Dict[int, None]] = {code: {} for code in _LIVE_CODES}  # Durum kodu -> ID kümesi
+        self._removed: Dict[int, int] = dict.fromkeys(_LIVE_CODES, 0)  # Son sıkıştırmadan beri silinen
+        
+    def append(self, target_node: int, priority: int, description: str,
+               status: TaskStatus = TaskStatus.PENDING) -> int:
+        """
+        Yeni bir görev satırı ekler.
+        
+        Args:
+            target_node (int): Hedef düğüm
+            priority (int): Görev önceliği
+            description (str): Görev açıklaması
+            status (TaskStatus): Başlangıç durumu
+            
+        Returns:
+            int: Yeni görevin ID'si
+        """
+        index = self._description_index.get(description)
+        if index is None:
+            index = self._description_index[description] = len(self.descriptions)
+            self.descriptions.append(sys.intern(description))
+            
+        code = _STATUS_CODES[status]
+        self.target_nodes.append(target_node)
+        self.priorities.append(priority)
+        self.statuses.append(code)
+        self.created_at.append(time.time())
+        self.completed_at.append(math.nan)
+        self.description_ids.append(index)
+        self.status_counts[code] += 1
+        task_id = len(self.statuses)
+        if code in self._live:
+            self._live[code][task_id] = None
+        return task_id
+        
+    def set_status(self, task_id: int, status: TaskStatus):
+        """Görevin durum kodunu ve durum sayaçlarını günceller"""
+        row = task_id - 1
+        code = _STATUS_CODES[status]
+        old = self.statuses[row]
+        self.status_counts[old] -= 1
+        self.status_counts[code] += 1
+        self.statuses[row] = code
+        if old in self._live:
+            live = self._live[old]
+            live.pop(task_id, None)
+            self._removed[old] += 1
+            if self._removed[old] > 2 * len(live) + 64:
+                # Sözlükler silmede küçülmez; boş yuvalar yinelemeyi yavaşlatmasın
+                self._live[old] = dict(live)
+                self._removed[old] = 0
+        if code in self._live:
+            self._live[code][task_id] = None
+            
+    def reindex(self):
+        """Canlı durum kümelerini durum sütunundan yeniden kurar (sütunlar doğrudan yüklendiğinde)"""
+        codes = np.frombuffer(self.statuses, dtype=np.int8)
+        for code in _LIVE_CODES:
+            self._live[code] = dict.fromkeys((np.flatnonzero(codes == code) + 1).tolist())
+        
+    def ids_with_status(self, status: TaskStatus) -> np.ndarray:
+        """
+        Verilen durumdaki görevlerin ID'lerini bulur.
+        
+        Canlı durumlar (bekleyen, devam eden) indeksten O(k log k), diğerleri
+        vektörel taramayla bulunur.
+        
+        Args:
+            status (TaskStatus): Görev durumu
+            
+        Returns:
+            np.ndarray: Artan sırada görev ID'leri
+        """
+        code = _STATUS_CODES[status]
+        live = self._live.get(code)
+        if live is not None:
+            return np.sort(np.fromiter(live, dtype=np.int64, count=len(live)))
+        codes = np.frombuffer(self.statuses, dtype=np.int8)
+        return np.flatnonzero(codes == code) + 1
+        
+    def __getitem__(self, task_id: int) -> Task:
+        if not 1 <= task_id <= len(self.statuses):
+            raise KeyError(task_id)
+        return Task(self, task_id)
+        
+    def __contains__(self, task_id) -> bool:
+        try:
+            return 1 <= task_id <= len(self.statuses)
+        except TypeError:
+            return False
+            
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, len(self.statuses) + 1))
+        
+    def __len__(self) -> int:
+        return len(self.statuses)
 
 class TaskQueue:
     """
     Görev Kuyruğu sınıfı, dronun yapması gereken görevleri yönetir.
     Öncelikli görevler önce işlenir.
+    
+    Görevler sütun düzenli bir `TaskStore` içinde tutulur; `tasks` bu deponun
+    ID -> `Task` görünümüdür. Bekleyen görevler (öncelik, ekleme sırası)
+    anahtarlı indeksli bir ikili yığındadır; eşit öncelikli görevler eklenme
+    sırasıyla çıkar. Sıradaki görev O(1), ekleme, çıkarma ve öncelik
+    değişikliği O(log n) sürer. Durum sayaçları `update_task_status` ile
+    güncellendiğinden istatistikler O(1); bekleyen ve devam eden görevler
+    indeksten O(k), diğer durumlar vektörel listelenir.
     """
     def __init__(self):
-        self.tasks: Dict[int, Task] = {}
-        self.next_id: int = 1
+        self.store = TaskStore()
+        self.tasks: Mapping[int, Task] = self.store
+        self._heap = array('q')       # Bekleyen görevlerin ID'lerinden ikili yığın
+        self._position = array('q')   # Satır başına yığındaki indeks (yığında değilse -1)
+        self.journal = None           # Değişiklikleri kaydeden günlük (bkz. journal.TaskJournal)
+        
+    @property
+    def next_id(self) -> int:
+        """Eklenecek bir sonraki görevin ID'si"""
+        return len(self.store) + 1
         
     def add_task(self, target_node: int, priority: int, description: str) -> Task:
         """
@@ -42,15 +236,12 @@ class TaskQueue:
         Returns:
             Task: Oluşturulan görev
         """
-        task = Task(
-            id=self.next_id,
-            target_node=target_node,
-            priority=priority,
-            description=description
-        )
-        self.tasks[self.next_id] = task
-        self.next_id += 1
-        return task
+        task_id = self.store.append(target_node, priority, description)
+        self._position.append(-1)
+        self._push(task_id)
+        if self.journal is not None:
+            self.journal.log_add(task_id)
+        return Task(self.store, task_id)
         
     def get_next_task(self) -> Optional[Task]:
         """
@@ -59,20 +250,15 @@ class TaskQueue:
         Returns:
             Optional[Task]: Bir sonraki görev veya None
         """
-        pending_tasks = [
-            task for task in self.tasks.values()
-            if task.status == TaskStatus.PENDING
-        ]
-        
-        if not pending_tasks:
-            return None
-            
-        return min(pending_tasks, key=lambda t: t.priority)
+        return Task(self.store, self._heap[0]) if self._heap else None
         
     def update_task_status(self, task_id: int, status: TaskStatus) -> bool:
         """
         Görev durumunu günceller.
         
+        Bekleme durumundan çıkan (başlayan, başarısız olan, iptal edilen)
+        görevler yığından silinir; beklemeye dönenler yeniden eklenir.
+        
         Args:
             task_id (int): Görev ID'si
             status (TaskStatus): Yeni durum
@@ -80,17 +266,74 @@ class TaskQueue:
         Returns:
             bool: Güncelleme başarılı ise True
         """
-        if task_id not in self.tasks:
+        store = self.store
+        if task_id not in store:
             return False
             
-        task = self.tasks[task_id]
-        task.status = status
-        
+        old = _STATUSES[store.statuses[task_id - 1]]
+        if old != status:
+            store.set_status(task_id, status)
+            if old == TaskStatus.PENDING:
+                self._remove(task_id)
+            elif status == TaskStatus.PENDING:
+                self._push(task_id)
+                
         if status == TaskStatus.COMPLETED:
-            task.completed_at = time.time()
+            store.completed_at[task_id - 1] = time.time()
+            
+        if self.journal is not None:
+            self.journal.log_status(task_id)
+        return True
+        
+    def update_task_priority(self, task_id: int, priority: int) -> bool:
+        """
+        Görevin önceliğini değiştirir (bekleyen görevler için yığında yerini günceller).
+        
+        Args:
+            task_id (int): Görev ID'si
+            priority (int): Yeni öncelik (düşük sayı = yüksek öncelik)
+            
+        Returns:
+            bool: Güncelleme başarılı ise True
+        """
+        if task_id not in self.store:
+            return False
             
+        self.store.priorities[task_id - 1] = priority
+        index = self._position[task_id - 1]
+        if index >= 0:
+            self._sift_down(self._sift_up(index))
+        if self.journal is not None:
+            self.journal.log_priority(task_id)
         return True
         
+    def cancel_task(self, task_id: int) -> bool:
+        """
+        Görevi iptal eder.
+        
+        Args:
+            task_id (int): Görev ID'si
+            
+        Returns:
+            bool: İptal başarılı ise True
+        """
+        return self.update_task_status(task_id, TaskStatus.CANCELLED)
+        
+    def tasks_by_status(self, status: TaskStatus) -> List[Task]:
+        """
+        Verilen durumdaki görevleri döndürür.
+        
+        Args:
+            status (TaskStatus): Görev durumu
+            
+        Returns:
+            List[Task]: ID sırasıyla görevler
+        """
+        store = self.store
+        if not store.status_counts[_STATUS_CODES[status]]:
+            return []
+        return [Task(store, task_id) for task_id in store.ids_with_status(status).tolist()]
+        
     def get_task_stats(self) -> Dict[str, int]:
         """
         Görev istatistiklerini döndürür.
@@ -98,9 +341,60 @@ class TaskQueue:
         Returns:
             Dict[str, int]: Durumlara göre görev sayıları
         """
-        stats = {status.value: 0 for status in TaskStatus}
+        return {status.value: count for status, count in zip(_STATUSES, self.store.status_counts)}
+        
+    def _less(self, a: int, b: int) -> bool:
+        # Görev ID'leri artan sırada verildiğinden eşitlikte ilk eklenen önce gelir
+        priorities = self.store.priorities
+        pa, pb = priorities[a - 1], priorities[b - 1]
+        return pa < pb or (pa == pb and a < b)
         
-        for task in self.tasks.values():
-            stats[task.status.value] += 1
+    def _push(self, task_id: int):
+        """Görevi yığına ekler"""
+        self._heap.append(task_id)
+        self._sift_up(len(self._heap) - 1)
+        
+    def _remove(self, task_id: int):
+        """Görevi yığından siler"""
+        heap = self._heap
+        index = self._position[task_id - 1]
+        self._position[task_id - 1] = -1
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            self._sift_down(self._sift_up(index))
             
-        return stats
+    def _sift_up(self, index: int) -> int:
+        """Elemanı yukarı taşır; son indeksini döndürür"""
+        heap, position = self._heap, self._position
+        task_id = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not self._less(task_id, heap[parent]):
+                break
+            heap[index] = heap[parent]
+            position[heap[index] - 1] = index
+            index = parent
+        heap[index] = task_id
+        position[task_id - 1] = index
+        return index
+        
+    def _sift_down(self, index: int) -> int:
+        """Elemanı aşağı taşır; son indeksini döndürür"""
+        heap, position = self._heap, self._position
+        size = len(heap)
+        task_id = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and self._less(heap[child + 1], heap[child]):
+                child += 1
+            if not self._less(heap[child], task_id):
+                break
+            heap[index] = heap[child]
+            position[heap[index] - 1] = index
+            index = child
+        heap[index] = task_id
+        position[task_id - 1] = index
+        return index
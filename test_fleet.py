@@ -0,0 +1,50 @@
+import itertools
+
+import numpy as np
+
+from fleet import FleetDispatcher, linear_assignment
+from graph import Graph
+
+def _brute_force(cost: np.ndarray) -> float:
+    """Tüm atamaları deneyerek en küçük toplam maliyeti bulur"""
+    n, m = cost.shape
+    if n > m:
+        return _brute_force(cost.T)
+    return min(cost[np.arange(n), list(columns)].sum()
+               for columns in itertools.permutations(range(m), n))
+
+def test_linear_assignment_matches_brute_force():
+    """Küçük dikdörtgen ve kare matrislerde en iyi atama bulunur"""
+    rng = np.random.default_rng(7)
+    for _ in range(300):
+        n, m = rng.integers(1, 6, size=2)
+        cost = rng.integers(0, 20, size=(n, m)).astype(float)
+        if rng.random() < 0.5:
+            cost += rng.random((n, m))
+        rows, cols = linear_assignment(cost)
+        assert len(rows) == min(n, m)
+        assert len(set(rows.tolist())) == len(rows) and len(set(cols.tolist())) == len(cols)
+        assert np.all(np.diff(rows) > 0)
+        assert np.isclose(cost[rows, cols].sum(), _brute_force(cost))
+
+def test_linear_assignment_rejects_non_finite():
+    """İki boyutlu olmayan veya sonsuz değer içeren matrisler reddedilir"""
+    for cost in (np.array([1.0, 2.0]), np.array([[1.0, np.inf]])):
+        try:
+            linear_assignment(cost)
+        except ValueError:
+            continue
+        raise AssertionError("Geçersiz maliyet matrisi kabul edildi")
+
+def test_distance_rows_follow_graph_changes():
+    """Grafa kenar eklenince önbellekteki mesafe satırları yenilenir"""
+    graph = Graph(4)
+    for node in range(3):
+        graph.add_edge(node, node + 1, 1.0)
+    dispatcher = FleetDispatcher(graph, 2)
+    assert dispatcher._distance_row(0).tolist() == [0.0, 1.0, 2.0, 3.0]
+    
+    graph.add_edge(0, 3, 0.5)
+    assert dispatcher._distance_row(0).tolist() == [0.0, 1.0, 1.5, 0.5]
+    matrix = dispatcher._distance_matrix(np.array([0, 1]), np.array([3, 3]))
+    assert matrix.tolist() == [[0.5, 0.5], [1.5, 1.5]]
@@ -0,0 +1,82 @@
+import os
+import time
+
+from journal import TaskJournal, _GROUP, _JOURNAL_HEADER
+from tasks import TaskStatus
+
+def _groups(path: str) -> int:
+    """Günlük dosyasındaki eksiksiz grup sayısı"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    offset, groups = _JOURNAL_HEADER.size, 0
+    while offset + _GROUP.size <= len(data):
+        length, _ = _GROUP.unpack_from(data, offset)
+        offset += _GROUP.size + length
+        groups += 1
+    return groups
+
+def _state(queue) -> list:
+    return [(task.target_node, task.priority, task.description, task.status, task.completed_at)
+            for task in (queue.store[task_id] for task_id in queue.store)]
+
+def test_zero_interval_commits_only_full_groups(tmp_path):
+    """group_interval=0 iken kayıtlar yalnızca grup dolunca veya commit ile yazılır"""
+    path = str(tmp_path / 'queue')
+    queue = TaskJournal.open_queue(path, group_records=1024, group_interval=0, sync=False)
+    journal = queue.journal
+    for index in range(1000):
+        queue.add_task(index % 7, index % 3 + 1, "Kurtarma görevi")
+    assert _groups(journal.journal_path) == 0
+    
+    journal.commit()
+    assert _groups(journal.journal_path) == 1
+    for index in range(2048):
+        queue.update_task_priority(index % 1000 + 1, 5)
+    assert _groups(journal.journal_path) == 3
+    journal.close()
+
+def test_timer_commit_takes_due_snapshot(tmp_path):
+    """Zamanlayıcıyla yazılan grup anlık görüntü sınırını aşarsa görüntü hemen alınır"""
+    path = str(tmp_path / 'queue')
+    queue = TaskJournal.open_queue(path, group_interval=0.01, snapshot_every=5, sync=False)
+    for index in range(5):
+        queue.add_task(index, 1, "Görev")
+    deadline = time.monotonic() + 5
+    while queue.journal.records and time.monotonic() < deadline:
+        time.sleep(0.01)
+    with queue.journal._lock:
+        assert queue.journal.records == 0
+        assert os.path.exists(queue.journal.snapshot_path)
+    queue.journal.close()
+
+def test_recovery_from_snapshot_and_torn_tail(tmp_path):
+    """Anlık görüntü ve sonrasındaki günlük geri yüklenir; yarım kalan son grup atılır"""
+    path = str(tmp_path / 'queue')
+    queue = TaskJournal.open_queue(path, group_records=8, group_interval=0, snapshot_every=20, sync=False)
+    for index in range(30):
+        queue.add_task(index, index % 4 + 1, f"Görev {index % 5}")
+    queue.update_task_status(3, TaskStatus.IN_PROGRESS)
+    queue.update_task_status(3, TaskStatus.COMPLETED)
+    queue.update_task_priority(7, 9)
+    queue.journal.commit()
+    assert os.path.exists(queue.journal.snapshot_path)
+    expected, expected_next = _state(queue), queue.get_next_task().id
+    
+    # Çökme: diske aktarılmamış kayıt kaybolur, son grup yarım yazılmıştır
+    queue.add_task(99, 1, "Kaybolan görev")
+    queue.journal._buffer.clear()
+    queue.journal._file.write(_GROUP.pack(64, 0) + b'\x01' * 10)
+    queue.journal._file.close()
+    queue.journal._file = None
+    journal_size = os.path.getsize(queue.journal.journal_path)
+    
+    recovered = TaskJournal.open_queue(path, group_interval=0, sync=False)
+    assert _state(recovered) == expected
+    assert os.path.getsize(recovered.journal.journal_path) == journal_size - _GROUP.size - 10
+    assert recovered.get_next_task().id == expected_next
+    
+    recovered.add_task(5, 2, "Yeni görev")
+    recovered.journal.close()
+    again = TaskJournal.open_queue(path, sync=False)
+    assert _state(again) == expected + [(5, 2, "Yeni görev", TaskStatus.PENDING, None)]
+    again.journal.close()
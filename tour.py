@@ -0,0 +1,293 @@
+import math
+import time
+from typing import Dict, Iterable, List, Optional
+
+from graph import Graph
+from tasks import Task
+
+class TourPlanner:
+    """
+    Çok hedefli tur planlayıcı.
+    
+    Dron her görevden sonra başlangıç düğümüne dönmek yerine hedefleri bir
+    tur halinde dolaşır. Hedefler (ve dronun konumu) arasındaki mesafeler
+    her hedef için tek bir en kısa yol ağacından okunup önbellekteki ikili
+    mesafe tablosuna yazılır. Ziyaret sırası önceliklere uyar: daha yüksek
+    öncelikli (küçük sayılı) görevler her zaman önce gelir, yalnızca aynı
+    öncelikteki görevlerin sırası optimize edilir.
+    
+    Sıra en yakın komşu sezgiseliyle kurulur, ardından süre sınırı içinde
+    2-opt (bölüm ters çevirme) ve Or-opt (1-3 görevlik bölüm taşıma) yerel
+    aramasıyla iyileştirilir. Yeni görev en ucuz uygun konuma eklenip tur
+    yeniden iyileştirilir; tur baştan kurulmaz.
+    """
+    def __init__(self, graph: Graph, start: int = 0, time_budget: float = 0.05):
+        """
+        Args:
+            graph (Graph): Yönsüz graf
+            start (int): Dronun bulunduğu düğüm
+            time_budget (float): Her (yeniden) optimizasyon için süre sınırı (saniye)
+        """
+        self.graph = graph
+        self.start = start
+        self.time_budget = time_budget
+        self.order: List[int] = []                          # Ziyaret sırasıyla görev ID'leri
+        self.tasks: Dict[int, Task] = {}
+        self._targets: Dict[int, int] = {}                  # Görev ID'si -> hedef düğüm
+        self._priorities: Dict[int, int] = {}               # Planlamadaki öncelikler
+        self._distances: Dict[int, Dict[int, float]] = {}   # Düğüm -> {düğüm: mesafe}
+        self._distances_version = graph.version              # Tablonun hesaplandığı graf sürümü
+        
+    def plan(self, tasks: Iterable[Task]) -> List[Task]:
+        """
+        Görevler için turu baştan kurar ve iyileştirir.
+        
+        Args:
+            tasks: Planlanacak (bekleyen) görevler
+            
+        Returns:
+            List[Task]: Ziyaret sırasıyla görevler
+        """
+        self.order = []
+        self.tasks, self._targets, self._priorities = {}, {}, {}
+        self._sync_distances()
+        for task in tasks:
+            self._register(task)
+            
+        # Her öncelik bloğunda en yakın komşu
+        position = self.start
+        remaining = sorted(self.tasks, key=lambda task_id: self._priorities[task_id])
+        while remaining:
+            level = self._priorities[remaining[0]]
+            block = [task_id for task_id in remaining if self._priorities[task_id] == level]
+            remaining = remaining[len(block):]
+            while block:
+                row = self._distances[position]
+                nearest = min(block, key=lambda task_id: row[self._targets[task_id]])
+                block.remove(nearest)
+                self.order.append(nearest)
+                position = self._targets[nearest]
+        self.improve()
+        return self.tasks_in_order()
+        
+    def add_task(self, task: Task) -> List[Task]:
+        """
+        Görevi turdaki en ucuz uygun konuma ekler ve turu yeniden iyileştirir.
+        
+        Args:
+            task (Task): Yeni görev
+            
+        Returns:
+            List[Task]: Ziyaret sırasıyla görevler
+        """
+        if task.id in self.tasks:
+            return self.tasks_in_order()
+        self._sync_distances()
+        self._register(task)
+        priority = self._priorities[task.id]
+        nodes = self._nodes()
+        target = self._targets[task.id]
+        row = self._distances[target]
+        
+        best, best_index, last_allowed = math.inf, None, None
+        for index in range(len(self.order) + 1):
+            # Öncelik sırası: öncekiler <= yeni görev <= sonrakiler
+            if index > 0 and self._priorities[self.order[index - 1]] > priority:
+                continue
+            if index < len(self.order) and self._priorities[self.order[index]] < priority:
+                continue
+            last_allowed = index
+            before = nodes[index]
+            after = nodes[index + 1] if index < len(self.order) else None
+            if not math.isfinite(row[before]):
+                continue  # Hedefe bu konumdan ulaşılamıyor
+            if after is None or not math.isfinite(row[after]):
+                # Sonraki hedef başka bileşende: ulaşılamayan bacak yalnızca yer değiştirir
+                added = row[before]
+            else:
+                added = row[before] + row[after] - self._distances[before][after]
+            if added < best:
+                best, best_index = added, index
+        if best_index is None:
+            # Hedefe hiçbir uygun konumdan ulaşılamıyor: öncelik bloğunun sonuna ekle
+            best_index = last_allowed
+        self.order.insert(best_index, task.id)
+        self.improve()
+        return self.tasks_in_order()
+        
+    def remove_task(self, task_id: int):
+        """
+        Görevi turdan çıkarır (ör. iptal edildiğinde).
+        
+        Args:
+            task_id (int): Görev ID'si
+        """
+        if task_id in self.tasks:
+            self.order.remove(task_id)
+            del self.tasks[task_id], self._targets[task_id], self._priorities[task_id]
+            
+    def visit(self, task_id: int):
+        """
+        Dronun görevin hedefine ulaştığını bildirir; tur oradan devam eder.
+        
+        Args:
+            task_id (int): Tamamlanan görevin ID'si
+        """
+        target = self._targets.get(task_id)
+        self.remove_task(task_id)
+        if target is not None:
+            self.start = target
+            
+    def next_task(self) -> Optional[Task]:
+        """
+        Turdaki sıradaki görevi döndürür.
+        
+        Returns:
+            Optional[Task]: Sıradaki görev veya None
+        """
+        return self.tasks[self.order[0]] if self.order else None
+        
+    def tasks_in_order(self) -> List[Task]:
+        """Ziyaret sırasıyla görevler"""
+        return [self.tasks[task_id] for task_id in self.order]
+        
+    def distance(self, from_node: int, to_node: int) -> float:
+        """
+        İki düğüm arasındaki en kısa mesafeyi önbellekten döndürür.
+        
+        Args:
+            from_node (int): Başlangıç düğümü
+            to_node (int): Bitiş düğümü
+            
+        Returns:
+            float: Mesafe (ulaşılamıyorsa sonsuz)
+        """
+        self._sync_distances()
+        self._add_node(from_node)
+        self._add_node(to_node)
+        return self._distances[from_node][to_node]
+        
+    def cost(self) -> float:
+        """
+        Dronun konumundan başlayan açık turun toplam uzunluğu.
+        
+        Returns:
+            float: Tur uzunluğu
+        """
+        self._sync_distances()
+        nodes = self._nodes()
+        return sum(self._distances[a][b] for a, b in zip(nodes, nodes[1:]))
+        
+    def improve(self) -> int:
+        """
+        Turu süre sınırı içinde 2-opt ve Or-opt hamleleriyle iyileştirir.
+        
+        Yalnızca aynı öncelikteki görevler yer değiştirir; iyileştirme
+        kalmadığında veya süre dolduğunda durur.
+        
+        Returns:
+            int: Uygulanan iyileştirme sayısı
+        """
+        self._sync_distances()
+        deadline = time.perf_counter() + self.time_budget
+        applied = 0
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            for move in (self._two_opt, self._or_opt):
+                while time.perf_counter() < deadline and move():
+                    applied += 1
+                    improved = True
+        return applied
+        
+    def _register(self, task: Task):
+        """Görevi ve hedefinin mesafe satırını kaydeder"""
+        self.tasks[task.id] = task
+        self._targets[task.id] = task.target_node
+        self._priorities[task.id] = task.priority
+        self._add_node(self.start)
+        self._add_node(task.target_node)
+        
+    def _sync_distances(self):
+        """Graf değiştiyse mesafe tablosunu bilinen düğümler için yeniden kurar"""
+        if self._distances_version == self.graph.version:
+            return
+        self._distances = {}
+        self._distances_version = self.graph.version
+        for node in self._nodes():
+            self._add_node(node)
+            
+    def _add_node(self, node: int):
+        """Düğümün diğer bilinen düğümlere mesafelerini tek bir en kısa yol ağacından hesaplar"""
+        if node in self._distances:
+            return
+        distances = self.graph.shortest_path_tree(node).distances
+        row = {node: 0.0}
+        for other, other_row in self._distances.items():
+            # Graf yönsüz olduğundan tablo simetriktir
+            row[other] = other_row[node] = distances[other]
+        self._distances[node] = row
+        
+    def _nodes(self) -> List[int]:
+        """Dronun konumu ve ziyaret sırasıyla hedef düğümleri"""
+        return [self.start] + [self._targets[task_id] for task_id in self.order]
+        
+    def _two_opt(self) -> bool:
+        """Bir bölümü ters çevirerek turu kısaltan ilk hamleyi uygular"""
+        order, priorities, d = self.order, self._priorities, self._distances
+        nodes = self._nodes()
+        size = len(order)
+        for i in range(size - 1):
+            a, first = nodes[i], nodes[i + 1]
+            row_a, row_first = d[a], d[first]
+            for j in range(i + 1, size):
+                if priorities[order[j]] != priorities[order[i]]:
+                    break
+                last = nodes[j + 1]
+                if j + 1 < size:
+                    b = nodes[j + 2]
+                    delta = row_a[last] + row_first[b] - row_a[first] - d[last][b]
+                else:
+                    # Açık tur: son bölümün sonrası yoktur
+                    delta = row_a[last] - row_a[first]
+                if delta < -1e-9:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    return True
+        return False
+        
+    def _or_opt(self) -> bool:
+        """1-3 görevlik bir bölümü (gerekirse ters) başka konuma taşıyan ilk iyileştirmeyi uygular"""
+        order, priorities, d = self.order, self._priorities, self._distances
+        nodes = self._nodes()
+        size = len(order)
+        for length in (1, 2, 3):
+            for i in range(size - length + 1):
+                j = i + length - 1
+                level = priorities[order[i]]
+                if priorities[order[j]] != level:
+                    continue
+                a, first, last = nodes[i], nodes[i + 1], nodes[j + 1]
+                b = nodes[j + 2] if j + 1 < size else None
+                removed = d[a][first] + (d[last][b] - d[a][b] if b is not None else 0.0)
+                for k in range(size + 1):
+                    # Bölüm, order[k - 1] ile order[k] arasına girer (k: bölüm dışında)
+                    if i <= k <= j + 1:
+                        continue
+                    if k > 0 and priorities[order[k - 1]] > level:
+                        continue
+                    if k < size and priorities[order[k]] < level:
+                        continue
+                    x = nodes[k]
+                    y = nodes[k + 1] if k < size else None
+                    base = d[x][y] if y is not None else 0.0
+                    for head, tail in ((first, last), (last, first)):
+                        added = d[x][head] + (d[tail][y] if y is not None else 0.0) - base
+                        if added - removed < -1e-9:
+                            segment = order[i:j + 1]
+                            if head == last:
+                                segment.reverse()
+                            rest = order[:i] + order[j + 1:]
+                            position = k if k < i else k - length
+                            self.order[:] = rest[:position] + segment + rest[position:]
+                            return True
+        return False